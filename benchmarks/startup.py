@@ -0,0 +1,166 @@
+# benchmarks/startup.py
+"""
+Cold start benchmark.
+
+Starts a fresh Python process (SDL dummy drivers, no window) that
+imports main.py exactly like `python main.py` does, builds GameApp
+(normal startup: AssetLoader + LoadingScene) and renders the first frame.
+
+Measured per run:
+- process_ms     : whole child process, interpreter start to exit
+- import_ms      : `import main` (everything it pulls in)
+- first_frame_ms : from before `import main` until the first frame is pushed
+- per-module import cost from `python -X importtime`
+
+The child runs in a temporary directory (project on PYTHONPATH, assets
+linked in), so the data files it writes (history database, font cache)
+never touch the real data/ directory. The directory is shared by all
+runs: every run after the first starts with a warm font cache.
+
+The reported numbers are the medians over all runs.
+
+Run:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --runs 10 --top 15 --output startup.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Runs in the child process; prints one JSON line
+_CHILD = """
+import json, time
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+app = main.GameApp()
+app.step(0.0)
+first_frame = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - start) * 1000.0,
+    "first_frame_ms": (first_frame - start) * 1000.0,
+}))
+app.loader.done.wait(5.0)
+"""
+
+# Top-level packages of this project (the rest is "python" / "pygame" / ...)
+PROJECT_PACKAGES = ("main", "core", "ui", "logic", "interfaces", "net", "tools")
+
+
+def parse_importtime(stderr: str) -> dict[str, dict[str, int]]:
+    """Module -> {"self_us", "cumulative_us"} from `-X importtime` output."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = {"self_us": int(self_us), "cumulative_us": int(cumulative_us)}
+    return modules
+
+
+def group_of(module: str) -> str:
+    top = module.split(".")[0]
+    if top in PROJECT_PACKAGES:
+        return "project"
+    if top in ("pygame", "numpy", "pkg_resources"):
+        return top
+    return "other"
+
+
+def run_once(workdir: Path) -> dict:
+    env = dict(
+        os.environ,
+        SDL_VIDEODRIVER="dummy",
+        SDL_AUDIODRIVER="dummy",
+        PYGAME_HIDE_SUPPORT_PROMPT="1",
+        PYTHONPATH=os.pathsep.join(filter(None, (str(ROOT), os.environ.get("PYTHONPATH")))),
+    )
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD],
+        cwd=workdir,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    process_ms = (time.perf_counter() - start) * 1000.0
+
+    run = json.loads(result.stdout.strip().splitlines()[-1])
+    run["process_ms"] = process_ms
+    run["modules"] = parse_importtime(result.stderr)
+    return run
+
+
+def run(runs: int = 5) -> dict:
+    """Median startup timings and per-module import costs over `runs` processes."""
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        if (ROOT / "assets").is_dir():
+            try:
+                (workdir / "assets").symlink_to(ROOT / "assets", target_is_directory=True)
+            except OSError:
+                pass  # no symlinks (e.g. Windows without the privilege): runs without assets
+        samples = [run_once(workdir) for _ in range(runs)]
+
+    modules = {}
+    for name in samples[0]["modules"]:
+        values = [s["modules"][name] for s in samples if name in s["modules"]]
+        modules[name] = {
+            "self_ms": statistics.median(v["self_us"] for v in values) / 1000.0,
+            "cumulative_ms": statistics.median(v["cumulative_us"] for v in values) / 1000.0,
+        }
+
+    groups: dict[str, float] = {}
+    for name, cost in modules.items():
+        group = group_of(name)
+        groups[group] = groups.get(group, 0.0) + cost["self_ms"]
+
+    return {
+        "runs": runs,
+        "process_ms": statistics.median(s["process_ms"] for s in samples),
+        "import_ms": statistics.median(s["import_ms"] for s in samples),
+        "first_frame_ms": statistics.median(s["first_frame_ms"] for s in samples),
+        "import_self_ms_by_group": groups,
+        "modules": modules,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cold start benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="fresh processes to start")
+    parser.add_argument("--top", type=int, default=10, help="show the N most expensive modules")
+    parser.add_argument("--output", help="write the full result to this JSON file")
+    args = parser.parse_args()
+
+    result = run(args.runs)
+    if args.output:
+        Path(args.output).write_text(json.dumps(result, indent=2), encoding="utf-8")
+
+    print(
+        f"process {result['process_ms']:.0f} ms, import main {result['import_ms']:.0f} ms, "
+        f"first frame {result['first_frame_ms']:.0f} ms  (median of {result['runs']})"
+    )
+    print("import self time: " + ", ".join(
+        f"{group} {ms:.1f} ms" for group, ms in sorted(result["import_self_ms_by_group"].items())
+    ))
+
+    print(f"{'module':<40} {'self':>9} {'cumulative':>11}")
+    ranked = sorted(result["modules"].items(), key=lambda item: item[1]["self_ms"], reverse=True)
+    for name, cost in ranked[: args.top]:
+        print(f"{name:<40} {cost['self_ms']:>7.2f}ms {cost['cumulative_ms']:>9.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
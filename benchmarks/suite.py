@@ -0,0 +1,496 @@
+# benchmarks/suite.py
+"""
+Offline benchmark suite for the hot paths of the game.
+
+Runs without a window (SDL dummy drivers) and never touches the real
+data files (all stores are redirected into a temporary directory).
+
+Covered:
+- question generation (logic/questions.py, question bank, seen questions)
+- next_time_limit schedules (logic/difficulty.py)
+- answering a question: GameState alone, and a server message
+  (logic/game_state.py, net/server.py; no sockets)
+- scene construction / reuse (menu, game, end)
+- per-frame cost of each scene (full redraw, idle frame, partial frames)
+  and of Button / InputBox
+- presenting a HUD-sized change with the texture renderer
+  (core/renderers.py; SDL software renderer, window = canvas size)
+- storage round-trips (high score, seen questions, answer archive, history)
+
+Every case reports microseconds per call (best of REPEAT runs) and the
+same time relative to a fixed pure-Python calibration workload timed
+alternately with it ("score"). A busy / throttled CPU inflates the raw
+time but hardly the score. A case is compared by its score ratio to
+the baseline; the raw time ratio is printed next to it.
+
+Results are written as JSON and compared with the committed baseline
+(benchmarks/baseline.json): a case whose score ratio is above
+1 + tolerance is a regression and the run exits with status 1.
+
+Record the baseline again (--update-baseline) after intended changes,
+or when the check moves to a very different machine.
+
+Run:
+    python -m benchmarks.suite
+    python -m benchmarks.suite --output results.json --tolerance 0.5
+    python -m benchmarks.suite --filter draw
+    python -m benchmarks.suite --update-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+# Must be set BEFORE pygame is initialised
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from core.constants import HEIGHT, START_TIME_LIMIT, MIN_TIME_LIMIT, WIDTH
+from core.scene_manager import SceneManager
+from core.scheduler import Scheduler
+from logic import answer_archive, history, question_bank, questions, seen_questions, storage
+from logic.difficulty import next_time_limit
+from logic.game_state import GameState
+from ui.fonts import get_font
+from ui.widgets import Button, InputBox
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+
+# Default allowed slowdown before a case counts as a regression (0.5 = +50%).
+# Repeated runs on an idle machine stay within about +35%.
+TOLERANCE: float = 0.5
+
+# Timing: every repeat runs for at least MIN_TIME seconds, best repeat counts
+MIN_TIME: float = 0.02
+REPEAT: int = 15
+
+# name -> factory returning the callable to time
+BENCHMARKS: dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def benchmark(name: str):
+    """Register a benchmark factory (called once, returns the timed callable)."""
+
+    def register(factory):
+        BENCHMARKS[name] = factory
+        return factory
+
+    return register
+
+
+def _loops_for(fn: Callable[[], object], min_time: float) -> int:
+    """Number of calls that take at least `min_time` seconds."""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return loops
+        loops *= 2 if elapsed < min_time / 4 else 1 + int(min_time / max(elapsed, 1e-9))
+
+
+def _best(fn: Callable[[], object], loops: int) -> float:
+    start = time.perf_counter()
+    for _ in range(loops):
+        fn()
+    return (time.perf_counter() - start) / loops
+
+
+def _calibration_workload() -> None:
+    table = {}
+    for i in range(200):
+        table[i % 17] = table.get(i % 17, 0) + i * i
+
+
+def measure(fn: Callable[[], object], min_time: float = MIN_TIME, repeat: int = REPEAT) -> dict:
+    """
+    Microseconds per call (best of `repeat` runs of at least `min_time` s).
+
+    Every run is paired with a run of a fixed pure-Python calibration
+    workload right before it; "score" = best time / best calibration time.
+    """
+    loops = _loops_for(fn, min_time)
+    calibration_loops = _loops_for(_calibration_workload, min_time / 2)
+
+    runs, calibration = [], []
+    for _ in range(repeat):
+        calibration.append(_best(_calibration_workload, calibration_loops))
+        runs.append(_best(fn, loops))
+
+    return {"us": min(runs) * 1e6, "score": min(runs) / min(calibration), "loops": loops}
+
+
+# --------------------------------------------------
+# Questions / difficulty
+# --------------------------------------------------
+@benchmark("questions.add")
+def _add_question():
+    return questions.AddQuestion
+
+
+@benchmark("questions.mul")
+def _mul_question():
+    return questions.MulQuestion
+
+
+@benchmark("questions.mixed")
+def _mixed_question():
+    return questions.MixedQuestion
+
+
+@benchmark("questions.bank_next")
+def _bank_next():
+    bank = question_bank.QuestionBank(seed=1)
+    return bank.next_question
+
+
+@benchmark("questions.seen_next")
+def _seen_next():
+    return seen_questions.default_index.next_question
+
+
+@benchmark("difficulty.schedule")
+def _schedule():
+    def schedule():
+        limit = START_TIME_LIMIT
+        while limit > MIN_TIME_LIMIT:
+            limit = next_time_limit(limit)
+
+    return schedule
+
+
+# --------------------------------------------------
+# Game rules / server
+# --------------------------------------------------
+@benchmark("state.answer")
+def _state_answer():
+    state = GameState(question_bank.QuestionBank(seed=1).next_question)
+    state.start(0.0)
+
+    def answer():
+        state.submit(state.question.answer, state.question.answer_digits, state.shown_at + 1.0)
+
+    return answer
+
+
+class _NullTransport:
+    """Transport that drops what the server writes."""
+
+    def write(self, data: bytes) -> None:
+        pass
+
+    def is_closing(self) -> bool:
+        return False
+
+    def get_write_buffer_size(self) -> int:
+        return 0
+
+
+@benchmark("net.handle_answer")
+def _net_answer():
+    import asyncio
+
+    from net.server import GameServer, Session
+
+    server = GameServer(seed=1)
+    server.scheduler = Scheduler()
+    server._loop = asyncio.new_event_loop()
+    session = Session(server)
+    session.connection_made(_NullTransport())
+    server.handle(session, b'{"type":"start"}')
+
+    def answer():
+        server.handle(session, b'{"type":"submit","text":"%d"}' % session.state.question.answer)
+
+    return answer
+
+
+# --------------------------------------------------
+# Scenes
+# --------------------------------------------------
+def _build(name: str, **params):
+    from core.registry import scene_class
+
+    return scene_class(name)(SceneManager(), **params)
+
+
+@benchmark("scene.menu.build")
+def _menu_build():
+    return lambda: _build("menu")
+
+
+@benchmark("scene.game.build")
+def _game_build():
+    return lambda: _build("game")
+
+
+@benchmark("scene.end.build")
+def _end_build():
+    return lambda: _build("end", score=7)
+
+
+@benchmark("scene.game.reset")
+def _game_reset():
+    return _build("game").reset
+
+
+@benchmark("scene.end.reset")
+def _end_reset():
+    scene = _build("end", score=7)
+    return lambda: scene.reset(score=7)
+
+
+def _full_frame(scene):
+    screen = pygame.display.get_surface()
+
+    def frame():
+        scene.mark_dirty()
+        scene.render(screen)
+
+    return frame
+
+
+@benchmark("draw.menu.full")
+def _menu_full():
+    return _full_frame(_build("menu"))
+
+
+@benchmark("draw.game.full")
+def _game_full():
+    return _full_frame(_build("game"))
+
+
+@benchmark("draw.end.full")
+def _end_full():
+    return _full_frame(_build("end", score=7))
+
+
+@benchmark("draw.game.idle")
+def _game_idle():
+    scene = _build("game")
+    screen = pygame.display.get_surface()
+    scene.render(screen)
+    return lambda: scene.render(screen)
+
+
+@benchmark("draw.game.hud")
+def _game_hud():
+    scene = _build("game")
+    screen = pygame.display.get_surface()
+    scene.render(screen)
+
+    def frame():
+        scene.mark_dirty(scene.hud_rect)
+        scene.render(screen)
+
+    return frame
+
+
+@benchmark("draw.game.flash")
+def _game_flash():
+    scene = _build("game")
+    screen = pygame.display.get_surface()
+    scene.render(screen)
+
+    def frame():
+        scene.player_sprite.toggle_flash()
+        scene.render(screen)
+
+    return frame
+
+
+@benchmark("draw.button")
+def _button():
+    screen = pygame.display.get_surface()
+    button = Button(pygame.Rect(WIDTH // 2 - 120, HEIGHT // 2, 240, 50), "START GAME", get_font(36))
+    return lambda: button.draw(screen)
+
+
+@benchmark("draw.input_box")
+def _input_box():
+    screen = pygame.display.get_surface()
+    box = InputBox(pygame.Rect(WIDTH // 2 - 80, HEIGHT // 2 + 40, 160, 40), get_font(28))
+    box.text, box.value = "144", 144
+    return lambda: box.draw(screen)
+
+
+@benchmark("present.texture.hud")
+def _texture_present():
+    from core.renderers import TextureRenderer
+
+    renderer = TextureRenderer((WIDTH, HEIGHT), "benchmark")
+    rects = [pygame.Rect(0, 0, WIDTH, 50)]
+    return lambda: renderer.present(rects)
+
+
+# --------------------------------------------------
+# Storage (temporary files)
+# --------------------------------------------------
+@benchmark("storage.highscore_roundtrip")
+def _highscore():
+    # Next to the (temporary) high score file of the store
+    path = storage.highscore_store.path.with_name("bench-highscore.json")
+
+    def roundtrip():
+        storage.save_highscore(42, path)
+        storage.load_highscore(path)
+
+    return roundtrip
+
+
+@benchmark("storage.seen_roundtrip")
+def _seen():
+    index = seen_questions.default_index
+    index.next_question()
+
+    def roundtrip():
+        index.save()
+        index.flush()
+        index.sets = None
+        index.next_question()  # loads the file again
+
+    return roundtrip
+
+
+@benchmark("storage.answer_archive_flush")
+def _archive():
+    archive = answer_archive.answer_archive
+
+    def roundtrip():
+        for i in range(20):
+            archive.append(questions.OP_ADD, i, i, 2 * i, True, 1.0, START_TIME_LIMIT)
+        archive.flush(wait=True)
+
+    return roundtrip
+
+
+@benchmark("storage.history_record")
+def _history():
+    store = history.history_store
+
+    def roundtrip():
+        store.record(5, 6, START_TIME_LIMIT, 3.0, time.time())
+        store.flush()
+        store.rank(5)
+
+    return roundtrip
+
+
+# --------------------------------------------------
+# Running / comparing
+# --------------------------------------------------
+def run(pattern: str | None = None) -> dict:
+    """Run all benchmarks (or those whose name contains `pattern`)."""
+    tmpdir = tempfile.TemporaryDirectory()
+    tmp = Path(tmpdir.name)
+    stores = (
+        (storage.highscore_store, "highscore.json"),
+        (seen_questions.default_index, "seen_questions.bin"),
+        (history.history_store, "history.db"),
+        (answer_archive.answer_archive, "answers.bin"),
+    )
+    real_paths = [store.path for store, _ in stores]
+    for store, filename in stores:
+        store.open(tmp / filename)
+
+    questions.seed(0)
+    pygame.display.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+
+    results = {}
+    try:
+        for name, factory in BENCHMARKS.items():
+            if pattern and pattern not in name:
+                continue
+            results[name] = measure(factory())
+    finally:
+        pygame.quit()
+        for (store, _), path in zip(stores, real_paths):
+            store.open(path)
+        tmpdir.cleanup()
+
+    return {
+        "machine": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list[dict]:
+    """One row per case: current vs baseline, and whether it regressed."""
+    rows = []
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        ratio = result["score"] / base["score"] if base else None
+        rows.append(
+            {
+                "name": name,
+                "us": result["us"],
+                "baseline_us": base["us"] if base else None,
+                "ratio": ratio,
+                "raw_ratio": result["us"] / base["us"] if base else None,
+                "regression": ratio is not None and ratio > 1.0 + tolerance,
+            }
+        )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark suite with regression baseline")
+    parser.add_argument("--filter", help="only run benchmarks whose name contains this")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="baseline JSON file")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="allowed slowdown (0.5 = +50%%)")
+    parser.add_argument("--update-baseline", action="store_true", help="store these results as the new baseline")
+    args = parser.parse_args()
+
+    current = run(args.filter)
+    if args.output:
+        Path(args.output).write_text(json.dumps(current, indent=2), encoding="utf-8")
+
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8")) if baseline_path.exists() else {}
+
+    rows = compare(current, baseline, args.tolerance)
+    print(f"{'benchmark':<32} {'us/call':>11} {'baseline':>11} {'raw':>7} {'ratio':>7}")
+    for row in rows:
+        base = f"{row['baseline_us']:>11.2f}" if row["baseline_us"] is not None else f"{'-':>11}"
+        raw = f"{row['raw_ratio']:>6.2f}x" if row["raw_ratio"] is not None else f"{'-':>7}"
+        ratio = f"{row['ratio']:>6.2f}x" if row["ratio"] is not None else f"{'new':>7}"
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(f"{row['name']:<32} {row['us']:>11.2f} {base} {raw} {ratio}{flag}")
+
+    if args.update_baseline:
+        # Keep cases that were not run this time (--filter)
+        merged = {**baseline.get("results", {}), **current["results"]}
+        baseline_path.write_text(
+            json.dumps({**current, "results": merged}, indent=2) + "\n",
+            encoding="utf-8",
+        )
+        print(f"baseline written to {baseline_path}")
+        return
+
+    regressions = [row["name"] for row in rows if row["regression"]]
+    if regressions:
+        print(f"{len(regressions)} regression(s) above +{args.tolerance:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+    print(f"no regressions (tolerance +{args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
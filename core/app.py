@@ -10,15 +10,84 @@ Responsible for:
 
 This file is intentionally SIMPLE.
 No game logic is here – only flow control.
+
+Startup is staged:
+1) window + LoadingScene on screen immediately
+2) audio/fonts load on a worker thread (core/assets.py)
+3) MenuScene once loading is done
+Time-to-first-frame and time-to-interactive are kept in startup_metrics.
+
+Event filtering:
+each scene declares the event types it handles (BaseScene.event_handlers).
+Everything else is blocked at the SDL queue (pygame.event.set_allowed),
+so e.g. mouse motion never wakes the loop or costs a Python call.
+
+Timers:
+scenes schedule their own timers on core/scheduler.py; the app runs
+the due ones at the start of every frame and pauses the scheduler
+while the window is not focused.
+
+Low-latency mode:
+GameApp(low_latency=True) runs run_low_latency() instead of the standard
+loop. It waits ON the event queue until the next frame deadline (no
+sleep in clock.tick where input is not seen), paces frames on a fixed
+perf_counter grid, and runs a frame as soon as input arrives. The
+input-to-display latency of every key press is recorded either way
+(profiler.input, math_game_input_latency_seconds).
+
+Renderers:
+scenes draw into self.screen (the canvas, WIDTH x HEIGHT); a renderer
+(core/renderers.py) brings the changed rectangles to the window:
+"software" (default, fixed window size) or "texture" (scaled by the
+SDL renderer to any window size).
+
+Headless mode:
+GameApp(headless=True) uses the SDL "dummy" video/audio drivers and
+plays no music. The caller drives the app frame by frame with step()
+and gives the scheduler a simulated clock (see core/simulation.py).
 """
 
+import os
 import sys
+import time
 import pygame
 
-from core.constants import WIDTH, HEIGHT, FPS
-from core.events import TICK_EVENT, FLASH_EVENT
+from core.constants import (
+    WIDTH,
+    HEIGHT,
+    FPS,
+    UNFOCUSED_FPS,
+)
+from core.assets import AssetLoader
+from core.profiler import FrameProfiler
+from core.renderers import create_renderer
 from core.scene_manager import SceneManager
-from ui.menu_scene import MenuScene
+from core.scheduler import scheduler
+from core.telemetry import FRAME_BUCKETS, INPUT_BUCKETS, telemetry
+from ui.text_cache import text_cache
+
+# Stores with a background writer: (module, shared instance, flush args).
+# They are imported lazily by the scenes; only those in use are flushed.
+BACKGROUND_STORES = (
+    ("logic.storage", "highscore_store", {}),
+    ("logic.history", "history_store", {}),
+    ("logic.seen_questions", "default_index", {}),
+    ("logic.answer_archive", "answer_archive", {"wait": True}),
+)
+
+
+# Events the app itself needs, whatever the scene
+APP_EVENTS = (
+    pygame.QUIT,
+    pygame.KEYDOWN,  # F3 overlay
+    pygame.TEXTINPUT,  # fills KEYDOWN.unicode
+    pygame.WINDOWFOCUSLOST,
+    pygame.WINDOWFOCUSGAINED,
+    pygame.WINDOWMINIMIZED,
+    pygame.WINDOWRESTORED,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWSIZECHANGED,  # texture renderer: scaled window resized
+)
 
 
 class GameApp:
@@ -34,20 +103,35 @@ class GameApp:
     It only forwards events/update/draw to the active Scene.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        headless: bool = False,
+        profile_path: str | None = None,
+        metrics_path: str | None = None,
+        low_latency: bool = False,
+        renderer: str = "software",
+        window_size: tuple[int, int] | None = None,
+        fullscreen: bool = False,
+    ) -> None:
         """Initialize pygame, window, clock and scene manager."""
-        pygame.init()
+        self.start_time = time.perf_counter()
+        self.headless = headless
+        self.low_latency = low_latency
+
+        if self.headless:
+            # Must be set BEFORE pygame.init()
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
 
-        # ---------- MUSIC (background) ----------
-        pygame.mixer.init()
-        pygame.mixer.music.load("assets/music/background.mp3")
-        pygame.mixer.music.set_volume(0.3)  # 0.0 - 1.0
-        pygame.mixer.music.play(-1)         # -1 = loop forever
-        # ---------------------------------------
+        # Only what the first frame needs. Fonts are initialised on
+        # first use, audio by the AssetLoader thread (core/registry.require)
+        pygame.display.init()
 
-        # Create window
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
-        pygame.display.set_caption("Math Escape Game")
+        # Create window; scenes draw into the canvas of the renderer
+        self.renderer = create_renderer(
+            renderer, (WIDTH, HEIGHT), "Math Escape Game", window_size=window_size, fullscreen=fullscreen
+        )
+        self.screen = self.renderer.canvas
 
         # Clock controls FPS and delta-time
         self.clock = pygame.time.Clock()
@@ -55,14 +139,47 @@ class GameApp:
         # Scene manager controls which screen is active
         self.scene_manager = SceneManager()
 
-        # Start with MenuScene
-        self.scene_manager.set_scene(MenuScene(self.scene_manager))
+        # Start with LoadingScene (MenuScene follows when assets are ready).
+        # Headless runs have no assets to wait for.
+        self.startup_metrics: dict[str, float] = {}
+        self.loader: AssetLoader | None = None
+        if self.headless:
+            self.scene_manager.switch("menu")
+        else:
+            self.loader = AssetLoader()
+            self.loader.start()
+            self.scene_manager.switch("loading", loader=self.loader)
+
+        # Scene timers are paused while the window is not focused
+        self.focused = True
+        self._sync_timers()
+
+        # Only the active scene's event types get into the queue
+        self.filtered_scene = None
+        self._sync_event_filter()
+
+        # Optional input recorder (see core/simulation.EventRecorder)
+        self.recorder = None
+        self.frame = 0
+
+        # Per-phase frame timings (overlay toggled with F3)
+        self.profiler = FrameProfiler()
+        self.profile_path = profile_path
+
+        # Frame budget the loop paces the next frame with
+        # (None = the frame follows a wait for the next event)
+        self._frame_budget: float | None = 1.0 / FPS
 
-        # Start repeating custom events:
-        # - tick every 100ms (game timer)
-        # - flash every 700ms (visual effect / sprite blink)
-        pygame.time.set_timer(TICK_EVENT, 100)
-        pygame.time.set_timer(FLASH_EVENT, 700)
+        # Frame time histograms per scene (telemetry), written on exit
+        self.frame_histograms = {}
+        self.metrics_path = metrics_path
+
+        # Key press -> display latency. _queue_checked: last time the
+        # event queue was seen empty (a key arrived after that)
+        self.input_histogram = telemetry.histogram(
+            "math_game_input_latency_seconds", "Key press to display (upper bound)", INPUT_BUCKETS
+        )
+        self._queue_checked = time.perf_counter()
 
         self.running = True
 
@@ -74,29 +191,282 @@ class GameApp:
         1) handle events
         2) update logic
         3) draw
+
+        Drawing uses dirty rectangles: the scene redraws only the
+        regions it marked as changed, and only those regions are
+        pushed to the display. When nothing changed, nothing is drawn.
+
+        Frame rate is adaptive:
+        - idle scene (menu / end)  -> sleep until the next event
+                                      (or the next scheduled timer)
+        - window not focused       -> UNFOCUSED_FPS instead of FPS
         """
+        if self.low_latency:
+            self.run_low_latency()
+            return
+
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0  # delta time in seconds
+            events = None
+            blocked = self._can_block()
+            if blocked:
+                # Sleeps (0% CPU) until something happens
+                timeout = scheduler.next_deadline()
+                if timeout is None:
+                    first = pygame.event.wait()
+                else:
+                    first = pygame.event.wait(max(int(timeout * 1000), 1))
+                self._queue_checked = time.perf_counter()
+                events = [first] if first.type != pygame.NOEVENT else []
+                events += pygame.event.get()
 
-            # ---- Event handling ----
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.quit()
+            fps = FPS if self.focused else UNFOCUSED_FPS
+            dt = self.clock.tick(fps) / 1000.0  # delta time in seconds
+            self._frame_budget = None if blocked else 1.0 / fps
+            self.step(dt, events)
+            self._sync_timers()
 
-                # Forward event to current scene
-                self.scene_manager.current_scene.handle_event(event)
+        self.quit()
 
-            # ---- Update ----
-            self.scene_manager.current_scene.update(dt)
+    def run_low_latency(self) -> None:
+        """
+        Main loop tuned for input latency (same frame order as run()).
+
+        - waits on the event queue until the next frame is due, so a
+          key press wakes the loop at once and is drawn in that frame
+          (the frame grid itself is not moved)
+        - frames are due on a fixed grid of 1/FPS seconds
+          (perf_counter), not "1/FPS after the previous frame ended"
+        - idle scenes still sleep until the next event or timer
+        """
+        next_frame = time.perf_counter()
+        last_step = next_frame
+        while self.running:
+            fps = FPS if self.focused else UNFOCUSED_FPS
+            if self._can_block():
+                timeout = scheduler.next_deadline()
+                deadline = None if timeout is None else time.perf_counter() + timeout
+                events = self._wait_for_input(deadline)
+                next_frame = time.perf_counter()
+                self._frame_budget = None
+            else:
+                events = self._wait_for_input(next_frame)
+                self._frame_budget = 1.0 / fps
+
+            now = time.perf_counter()
+            if now >= next_frame:
+                # Paced frame: next slot on the grid. Far behind -> restart
+                # the grid instead of running frames back to back.
+                next_frame += 1.0 / fps
+                if next_frame < now:
+                    next_frame = now + 1.0 / fps
+
+            dt = now - last_step
+            last_step = now
+            self.step(dt, events)
+            self._sync_timers()
+
+        self.quit()
+
+    def _wait_for_input(self, deadline: float | None) -> list[pygame.event.Event]:
+        """
+        Wait until an event arrives or perf_counter() reaches `deadline`
+        (None = no deadline). Returns the events (empty on timeout).
+
+        pygame.event.wait() takes whole milliseconds: it is used for
+        all but the last one, the rest is slept (no busy waiting).
+        """
+        while True:
+            if deadline is None:
+                first = pygame.event.wait()
+            else:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                if remaining < 0.001:
+                    time.sleep(remaining)
+                    break
+                first = pygame.event.wait(int(remaining * 1000))
+            if first.type != pygame.NOEVENT:
+                self._queue_checked = time.perf_counter()
+                return [first] + pygame.event.get()
 
-            # ---- Draw ----
-            self.screen.fill((20, 20, 30))  # clear screen
-            self.scene_manager.current_scene.draw(self.screen)
-            pygame.display.flip()
+        self._queue_checked = time.perf_counter()
+        return []
+
+    def _can_block(self) -> bool:
+        """True if nothing can change on screen until the next event."""
+        return (
+            not self.headless
+            and self.scene_manager.current_scene.is_idle()
+            and not self.profiler.visible
+        )
+
+    def _sync_timers(self) -> None:
+        """Pause the scheduler (game countdown included) while unfocused."""
+        if self.focused:
+            scheduler.resume()
+        else:
+            scheduler.pause()
+
+    def _sync_event_filter(self) -> None:
+        """Allow only the event types of the current scene (after a scene change)."""
+        scene = self.scene_manager.current_scene
+        if scene is self.filtered_scene:
+            return
+
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(APP_EVENTS) + scene.allowed_events)
+        self.filtered_scene = scene
+
+    def step(self, dt: float, events: list[pygame.event.Event] | None = None) -> None:
+        """
+        Run exactly one frame (events, update, draw).
+
+        events: already fetched events (default: pump the queue).
+        """
+        scene_name = type(self.scene_manager.current_scene).__name__
+        t_start = time.perf_counter()
+
+        # ---- Timers + event handling ----
+        # Due timers run first; events they post are handled this frame
+        scheduler.run_due()
+        queue_checked = self._queue_checked
+        t_received = time.perf_counter()
+        if events is None:
+            events = pygame.event.get()
+        else:
+            events = events + pygame.event.get()
+        self._queue_checked = t_received
+
+        keys = 0
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.running = False
+                return
+
+            # Window focus: throttle and pause the game timers
+            if event.type in (pygame.WINDOWFOCUSLOST, pygame.WINDOWMINIMIZED):
+                self.focused = False
+            elif event.type in (pygame.WINDOWFOCUSGAINED, pygame.WINDOWRESTORED):
+                self.focused = True
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWSIZECHANGED):
+                # Window content was lost (e.g. uncovered): draw everything
+                self.scene_manager.current_scene.mark_dirty()
+                continue
+
+            if self.recorder is not None:
+                self.recorder.record(self.frame, event)
+
+            if event.type == pygame.KEYDOWN:
+                keys += 1
+
+            # F3 toggles the performance overlay
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profiler.toggle_overlay()
+                self.scene_manager.current_scene.mark_dirty(self.profiler.overlay_rect)
+                continue
+
+            # Forward event to current scene
+            self.scene_manager.current_scene.handle_event(event)
+        t_events = time.perf_counter()
+
+        # ---- Update ----
+        self.scene_manager.current_scene.update(dt)
+        t_update = time.perf_counter()
+
+        # ---- Draw (dirty regions only) ----
+        dirty_rects = self.scene_manager.current_scene.render(self.screen)
+        if self.profiler.visible and self.profiler.draw_overlay(self.screen, scene_name, dirty_rects):
+            dirty_rects.append(self.profiler.overlay_rect)
+        t_draw = time.perf_counter()
+
+        if dirty_rects:
+            self.renderer.present(dirty_rects)
+        t_flip = time.perf_counter()
+
+        if keys:
+            self._record_input(keys, queue_checked, t_received, t_flip, bool(dirty_rects))
+
+        if "interactive_ms" not in self.startup_metrics and dirty_rects:
+            self._record_startup(t_flip)
+
+        self.profiler.record(
+            scene_name,
+            (t_events - t_start, t_update - t_events, t_draw - t_update, t_flip - t_draw),
+            t_start,
+            budget_ms=None if self._frame_budget is None else self._frame_budget * 1000.0,
+            paced=self._frame_budget is not None,
+        )
+
+        histogram = self.frame_histograms.get(scene_name)
+        if histogram is None:
+            histogram = self.frame_histograms[scene_name] = telemetry.histogram(
+                "math_game_frame_seconds", "Frame time (events to flip)", FRAME_BUCKETS, scene=scene_name
+            )
+        histogram.observe(t_flip - t_start)
+        self.frame += 1
+
+        # The scene may have changed during this frame
+        self._sync_event_filter()
+
+    def _record_input(self, keys: int, checked: float, received: float, flipped: float, shown: bool) -> None:
+        """Input-to-display latency of the key presses handled this frame."""
+        if not shown:
+            self.profiler.input.hidden += keys
+            return
+        self.profiler.input.record(checked, received, flipped, keys)
+        for _ in range(keys):
+            self.input_histogram.observe(flipped - checked)
+
+    def _record_startup(self, now: float) -> None:
+        """Store time-to-first-frame / time-to-interactive (ms since __init__)."""
+        elapsed_ms = (now - self.start_time) * 1000.0
+        self.startup_metrics.setdefault("first_frame_ms", elapsed_ms)
+
+        if self.scene_manager.current_name == "loading":
+            return
+
+        self.startup_metrics["interactive_ms"] = elapsed_ms
+        if self.loader is not None:
+            for step, seconds in self.loader.timings.items():
+                self.startup_metrics[f"load_{step}_ms"] = seconds * 1000.0
+            for step, message in self.loader.errors:
+                print(f"warning: {step} not loaded: {message}")
+
+        if not self.headless:
+            print(
+                f"startup: first frame {self.startup_metrics['first_frame_ms']:.0f} ms, "
+                f"interactive {elapsed_ms:.0f} ms"
+            )
 
     def quit(self) -> None:
         """Exit the application cleanly."""
-        pygame.mixer.music.stop()
+        if pygame.mixer.get_init():
+            pygame.mixer.music.stop()
+        if self.recorder is not None:
+            self.recorder.save()
+        for module_name, store_name, flush_args in BACKGROUND_STORES:
+            module = sys.modules.get(module_name)
+            if module is not None:
+                getattr(module, store_name).flush(**flush_args)
+        if self.metrics_path:
+            try:
+                telemetry.write_file(self.metrics_path)
+            except OSError as error:
+                print(f"warning: metrics not written: {error}")
+        telemetry.close()
+        if self.profile_path:
+            from logic.storage import highscore_store
+
+            self.profiler.export(
+                self.profile_path,
+                {
+                    "text_cache": text_cache.stats(),
+                    "startup": self.startup_metrics,
+                    "storage": highscore_store.stats(),
+                    "transitions": self.scene_manager.stats(),
+                },
+            )
         self.running = False
         pygame.quit()
         sys.exit()
@@ -0,0 +1,83 @@
+# core/assets.py
+"""
+Background asset loading.
+
+Loading audio (mixer init + decoding the music file) is slow, so
+GameApp does it on a worker thread while the LoadingScene is already
+on screen. The session history's rank index (SQLite) is built there
+too.
+
+Missing or broken assets are NOT fatal: the step is recorded in
+`errors` and the game simply runs without it (e.g. without music).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pygame
+
+from core.registry import require
+
+MUSIC_PATH = "assets/music/background.mp3"
+MUSIC_VOLUME: float = 0.3  # 0.0 - 1.0
+
+
+class AssetLoader(threading.Thread):
+    """
+    Runs the loading steps one by one on a daemon thread.
+
+    Read from the main thread:
+    - progress : 0.0 - 1.0
+    - status   : name of the current step
+    - done     : threading.Event, set when all steps finished
+    - errors   : list of (step, message) for steps that failed
+    - timings  : step -> seconds
+    """
+
+    def __init__(self) -> None:
+        super().__init__(name="asset-loader", daemon=True)
+        self.steps = [
+            ("audio", self._init_audio),
+            ("music", self._load_music),
+            ("history", self._load_history),
+        ]
+        self.progress: float = 0.0
+        self.status: str = ""
+        self.done = threading.Event()
+        self.errors: list[tuple[str, str]] = []
+        self.timings: dict[str, float] = {}
+
+    def run(self) -> None:
+        for index, (name, step) in enumerate(self.steps):
+            self.status = name
+            start = time.perf_counter()
+            try:
+                step()
+            except (pygame.error, OSError) as error:
+                # Never crash the game because of an asset
+                self.errors.append((name, str(error)))
+            self.timings[name] = time.perf_counter() - start
+            self.progress = (index + 1) / len(self.steps)
+
+        self.status = "done"
+        self.done.set()
+
+    @staticmethod
+    def _init_audio() -> None:
+        require("mixer")
+
+    @staticmethod
+    def _load_music() -> None:
+        if not pygame.mixer.get_init():
+            raise pygame.error("audio is not available")
+        pygame.mixer.music.load(MUSIC_PATH)
+        pygame.mixer.music.set_volume(MUSIC_VOLUME)
+        pygame.mixer.music.play(-1)  # -1 = loop forever
+
+    @staticmethod
+    def _load_history() -> None:
+        from logic.history import history_store
+
+        history_store.load_index()
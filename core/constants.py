@@ -12,6 +12,11 @@ Keeping constants here:
 WIDTH: int = 900
 HEIGHT: int = 500
 FPS: int = 60
+UNFOCUSED_FPS: int = 5         # frame cap while the window is in background
+
+# ---------------- Timers (ms) ----------------
+TICK_INTERVAL_MS: int = 100    # HUD timer refresh (TICK_EVENT)
+FLASH_INTERVAL_MS: int = 700   # player blink (FLASH_EVENT)
 
 # ---------------- Colors (RGB) ----------------
 COLOR_BG = (20, 20, 30)
@@ -22,6 +27,15 @@ COLOR_PLAYER = (0, 200, 255)
 COLOR_WARNING = (220, 80, 80)
 
 # ---------------- Gameplay ----------------
+ADD_MIN: int = 1                # addition operands: ADD_MIN..ADD_MAX
+ADD_MAX: int = 20
+MUL_MIN: int = 2                # multiplication operands: MUL_MIN..MUL_MAX
+MUL_MAX: int = 10
+
 START_TIME_LIMIT: float = 6.0   # seconds for first question
 MIN_TIME_LIMIT: float = 1.5     # minimum allowed time per question
 TIME_DECAY: float = 0.92        # each level multiplies time by this value
+
+# ---------------- Answer checking ----------------
+EARLY_REJECT: bool = False      # game over as soon as typed digits cannot match
+AUTO_SUBMIT: bool = False       # submit the moment the typed value is correct
@@ -8,11 +8,14 @@ Why custom events?
 - Required by the assignment (event_custom)
 
 All custom events must start from pygame.USEREVENT.
+
+They are posted by scene timers (core/scheduler.py), not by
+pygame.time.set_timer, so they only fire in the scene that wants them.
 """
 
 import pygame
 
-# Fired every fixed interval (used for timers / UI updates)
+# Fired every fixed interval (HUD timer refresh)
 TICK_EVENT: int = pygame.USEREVENT + 1
 
 # Fired when time for a question is over
@@ -21,3 +24,7 @@ TIME_UP_EVENT: int = pygame.USEREVENT + 2
 # Additional custom event used for visual effects (blinking player)
 # Demonstrates using more than one custom event/timer in the app
 FLASH_EVENT: int = pygame.USEREVENT + 3
+
+# A message from the game server arrived (event.message, see net/protocol.py).
+# Posted by the connection's reader thread, not by a timer.
+NET_EVENT: int = pygame.USEREVENT + 4
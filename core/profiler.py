@@ -0,0 +1,235 @@
+# core/profiler.py
+"""
+Per-phase frame timing.
+
+Every frame of GameApp has four phases:
+- events : pumping and handling pygame events
+- update : scene.update(dt)
+- draw   : scene.render(screen)
+- flip   : pushing the changed pixels to the display
+
+FrameProfiler keeps the last N timings of every phase, separately for
+every scene (rolling window), and counts dropped frames (frames that
+started much later than the frame budget allows). The budget is the
+one the loop paced the frame with (lower while unfocused); frames
+that followed a wait for input (idle scenes) are never dropped.
+
+It also keeps the input-to-display latency of key presses
+(InputLatency, recorded by GameApp for every KEYDOWN).
+
+The data can be shown in an overlay (toggled with F3 by GameApp)
+and exported to a JSON file.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import deque
+from pathlib import Path
+
+import pygame
+
+from core.constants import FPS, COLOR_WHITE
+from ui.fonts import get_font
+
+PHASES = ("events", "update", "draw", "flip")
+
+# A frame that starts later than budget * DROP_FACTOR counts as dropped
+DROP_FACTOR: float = 1.5
+
+# Overlay text is refreshed at most this often (seconds)
+OVERLAY_REFRESH: float = 0.25
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    """Nearest-rank percentile of an already sorted list (0 if empty)."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(p / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class SceneTimings:
+    """Rolling frame timings of one scene."""
+
+    def __init__(self, window: int):
+        self.phases: dict[str, deque] = {phase: deque(maxlen=window) for phase in PHASES}
+        self.total: deque = deque(maxlen=window)
+        self.frames: int = 0
+        self.dropped: int = 0
+
+    def summary(self) -> dict:
+        """p50/p95/p99 (ms) for the total frame and for every phase."""
+        result = {"frames": self.frames, "dropped": self.dropped}
+        for name, values in (("total", self.total), *self.phases.items()):
+            ordered = sorted(values)
+            result[name] = {
+                "p50": percentile(ordered, 50),
+                "p95": percentile(ordered, 95),
+                "p99": percentile(ordered, 99),
+            }
+        return result
+
+
+class InputLatency:
+    """
+    Key press -> display latency (ms), from the last N key presses.
+
+    For every KEYDOWN the app knows when it took the event from the
+    queue and when the frame that handled it was pushed to the display.
+    When the key ARRIVED is known only roughly: after the previous look
+    at the queue. So two numbers are kept per key:
+    - handled : taken from the queue -> flip
+    - display : previous look at the queue -> flip (upper bound of
+                the real input-to-display latency)
+    The standard loop looks at the queue once per frame, so the bound
+    is up to a frame above "handled"; the low-latency loop waits ON the
+    queue and both are almost the same.
+
+    Keys whose frame pushed nothing changed nothing on screen; they are
+    only counted (hidden).
+    """
+
+    def __init__(self, window: int = 1000):
+        self.handled: deque = deque(maxlen=window)
+        self.display: deque = deque(maxlen=window)
+        self.keys: int = 0
+        self.hidden: int = 0
+
+    def record(self, checked: float, received: float, flipped: float, keys: int) -> None:
+        """`keys` key presses, taken from the queue at `received`, shown at `flipped`."""
+        self.keys += keys
+        handled_ms = (flipped - received) * 1000.0
+        display_ms = (flipped - checked) * 1000.0
+        for _ in range(keys):
+            self.handled.append(handled_ms)
+            self.display.append(display_ms)
+
+    def summary(self) -> dict:
+        """p50/p95/p99/max (ms) of both numbers."""
+        result = {"keys": self.keys, "hidden": self.hidden}
+        for name, values in (("handled", self.handled), ("display", self.display)):
+            ordered = sorted(values)
+            result[name] = {
+                "p50": percentile(ordered, 50),
+                "p95": percentile(ordered, 95),
+                "p99": percentile(ordered, 99),
+                "max": ordered[-1] if ordered else 0.0,
+            }
+        return result
+
+
+class FrameProfiler:
+    """Collects per-phase frame timings and draws the performance overlay."""
+
+    def __init__(self, window: int = 600, budget_ms: float = 1000.0 / FPS):
+        self.window = window
+        self.budget_ms = budget_ms
+        self.scenes: dict[str, SceneTimings] = {}
+        self.last_frame_start: float | None = None
+        self.input = InputLatency()
+
+        # Overlay
+        self.visible: bool = False
+        self.overlay_rect = pygame.Rect(10, 60, 330, 126)
+        self._overlay_surface: pygame.Surface | None = None
+        self._overlay_updated: float = 0.0
+
+    def record(
+        self,
+        scene_name: str,
+        timings: tuple[float, ...],
+        frame_start: float,
+        budget_ms: float | None = None,
+        paced: bool = True,
+    ) -> None:
+        """
+        Store the timings (seconds, one per phase) of one frame.
+
+        frame_start is the perf_counter() value when the frame began,
+        used to detect dropped frames against budget_ms (default: the
+        profiler's budget). paced=False: the frame followed a wait for
+        the next event, a long interval is not a dropped frame.
+        """
+        stats = self.scenes.get(scene_name)
+        if stats is None:
+            stats = self.scenes[scene_name] = SceneTimings(self.window)
+
+        total = 0.0
+        for phase, seconds in zip(PHASES, timings):
+            ms = seconds * 1000.0
+            stats.phases[phase].append(ms)
+            total += ms
+        stats.total.append(total)
+        stats.frames += 1
+
+        if paced and self.last_frame_start is not None:
+            budget_ms = self.budget_ms if budget_ms is None else budget_ms
+            interval_ms = (frame_start - self.last_frame_start) * 1000.0
+            if interval_ms > budget_ms * DROP_FACTOR:
+                stats.dropped += 1
+        self.last_frame_start = frame_start
+
+    def summary(self) -> dict:
+        """Summary of every scene (see SceneTimings.summary)."""
+        return {name: stats.summary() for name, stats in self.scenes.items()}
+
+    def export(self, path: str | Path, extra: dict | None = None) -> None:
+        """Write the summary to a JSON file."""
+        data = {"budget_ms": self.budget_ms, "scenes": self.summary(), "input_latency": self.input.summary()}
+        if extra:
+            data.update(extra)
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+    # --------------------------------------------------
+    # Overlay
+    # --------------------------------------------------
+    def toggle_overlay(self) -> None:
+        self.visible = not self.visible
+        self._overlay_surface = None
+
+    def draw_overlay(self, screen: pygame.Surface, scene_name: str, dirty_rects: list[pygame.Rect]) -> bool:
+        """
+        Draw the overlay on top of the scene.
+
+        The text is rebuilt every OVERLAY_REFRESH seconds; in between,
+        the cached overlay is re-blitted only if the scene drew under it.
+
+        Returns True if the overlay area must be pushed to the display.
+        """
+        now = time.perf_counter()
+        refresh = self._overlay_surface is None or now - self._overlay_updated >= OVERLAY_REFRESH
+        if refresh:
+            self._overlay_surface = self._build_overlay(scene_name)
+            self._overlay_updated = now
+        elif self.overlay_rect.collidelist(dirty_rects) == -1:
+            return False
+
+        screen.blit(self._overlay_surface, self.overlay_rect)
+        return True
+
+    def _build_overlay(self, scene_name: str) -> pygame.Surface:
+        font = get_font(20)
+        stats = self.scenes.get(scene_name)
+        if stats is None:
+            lines = [scene_name, "no data yet"]
+        else:
+            summary = stats.summary()
+            lines = [f"{scene_name}  frames: {summary['frames']}  dropped: {summary['dropped']}"]
+            for name in ("total", *PHASES):
+                values = summary[name]
+                lines.append(
+                    f"{name:<7} p50 {values['p50']:6.2f}  p95 {values['p95']:6.2f}  p99 {values['p99']:6.2f} ms"
+                )
+        display = self.input.summary()["display"]
+        lines.append(f"input   p50 {display['p50']:6.2f}  p95 {display['p95']:6.2f}  max {display['max']:6.2f} ms")
+
+        surface = pygame.Surface(self.overlay_rect.size)
+        surface.fill((0, 0, 0))
+        pygame.draw.rect(surface, COLOR_WHITE, surface.get_rect(), width=1)
+        for i, line in enumerate(lines):
+            surface.blit(font.render(line, True, COLOR_WHITE), (8, 6 + i * 16))
+        return surface
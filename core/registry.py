@@ -0,0 +1,74 @@
+# core/registry.py
+"""
+Lazy registry of scenes and pygame submodules.
+
+Scenes are registered by NAME as "module:Class" strings. A scene
+module is imported the first time the scene is needed:
+
+    scene_manager.switch("game")
+
+so starting the game imports only the loading screen; the menu, game
+and end scene modules (and the logic modules they use) are imported
+later, and scenes never import each other.
+
+A registered scene can also get constructor parameters, e.g. the
+network client replaces the local game:
+
+    register_scene("game", "ui.remote_game_scene:RemoteGameScene", address=("127.0.0.1", 8765))
+
+pygame submodules are initialised on first use the same way:
+
+    require("font")   # pygame.font.init() unless already done
+"""
+
+from __future__ import annotations
+
+import importlib
+
+import pygame
+
+# name -> "module:Class"
+SCENES: dict[str, str] = {
+    "loading": "ui.loading_scene:LoadingScene",
+    "menu": "ui.menu_scene:MenuScene",
+    "game": "ui.game_scene:GameScene",
+    "end": "ui.end_scene:EndScene",
+}
+
+# name -> imported class
+_classes: dict[str, type] = {}
+
+# name -> constructor parameters given to register_scene
+_params: dict[str, dict] = {}
+
+
+def register_scene(name: str, target: str, **params) -> None:
+    """Add (or replace) a scene: target is "module:Class"."""
+    SCENES[name] = target
+    _params[name] = params
+    _classes.pop(name, None)
+
+
+def scene_params(name: str) -> dict:
+    """Constructor parameters registered for the scene (usually none)."""
+    return _params.get(name, {})
+
+
+def scene_class(name: str) -> type:
+    """Return the scene class, importing its module on first use."""
+    scene_type = _classes.get(name)
+    if scene_type is None:
+        try:
+            module_name, class_name = SCENES[name].split(":")
+        except KeyError:
+            raise KeyError(f"unknown scene {name!r} (registered: {', '.join(SCENES)})") from None
+        scene_type = _classes[name] = getattr(importlib.import_module(module_name), class_name)
+    return scene_type
+
+
+def require(submodule: str):
+    """Return pygame.<submodule>, initialised (e.g. "font", "mixer")."""
+    module = getattr(pygame, submodule)
+    if not module.get_init():
+        module.init()
+    return module
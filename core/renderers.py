@@ -0,0 +1,101 @@
+# core/renderers.py
+"""
+Display backends: how a finished frame gets into the window.
+
+Scenes always draw into ONE WIDTH x HEIGHT surface (the canvas), with
+dirty rectangles. A renderer only decides how the changed rectangles
+reach the window:
+
+- SoftwareRenderer (default): the canvas IS the display surface
+  (pygame.display.set_mode); present() = pygame.display.update(rects).
+  The window is exactly WIDTH x HEIGHT.
+
+- TextureRenderer (pygame._sdl2.video): the canvas is a plain surface
+  mirrored in ONE streaming texture. present() uploads only the changed
+  rectangles and lets the SDL renderer draw the texture scaled to the
+  window (letterboxed; SDL maps mouse positions back to canvas
+  coordinates). Static layers, cached text and sprites reach the
+  texture once, when they are drawn, and are not uploaded again while
+  they stay unchanged. With a GPU renderer the CPU work per frame is
+  the upload of the changed canvas pixels, whatever the window size:
+  1080p and 4K cost the same as 900x500.
+  It also runs on SDL's software renderer (headless tests, machines
+  without GPU, or SDL_RENDER_DRIVER=software); then the CPU does the
+  scaling and large windows cost more.
+
+Run:
+    python main.py --renderer texture --window-size 1920x1080
+    python main.py --renderer texture --fullscreen
+"""
+
+from __future__ import annotations
+
+import os
+
+import pygame
+
+
+class SoftwareRenderer:
+    """Draw straight into the display surface (fixed window size)."""
+
+    def __init__(self, size: tuple[int, int], caption: str, window_size=None, fullscreen: bool = False):
+        # Scaling would be done by the CPU for every pixel: not supported here
+        self.canvas = pygame.display.set_mode(size)
+        pygame.display.set_caption(caption)
+
+    def present(self, rects: list[pygame.Rect]) -> None:
+        pygame.display.update(rects)
+
+
+class TextureRenderer:
+    """Upload changed canvas rectangles to a texture; the GPU scales it to the window."""
+
+    def __init__(
+        self,
+        size: tuple[int, int],
+        caption: str,
+        window_size: tuple[int, int] | None = None,
+        fullscreen: bool = False,
+    ):
+        # pygame's SDL2 renderer API is still marked experimental:
+        # only imported when this backend is chosen
+        from pygame._sdl2.video import Renderer, Texture, Window
+
+        # Smooth scaling (read by SDL when the texture is created)
+        os.environ.setdefault("SDL_RENDER_SCALE_QUALITY", "linear")
+
+        flags = {"fullscreen_desktop": True} if fullscreen else {}
+        self.window = Window(caption, size=window_size or size, resizable=True, **flags)
+        self.renderer = Renderer(self.window)  # GPU if available, else SDL's software renderer
+        self.renderer.logical_size = size  # draw in canvas coordinates, SDL scales
+        self.renderer.draw_color = (0, 0, 0, 255)  # letterbox bars
+
+        self.canvas = pygame.Surface(size, 0, 32)
+        self._canvas_rect = self.canvas.get_rect()
+        self.texture = Texture(self.renderer, size, streaming=True)
+
+    def present(self, rects: list[pygame.Rect]) -> None:
+        for rect in rects:
+            rect = rect.clip(self._canvas_rect)
+            if rect.width and rect.height:
+                self.texture.update(self.canvas.subsurface(rect), rect)
+
+        # The back buffer is undefined after present: always draw everything
+        self.renderer.clear()
+        self.texture.draw()
+        self.renderer.present()
+
+
+RENDERERS = {
+    "software": SoftwareRenderer,
+    "texture": TextureRenderer,
+}
+
+
+def create_renderer(name: str, size: tuple[int, int], caption: str, **options):
+    """Renderer by name (see RENDERERS); options: window_size, fullscreen."""
+    try:
+        renderer_type = RENDERERS[name]
+    except KeyError:
+        raise KeyError(f"unknown renderer {name!r} (available: {', '.join(RENDERERS)})") from None
+    return renderer_type(size, caption, **options)
@@ -13,8 +13,30 @@ The app always calls:
     current_scene.draw(screen)
 
 This keeps the main loop simple and readable.
+
+Scenes are switched by NAME ("menu", "game", ...; see core/registry.py),
+so a scene module is imported only when the scene is first needed.
+
+Scenes are pooled: switch(name, **params) builds each scene only ONCE
+(fonts, buttons, sprites...). Later switches call scene.reset(**params)
+on the existing instance instead, e.g. restart after game over reuses
+the same GameScene.
+
+Lifecycle of a switch:
+    old.on_exit()      -> its timers are cancelled
+    new.reset(**params)   (or the constructor, the first time)
+    new.on_enter()     -> register timers, full redraw
+
+The time every switch takes is measured (see stats() and core/telemetry.py).
 """
 
+from __future__ import annotations
+
+import time
+
+from core.registry import scene_class, scene_params
+from core.scheduler import scheduler
+from core.telemetry import TRANSITION_BUCKETS, telemetry
 from interfaces.scene import BaseScene
 
 
@@ -23,7 +45,66 @@ class SceneManager:
 
     def __init__(self) -> None:
         self.current_scene: BaseScene | None = None
+        self.current_name: str | None = None
+
+        # One instance per scene name
+        self._pool: dict[str, BaseScene] = {}
+
+        # "old->new" -> transition timings (ms)
+        self.transitions: dict[str, dict] = {}
+
+    def switch(self, name: str, **params) -> BaseScene:
+        """Switch to the pooled scene `name` (imported and built on first use)."""
+        start = time.perf_counter()
+        old_name = self.current_name
+
+        scene = self._pool.get(name)
+        if scene is None:
+            scene = scene_class(name)(self, **{**scene_params(name), **params})
+            self._pool[name] = scene
+            created = True
+        else:
+            scene.reset(**params)
+            created = False
+        self.set_scene(scene)
+        self.current_name = name
+
+        self._record(f"{old_name}->{name}", (time.perf_counter() - start) * 1000.0, created)
+        return scene
 
     def set_scene(self, scene: BaseScene) -> None:
-        """Switch to a new scene."""
+        """Switch to a new scene (not pooled; prefer switch)."""
+        if self.current_scene is not None:
+            self.current_scene.on_exit()
+            scheduler.cancel_owner(self.current_scene)
         self.current_scene = scene
+        scene.on_enter()
+
+    def _record(self, name: str, elapsed_ms: float, created: bool) -> None:
+        entry = self.transitions.get(name)
+        if entry is None:
+            entry = self.transitions[name] = {
+                "count": 0, "created": 0, "last_ms": 0.0, "max_ms": 0.0, "total_ms": 0.0
+            }
+        entry["count"] += 1
+        entry["created"] += int(created)
+        entry["last_ms"] = elapsed_ms
+        entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+        entry["total_ms"] += elapsed_ms
+
+        telemetry.histogram(
+            "math_game_transition_seconds", "Scene switch duration", TRANSITION_BUCKETS, transition=name
+        ).observe(elapsed_ms / 1000.0)
+
+    def stats(self) -> dict:
+        """Transition latency per "old->new" pair."""
+        return {
+            name: {
+                "count": entry["count"],
+                "created": entry["created"],
+                "last_ms": entry["last_ms"],
+                "max_ms": entry["max_ms"],
+                "avg_ms": entry["total_ms"] / entry["count"],
+            }
+            for name, entry in self.transitions.items()
+        }
@@ -0,0 +1,170 @@
+# core/scheduler.py
+"""
+Timer scheduler on a monotonic clock.
+
+Replaces the global pygame.time.set_timer timers:
+- scenes register their OWN deadlines and repeating timers
+  (BaseScene.after / BaseScene.every); they are cancelled
+  automatically when the scene is left (SceneManager.set_scene)
+- deadlines are absolute times, so "time left" is computed exactly
+  (no counting of 0.1 s ticks that drift and add up rounding errors)
+- a repeating timer that missed several intervals (stalled frame)
+  fires ONCE and stays on its original grid, instead of a burst
+- pause() freezes the clock (window not focused), resume() continues
+
+Timers live in a heap ordered by due time: the app only looks at
+the first entry each frame. Cancelled timers are dropped lazily
+when they reach the top.
+
+The clock can be replaced (the headless simulation uses simulated time).
+Only post_event() needs pygame, so the game server (net/server.py)
+uses the same heap without it.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import time
+from typing import Callable
+
+
+class Timer:
+    """One scheduled callback (one-shot when interval is None)."""
+
+    __slots__ = ("due", "interval", "callback", "owner", "active")
+
+    def __init__(self, due: float, interval: float | None, callback: Callable[[], None], owner):
+        self.due = due
+        self.interval = interval
+        self.callback = callback
+        self.owner = owner
+        self.active = True
+
+    def cancel(self) -> None:
+        self.active = False
+
+
+class Scheduler:
+    """Heap of Timers on a pausable monotonic clock (seconds)."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self._heap: list[tuple[float, int, Timer]] = []
+        self._order = itertools.count()  # ties fire in registration order
+
+        # Pause handling: now() = clock() - offset, frozen while paused
+        self._offset: float = 0.0
+        self._paused_at: float | None = None
+
+        # Counters
+        self.fired: int = 0
+        self.coalesced: int = 0  # missed intervals merged into one call
+
+    def set_clock(self, clock: Callable[[], float]) -> None:
+        """Use another time source. All timers are dropped."""
+        self.clock = clock
+        self._heap.clear()
+        self._offset = 0.0
+        self._paused_at = None
+
+    def now(self) -> float:
+        """Scheduler time in seconds (does not advance while paused)."""
+        current = self._paused_at if self._paused_at is not None else self.clock()
+        return current - self._offset
+
+    @property
+    def paused(self) -> bool:
+        return self._paused_at is not None
+
+    def pause(self) -> None:
+        if self._paused_at is None:
+            self._paused_at = self.clock()
+
+    def resume(self) -> None:
+        if self._paused_at is not None:
+            self._offset += self.clock() - self._paused_at
+            self._paused_at = None
+
+    # --------------------------------------------------
+    # Registering
+    # --------------------------------------------------
+    def call_at(self, due: float, callback: Callable[[], None], owner=None) -> Timer:
+        """Call `callback` once at scheduler time `due`."""
+        return self._push(Timer(due, None, callback, owner))
+
+    def call_later(self, delay: float, callback: Callable[[], None], owner=None) -> Timer:
+        """Call `callback` once, `delay` seconds from now."""
+        return self.call_at(self.now() + delay, callback, owner)
+
+    def call_every(self, interval: float, callback: Callable[[], None], owner=None) -> Timer:
+        """Call `callback` every `interval` seconds (first call after one interval)."""
+        return self._push(Timer(self.now() + interval, interval, callback, owner))
+
+    def _push(self, timer: Timer) -> Timer:
+        heapq.heappush(self._heap, (timer.due, next(self._order), timer))
+        return timer
+
+    def cancel_owner(self, owner) -> None:
+        """Cancel every timer registered by `owner` (e.g. a scene being left)."""
+        for _, _, timer in self._heap:
+            if timer.owner is owner:
+                timer.active = False
+
+    def remaining(self, timer: Timer) -> float:
+        """Seconds until `timer` fires (0 if due or cancelled)."""
+        if not timer.active:
+            return 0.0
+        return max(timer.due - self.now(), 0.0)
+
+    # --------------------------------------------------
+    # Running
+    # --------------------------------------------------
+    def next_deadline(self) -> float | None:
+        """Seconds until the next timer fires (None = no timers, or paused)."""
+        self._drop_cancelled()
+        if not self._heap or self.paused:
+            return None
+        return max(self._heap[0][0] - self.now(), 0.0)
+
+    def run_due(self) -> int:
+        """Fire every timer that is due. Returns how many callbacks ran."""
+        now = self.now()
+        fired = 0
+        while self._heap and self._heap[0][0] <= now:
+            due, _, timer = heapq.heappop(self._heap)
+            if not timer.active:
+                continue
+
+            if timer.interval is None:
+                timer.active = False
+            else:
+                # Missed intervals are merged: next due stays on the grid
+                missed = int((now - due) // timer.interval)
+                self.coalesced += missed
+                timer.due = due + (missed + 1) * timer.interval
+                self._push(timer)
+
+            timer.callback()
+            fired += 1
+
+        self.fired += fired
+        return fired
+
+    def _drop_cancelled(self) -> None:
+        while self._heap and not self._heap[0][2].active:
+            heapq.heappop(self._heap)
+
+
+def post_event(event_type: int) -> Callable[[], None]:
+    """Timer callback that posts a (custom) pygame event."""
+    import pygame
+
+    def post() -> None:
+        pygame.event.post(pygame.event.Event(event_type))
+
+    return post
+
+
+# Shared by the whole game
+scheduler = Scheduler()
@@ -0,0 +1,282 @@
+# core/simulation.py
+"""
+Headless, uncapped simulation of the whole game.
+
+Runs GameApp without a window (SDL dummy drivers), as fast as the CPU
+allows. Time is SIMULATED: every frame advances a fixed timestep and
+the scheduler (core/scheduler.py) runs on that simulated clock, so
+every deadline and timer behaves exactly as in real time.
+
+Input comes from a "script":
+- AutoPlayer      : a bot that plays menu -> game -> end -> restart
+- ReplayScript    : events recorded with EventRecorder (JSON file)
+
+Run:
+    python -m core.simulation --sessions 1000 --seed 1
+    python -m core.simulation --script recording.json --sessions 50
+    python -m core.simulation --sessions 100 --profile frames.json
+    python -m core.simulation --sessions 100 --metrics metrics.prom
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import pygame
+
+from core.constants import AUTO_SUBMIT, EARLY_REJECT, FPS
+from core.scheduler import scheduler
+from core.telemetry import telemetry
+from logic import answer_archive, history, questions, seen_questions, storage
+from ui.fonts import clear_fonts
+from ui.text_cache import text_cache
+
+# Only these events are recorded / replayed (what the scenes react to)
+INPUT_EVENTS = ("KEYDOWN", "MOUSEBUTTONDOWN")
+
+
+def _event_to_dict(frame: int, event: pygame.event.Event) -> dict:
+    """Convert an input event to a JSON friendly dict."""
+    data = {"frame": frame, "type": pygame.event.event_name(event.type).upper()}
+    if event.type == pygame.KEYDOWN:
+        data["key"] = event.key
+        data["unicode"] = event.unicode
+    else:
+        data["button"] = event.button
+        data["pos"] = list(event.pos)
+    return data
+
+
+def _dict_to_event(data: dict) -> pygame.event.Event:
+    """Inverse of _event_to_dict. "key" may be an int or a name like "K_RETURN"."""
+    event_type = getattr(pygame, data["type"])
+    if event_type == pygame.KEYDOWN:
+        key = data["key"]
+        if isinstance(key, str):
+            key = getattr(pygame, key)
+        return pygame.event.Event(event_type, key=key, unicode=data.get("unicode", ""))
+    return pygame.event.Event(event_type, button=data.get("button", 1), pos=tuple(data["pos"]))
+
+
+class EventRecorder:
+    """Records input events of a real game so they can be replayed later."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.records: list[dict] = []
+
+    def record(self, frame: int, event: pygame.event.Event) -> None:
+        if pygame.event.event_name(event.type).upper() in INPUT_EVENTS:
+            self.records.append(_event_to_dict(frame, event))
+
+    def save(self) -> None:
+        self.path.write_text(json.dumps(self.records), encoding="utf-8")
+
+
+class ReplayScript:
+    """
+    Replays a recorded event stream.
+
+    When the recording is exhausted it starts again from the beginning,
+    so a short recording can drive any number of sessions.
+    """
+
+    def __init__(self, path: str | Path):
+        records = json.loads(Path(path).read_text(encoding="utf-8"))
+        self.records = sorted(records, key=lambda r: r["frame"])
+        self.length = self.records[-1]["frame"] + 1 if self.records else 0
+        self.index = 0
+        self.offset = 0
+
+    def __call__(self, scene, frame: int) -> list[pygame.event.Event]:
+        if not self.records:
+            return []
+
+        events = []
+        while frame - self.offset >= self.records[self.index]["frame"]:
+            events.append(_dict_to_event(self.records[self.index]))
+            self.index += 1
+            if self.index == len(self.records):
+                # Loop the recording
+                self.index = 0
+                self.offset += self.length
+        return events
+
+
+class AutoPlayer:
+    """
+    Scripted bot.
+
+    - Menu: presses ENTER
+    - Game: after `think_frames` types the answer and presses ENTER
+            (a wrong answer with probability `error_rate`);
+            no ENTER when AUTO_SUBMIT submits by itself, or when
+            EARLY_REJECT already ends the game on a wrong digit
+    - End : presses ENTER (restart)
+    """
+
+    def __init__(self, seed: int | None = None, error_rate: float = 0.05, think_frames: int = 20):
+        self.rng = random.Random(seed)
+        self.error_rate = error_rate
+        self.think_frames = think_frames
+        self.waited = 0
+
+    @staticmethod
+    def _key(char: str) -> pygame.event.Event:
+        key = pygame.K_RETURN if char == "\r" else ord(char)
+        return pygame.event.Event(pygame.KEYDOWN, key=key, unicode=char)
+
+    def __call__(self, scene, frame: int) -> list[pygame.event.Event]:
+        question = getattr(scene, "question", None)
+        if question is None:
+            # Menu / End scene
+            return [self._key("\r")]
+
+        self.waited += 1
+        if self.waited < self.think_frames:
+            return []
+        self.waited = 0
+
+        answer = question.answer
+        wrong = self.rng.random() < self.error_rate
+        if wrong:
+            answer += 1
+        keys = [self._key(char) for char in str(answer)]
+        # An ENTER after the game is over would restart it from the end screen
+        if not (AUTO_SUBMIT or (wrong and EARLY_REJECT)):
+            keys.append(self._key("\r"))
+        return keys
+
+
+class Simulation:
+    """Drives a headless GameApp with a fixed timestep and scripted input."""
+
+    def __init__(self, script=None, seed: int | None = 0, timestep: float = 1 / FPS):
+        # Imported here so the SDL env vars are set by GameApp first
+        from core.app import GameApp
+
+        questions.seed(seed)
+        self.script = script if script is not None else AutoPlayer(seed)
+        self.timestep = timestep
+
+        # Never touch the real data files (high score, seen questions, history, answers)
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self._real_highscore_path = storage.highscore_store.path
+        storage.highscore_store.open(Path(self._tmpdir.name) / "highscore.json")
+        self._real_seen_path = seen_questions.default_index.path
+        seen_questions.default_index.open(Path(self._tmpdir.name) / "seen_questions.bin")
+        self._real_history_path = history.history_store.path
+        history.history_store.open(Path(self._tmpdir.name) / "history.db")
+        self._real_archive_path = answer_archive.answer_archive.path
+        answer_archive.answer_archive.open(Path(self._tmpdir.name) / "answers.bin")
+
+        # Timers and deadlines run on simulated time
+        self.sim_ms = 0.0
+        self._real_clock = scheduler.clock
+        scheduler.set_clock(lambda: self.sim_ms / 1000.0)
+
+        self.app = GameApp(headless=True)
+        self.frames = 0
+        self.sessions = 0
+
+    def run(self, sessions: int, max_frames: int = 10_000_000) -> dict:
+        """Run until `sessions` games have ended. Returns a small report."""
+        app = self.app
+        start = time.perf_counter()
+
+        while self.sessions < sessions and self.frames < max_frames and app.running:
+            before = app.scene_manager.current_scene
+            before_name = app.scene_manager.current_name
+
+            for event in self.script(before, self.frames):
+                pygame.event.post(event)
+
+            self.sim_ms += self.timestep * 1000.0
+
+            app.step(self.timestep)
+            self.frames += 1
+
+            if app.scene_manager.current_name == "end" and before_name != "end":
+                self.sessions += 1
+
+        elapsed = time.perf_counter() - start
+        return {
+            "sessions": self.sessions,
+            "frames": self.frames,
+            "wall_seconds": elapsed,
+            "simulated_seconds": self.sim_ms / 1000.0,
+            "sessions_per_second": self.sessions / elapsed if elapsed else 0.0,
+            "frames_per_second": self.frames / elapsed if elapsed else 0.0,
+            "transitions": app.scene_manager.stats(),
+            "input_latency": app.profiler.input.summary(),
+        }
+
+    def close(self) -> None:
+        pygame.quit()
+        # Fonts and text surfaces of this pygame session are invalid now
+        # (another Simulation may follow in the same process)
+        clear_fonts()
+        text_cache.clear()
+        scheduler.set_clock(self._real_clock)
+        storage.highscore_store.open(self._real_highscore_path)
+        seen_questions.default_index.open(self._real_seen_path)
+        history.history_store.open(self._real_history_path)
+        answer_archive.answer_archive.open(self._real_archive_path)
+        self._tmpdir.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Headless game simulation")
+    parser.add_argument("--sessions", type=int, default=100, help="games to play")
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed")
+    parser.add_argument("--script", help="recorded event file (default: AutoPlayer bot)")
+    parser.add_argument("--error-rate", type=float, default=0.05, help="AutoPlayer wrong answer rate")
+    parser.add_argument("--timestep", type=float, default=1 / FPS, help="simulated seconds per frame")
+    parser.add_argument("--profile", help="write per-phase frame timings to this JSON file")
+    parser.add_argument("--metrics", help="write the latency histograms (Prometheus text) to this file")
+    args = parser.parse_args()
+
+    if args.script:
+        script = ReplayScript(args.script)
+    else:
+        script = AutoPlayer(args.seed, error_rate=args.error_rate)
+
+    simulation = Simulation(script, seed=args.seed, timestep=args.timestep)
+    try:
+        report = simulation.run(args.sessions)
+        if args.profile:
+            simulation.app.profiler.export(
+                args.profile,
+                {
+                    "simulation": report,
+                    "text_cache": text_cache.stats(),
+                    "storage": storage.highscore_store.stats(),
+                },
+            )
+        if args.metrics:
+            telemetry.write_file(args.metrics)
+    finally:
+        simulation.close()
+
+    print(
+        f"{report['sessions']} sessions, {report['frames']} frames "
+        f"({report['simulated_seconds']:.1f}s simulated) in {report['wall_seconds']:.2f}s"
+    )
+    print(f"sessions/s: {report['sessions_per_second']:.1f}")
+    print(f"frames/s:   {report['frames_per_second']:.1f}")
+    handled = report["input_latency"]["handled"]
+    print(
+        f"key -> flip: p50 {handled['p50']:.3f} ms  p95 {handled['p95']:.3f} ms  "
+        f"p99 {handled['p99']:.3f} ms  ({report['input_latency']['keys']} keys)"
+    )
+    for name, stats in sorted(report["transitions"].items()):
+        print(f"{name:<22} x{stats['count']:<5} avg {stats['avg_ms']:.3f} ms  max {stats['max_ms']:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
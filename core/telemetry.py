@@ -0,0 +1,173 @@
+# core/telemetry.py
+"""
+Latency telemetry in Prometheus text format.
+
+Recorded (see the *_BUCKETS constants):
+- math_game_response_seconds   : question shown -> answer checked,
+                                 by operator and result
+- math_game_frame_seconds      : whole frame (events..flip), by scene
+- math_game_transition_seconds : scene switches, by "old->new"
+- math_game_input_latency_seconds : key press -> frame on the display
+                                 (upper bound, see core/profiler.InputLatency)
+
+All of them are fixed-bucket histograms: observe() is one bisect and
+three additions on the game thread - no locks, no allocation, no IO.
+
+Export (both optional, both off the game thread):
+- write_file(path)         : atomic write, e.g. for node_exporter's
+                             textfile collector; start_file_writer()
+                             repeats it on a background thread
+- serve(port)              : HTTP endpoint on localhost (/metrics)
+
+    python main.py --metrics-port 9108
+    python main.py --metrics-file data/metrics.prom
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from bisect import bisect_left
+from pathlib import Path
+
+# Bucket upper bounds (seconds)
+RESPONSE_BUCKETS = (0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 4.0, 6.0, 8.0)
+FRAME_BUCKETS = (0.001, 0.002, 0.004, 0.008, 0.0167, 0.0333, 0.05, 0.1, 0.25)
+INPUT_BUCKETS = (0.001, 0.002, 0.004, 0.008, 0.0125, 0.0167, 0.025, 0.0333, 0.05, 0.1)
+TRANSITION_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.1)
+
+DEFAULT_PORT: int = 9108
+
+
+class Histogram:
+    """Histogram with fixed bucket bounds (made cumulative only on export)."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last one = +Inf
+        self.sum: float = 0.0
+        self.count: int = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Telemetry:
+    """Named histogram families (with labels) and their exporters."""
+
+    def __init__(self):
+        # name -> (help text, bounds, {label tuple -> Histogram})
+        self._families: dict[str, tuple[str, tuple, dict]] = {}
+        self._writer_stops: list[threading.Event] = []
+        self._server = None
+
+    def histogram(self, name: str, help_text: str, bounds: tuple[float, ...], **labels: str) -> Histogram:
+        """
+        Get (or create) the histogram of one label set.
+
+        Look it up once and keep it: observe() on the kept object is the
+        cheap part.
+        """
+        family = self._families.get(name)
+        if family is None:
+            family = self._families[name] = (help_text, bounds, {})
+        key = tuple(sorted(labels.items()))
+        histogram = family[2].get(key)
+        if histogram is None:
+            histogram = family[2][key] = Histogram(family[1])
+        return histogram
+
+    # --------------------------------------------------
+    # Prometheus text format
+    # --------------------------------------------------
+    def render(self) -> str:
+        lines = []
+        for name, (help_text, bounds, series) in list(self._families.items()):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for key, histogram in list(series.items()):
+                counts = list(histogram.counts)  # snapshot (game thread keeps writing)
+                labels = ",".join(f'{k}="{v}"' for k, v in key)
+                prefix = labels + "," if labels else ""
+
+                cumulative = 0
+                for bound, count in zip(bounds, counts):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{{prefix}le="{bound:g}"}} {cumulative}')
+                cumulative += counts[-1]
+                lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {cumulative}')
+
+                suffix = f"{{{labels}}}" if labels else ""
+                lines.append(f"{name}_sum{suffix} {histogram.sum:.6f}")
+                lines.append(f"{name}_count{suffix} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+    # --------------------------------------------------
+    # Export
+    # --------------------------------------------------
+    def write_file(self, path: str | Path) -> None:
+        """Write all metrics (temp file + rename: readers never see half a file)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_text(self.render(), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def start_file_writer(self, path: str | Path, interval: float = 15.0) -> None:
+        """Rewrite the file every `interval` seconds on a background thread."""
+        stop = threading.Event()
+
+        def writer() -> None:
+            while not stop.wait(interval):
+                try:
+                    self.write_file(path)
+                except OSError:
+                    pass  # next round may work; the game never notices
+
+        threading.Thread(target=writer, name="telemetry-file", daemon=True).start()
+        self._writer_stops.append(stop)
+
+    def serve(self, port: int = DEFAULT_PORT, host: str = "127.0.0.1") -> None:
+        """Serve GET /metrics on a background thread (localhost only by default)."""
+        # Imported here: most runs never serve metrics
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        telemetry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = telemetry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                pass  # no console spam on every scrape
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        thread = threading.Thread(target=self._server.serve_forever, name="telemetry-http", daemon=True)
+        thread.start()
+
+    def close(self) -> None:
+        """Stop the background exporters."""
+        for stop in self._writer_stops:
+            stop.set()
+        self._writer_stops.clear()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+# Shared by the whole game
+telemetry = Telemetry()
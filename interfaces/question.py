@@ -12,6 +12,16 @@ This demonstrates:
 """
 
 from abc import ABC, abstractmethod
+from enum import Enum
+
+
+class PrefixMatch(Enum):
+    """How the digits typed so far relate to the correct answer."""
+
+    EMPTY = 0     # nothing typed yet
+    PARTIAL = 1   # a correct beginning, more digits needed
+    EXACT = 2     # exactly the answer
+    WRONG = 3     # can never become the answer
 
 
 class BaseQuestion(ABC):
@@ -24,6 +34,9 @@ class BaseQuestion(ABC):
         # Generate the question immediately
         self.generate()
 
+        # Number of digits of the answer (for match_prefix)
+        self.answer_digits: int = len(str(self.answer))
+
     @abstractmethod
     def generate(self) -> None:
         """
@@ -47,3 +60,26 @@ class BaseQuestion(ABC):
         except ValueError:
             # User entered something that is not a number
             return False
+
+    def match_prefix(self, value: int, digits: int) -> PrefixMatch:
+        """
+        Check a PARTIALLY typed answer, without any string parsing.
+
+        value : the typed digits as an integer (e.g. "12" -> 12)
+        digits: how many digits were typed
+
+        Example (answer 124):
+            1 -> PARTIAL, 12 -> PARTIAL, 124 -> EXACT, 13 -> WRONG
+        """
+        if digits == 0:
+            return PrefixMatch.EMPTY
+
+        missing = self.answer_digits - digits
+        if missing < 0:
+            return PrefixMatch.WRONG
+
+        # The first `digits` digits of the answer must equal `value`
+        if self.answer // 10 ** missing != value:
+            return PrefixMatch.WRONG
+
+        return PrefixMatch.EXACT if missing == 0 else PrefixMatch.PARTIAL
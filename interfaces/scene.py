@@ -3,25 +3,117 @@
 Scene interface (abstract base class).
 
 Every scene in the game MUST implement:
-- handle_event(event)
 - update(dt)
 - draw(screen)
 
+and declares the events it reacts to in event_handlers():
+    {pygame.KEYDOWN: self.on_key, TICK_EVENT: self.on_tick, ...}
+handle_event(event) then is ONE dict lookup instead of an if-chain,
+and the app blocks every other event type while the scene is active
+(see allowed_events), so e.g. mouse motion never fills the queue.
+
 This is the "contract" (Interface) for scenes.
+
+Dirty rectangles:
+A scene also reports WHICH parts of the screen changed since the last
+frame (mark_dirty). The app then redraws and pushes only those regions
+to the display. A new scene starts fully dirty, so its first frame is
+always drawn completely.
+
+Static layer:
+Everything that never changes (background, titles, button frames...)
+is drawn ONCE by draw_static() into a cached surface. Every frame starts
+by blitting that single surface; draw() then adds only the dynamic parts.
+
+Sprite layer:
+A scene may keep its sprites in self.sprite_layer (see new_sprite_layer):
+a LayeredDirty group of DirtySprites. A sprite that changes sets
+sprite.dirty = 1 and only its old + new rect are redrawn; frames where
+no sprite changed cost nothing. The rects are merged into the frame's
+dirty rects by render().
+
+Timers:
+after(delay, callback) / every(interval, callback) / at(due, callback)
+register timers on the shared scheduler (core/scheduler.py). They
+belong to the scene and are cancelled when the scene is left.
 """
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from typing import Callable
 import pygame
 
+from core.constants import WIDTH, HEIGHT, COLOR_BG
+from core.scheduler import Timer, scheduler
+
 
 class BaseScene(ABC):
     """Abstract base class for all scenes (Menu / Game / End)."""
 
-    @abstractmethod
+    def __init__(self) -> None:
+        # Regions changed since the last rendered frame
+        self._dirty_rects: list[pygame.Rect] = []
+        self._full_redraw: bool = True
+
+        # Pre-composited static parts (built on first render)
+        self._static_layer: pygame.Surface | None = None
+
+        # Optional LayeredDirty group (see new_sprite_layer)
+        self.sprite_layer: pygame.sprite.LayeredDirty | None = None
+
+        # event type -> handler (built on first use)
+        self._dispatch: dict[int, Callable[[pygame.event.Event], None]] | None = None
+
+    def event_handlers(self) -> dict[int, Callable[[pygame.event.Event], None]]:
+        """
+        Event type -> handler method.
+
+        Only these event types reach the scene.
+        """
+        return {}
+
+    @property
+    def allowed_events(self) -> list[int]:
+        """Event types this scene handles (used for queue filtering)."""
+        return list(self._dispatch_table())
+
+    def _dispatch_table(self) -> dict[int, Callable[[pygame.event.Event], None]]:
+        if self._dispatch is None:
+            self._dispatch = self.event_handlers()
+        return self._dispatch
+
     def handle_event(self, event: pygame.event.Event) -> None:
         """Handle a single pygame event (keyboard/mouse/custom events)."""
-        raise NotImplementedError
+        handler = self._dispatch_table().get(event.type)
+        if handler is not None:
+            handler(event)
+
+    def after(self, delay: float, callback: Callable[[], None]) -> Timer:
+        """Call `callback` once in `delay` seconds (while this scene is active)."""
+        return scheduler.call_later(delay, callback, owner=self)
+
+    def at(self, due: float, callback: Callable[[], None]) -> Timer:
+        """Call `callback` once at scheduler time `due` (while this scene is active)."""
+        return scheduler.call_at(due, callback, owner=self)
+
+    def every(self, interval: float, callback: Callable[[], None]) -> Timer:
+        """Call `callback` every `interval` seconds (while this scene is active)."""
+        return scheduler.call_every(interval, callback, owner=self)
+
+    # --------------------------------------------------
+    # Lifecycle (see SceneManager.switch)
+    # --------------------------------------------------
+    def reset(self, **params) -> None:
+        """Prepare a pooled scene for another visit (override if it has per-visit state)."""
+        pass
+
+    def on_enter(self) -> None:
+        """Scene became active. Register timers here; the screen is redrawn fully."""
+        self.mark_dirty()
+
+    def on_exit(self) -> None:
+        """Scene is being left (its timers are cancelled right after)."""
+        pass
 
     @abstractmethod
     def update(self, dt: float) -> None:
@@ -30,5 +122,101 @@ class BaseScene(ABC):
 
     @abstractmethod
     def draw(self, screen: pygame.Surface) -> None:
-        """Draw the scene to the given screen surface."""
+        """Draw the dynamic parts of the scene (on top of the static layer)."""
         raise NotImplementedError
+
+    def draw_static(self, surface: pygame.Surface) -> None:
+        """
+        Draw the parts of the scene that never change.
+
+        Called only when the static layer is (re)built.
+        The surface is already filled with the background color.
+        """
+        pass
+
+    # --------------------------------------------------
+    # Static layer
+    # --------------------------------------------------
+    def get_static_layer(self, screen: pygame.Surface) -> pygame.Surface:
+        """Return the cached static layer, building it if needed."""
+        if self._static_layer is None:
+            # Same size and pixel format as the display -> fastest blit
+            layer = pygame.Surface(screen.get_size(), 0, screen)
+            layer.fill(COLOR_BG)
+            self.draw_static(layer)
+            self._static_layer = layer
+        return self._static_layer
+
+    def invalidate_static_layer(self) -> None:
+        """Call when the layout changed: the layer is rebuilt on next render."""
+        self._static_layer = None
+        self.mark_dirty()
+
+    @staticmethod
+    def new_sprite_layer(*sprites) -> pygame.sprite.LayeredDirty:
+        """LayeredDirty group that always works with dirty rects (never full screen)."""
+        return pygame.sprite.LayeredDirty(*sprites, _use_update=True, _time_threshold=float("inf"))
+
+    def is_idle(self) -> bool:
+        """
+        True if the scene only changes in reaction to input.
+
+        The app then sleeps until the next event instead of running
+        frames at full FPS. Animated / timed scenes return False.
+        """
+        return False
+
+    # --------------------------------------------------
+    # Dirty rectangles
+    # --------------------------------------------------
+    def mark_dirty(self, rect: pygame.Rect | None = None) -> None:
+        """
+        Mark a region of the screen as changed.
+
+        rect=None means "the whole screen".
+        """
+        if rect is None:
+            self._full_redraw = True
+        elif not self._full_redraw:
+            self._dirty_rects.append(pygame.Rect(rect))
+
+    def consume_dirty_rects(self) -> list[pygame.Rect]:
+        """Return the changed regions and reset them (empty = nothing to draw)."""
+        if self._full_redraw:
+            rects = [pygame.Rect(0, 0, WIDTH, HEIGHT)]
+        else:
+            rects = self._dirty_rects
+        self._dirty_rects = []
+        self._full_redraw = False
+        return rects
+
+    def render(self, screen: pygame.Surface) -> list[pygame.Rect]:
+        """
+        Redraw only the dirty part of the screen.
+
+        Drawing is clipped to the dirty area, so blits outside
+        of it cost almost nothing.
+
+        Sprites of the sprite layer are drawn last: the changed ones,
+        and all those inside the redrawn area.
+
+        Returns the rectangles that must be pushed to the display.
+        """
+        rects = self.consume_dirty_rects()
+        if rects:
+            clip = rects[0].unionall(rects[1:])
+            screen.set_clip(clip)
+            # Static layer replaces the "clear screen" step
+            screen.blit(self.get_static_layer(screen), clip, clip)
+            self.draw(screen)
+            screen.set_clip(None)
+
+            # Sprites in the redrawn area were covered by the static layer
+            if self.sprite_layer is not None:
+                for sprite in self.sprite_layer:
+                    if sprite.rect.colliderect(clip):
+                        sprite.dirty = 1
+
+        if self.sprite_layer is not None:
+            rects += self.sprite_layer.draw(screen, self.get_static_layer(screen))
+        return rects
@@ -0,0 +1,192 @@
+# logic/answer_archive.py
+"""
+Binary archive of every answered question.
+
+Each question event is ONE fixed-width 32 byte record:
+
+    a, b        int32    operands
+    typed       int64    typed answer (-1 = nothing typed, time ran out)
+    response    float32  seconds from showing the question to the answer
+    limit       float32  time limit of the question (seconds)
+    op          uint8    OP_ADD / OP_MUL
+    correct     uint8    1 = correct
+    (6 bytes padding)
+
+after a 16 byte header (b"ANSW", version, record size).
+
+Because every record has the same size, analytics do not parse
+anything: the file is memory-mapped as a NumPy structured array
+(load_records) and aggregated with vectorized operations.
+
+Writing is buffered in memory and appended by a background thread.
+
+Summary of the archive:
+    python -m logic.answer_archive
+"""
+
+from __future__ import annotations
+
+import argparse
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency (analytics only)
+    np = None
+
+ARCHIVE_PATH = Path("data/answers.bin")
+
+_MAGIC = b"ANSW"
+_VERSION = 1
+HEADER = struct.Struct("<4sHH8x")
+RECORD = struct.Struct("<iiqffBB6x")
+
+# NumPy view of RECORD (same layout, byte for byte)
+if np is not None:
+    RECORD_DTYPE = np.dtype(
+        [
+            ("a", "<i4"),
+            ("b", "<i4"),
+            ("typed", "<i8"),
+            ("response", "<f4"),
+            ("limit", "<f4"),
+            ("op", "u1"),
+            ("correct", "u1"),
+            ("pad", "V6"),
+        ]
+    )
+    assert RECORD_DTYPE.itemsize == RECORD.size
+
+
+class AnswerArchive:
+    """Append-only writer of question events."""
+
+    def __init__(self, path: Path | None = None):
+        self.path = path
+        self._buffer = bytearray()
+        self._executor: ThreadPoolExecutor | None = None
+
+        # Counters
+        self.records: int = 0
+        self.failures: int = 0
+
+    def _path(self) -> Path:
+        return ARCHIVE_PATH if self.path is None else self.path
+
+    def open(self, path: Path | None) -> None:
+        """Switch to another file (None = ARCHIVE_PATH)."""
+        self.flush(wait=True)
+        self.path = path
+
+    def append(
+        self, op: int, a: int, b: int, typed: int, correct: bool, response: float, limit: float
+    ) -> None:
+        """Add one event to the in-memory buffer (cheap, no IO)."""
+        self._buffer += RECORD.pack(a, b, typed, response, limit, op, int(correct))
+        self.records += 1
+
+    def flush(self, wait: bool = False) -> None:
+        """Hand the buffered records to the background writer."""
+        if self._buffer:
+            data, self._buffer = bytes(self._buffer), bytearray()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="answer-archive")
+            self._executor.submit(self._write, self._path(), data)
+
+        if wait and self._executor is not None:
+            # Single worker: this runs after every earlier write
+            self._executor.submit(lambda: None).result()
+
+    def _write(self, path: Path, data: bytes) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "ab") as file:
+                size = file.tell()
+                if size < HEADER.size:
+                    # New file (or torn header): start over
+                    file.truncate(0)
+                    file.write(HEADER.pack(_MAGIC, _VERSION, RECORD.size))
+                elif (size - HEADER.size) % RECORD.size:
+                    # Torn last record (crash during a write): cut it off,
+                    # otherwise every later record would be misaligned
+                    file.truncate(size - (size - HEADER.size) % RECORD.size)
+                file.write(data)
+        except OSError:
+            # Analytics data is never worth crashing the game
+            self.failures += 1
+
+
+# Shared by the whole game
+answer_archive = AnswerArchive()
+
+
+# --------------------------------------------------
+# Analytics (NumPy)
+# --------------------------------------------------
+def load_records(path: Path | None = None):
+    """
+    Memory-map the archive as a read-only NumPy structured array.
+
+    Nothing is read until it is used. No file yet = no records. A torn last record (crash
+    during a write) is ignored; the writer cuts it off before the next
+    append.
+    """
+    if np is None:
+        raise ImportError("NumPy is required for answer archive analytics")
+
+    path = ARCHIVE_PATH if path is None else path
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
+        size = 0  # nothing archived yet
+    count = (size - HEADER.size) // RECORD.size
+    if count <= 0:
+        return np.zeros(0, dtype=RECORD_DTYPE)
+
+    with open(path, "rb") as file:
+        magic, version, record_size = HEADER.unpack(file.read(HEADER.size))
+    if magic != _MAGIC or version != _VERSION or record_size != RECORD.size:
+        raise ValueError(f"{path} is not an answer archive (version {_VERSION})")
+
+    return np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER.size, shape=(count,))
+
+
+def summary(records, bins: int = 20) -> dict:
+    """Accuracy and response time distribution, per operator and overall."""
+    result = {}
+    for name, mask in (("all", None), ("add", records["op"] == 0), ("mul", records["op"] == 1)):
+        selected = records if mask is None else records[mask]
+        if len(selected) == 0:
+            continue
+
+        response = selected["response"]
+        counts, edges = np.histogram(response, bins=bins)
+        result[name] = {
+            "answers": int(len(selected)),
+            "accuracy": float(selected["correct"].mean()),
+            "response_p50": float(np.percentile(response, 50)),
+            "response_p95": float(np.percentile(response, 95)),
+            "response_p99": float(np.percentile(response, 99)),
+            "histogram": {"counts": counts.tolist(), "edges": edges.tolist()},
+        }
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Answer archive summary")
+    parser.add_argument("path", nargs="?", default=str(ARCHIVE_PATH), help="archive file")
+    args = parser.parse_args()
+
+    records = load_records(Path(args.path))
+    for name, stats in summary(records).items():
+        print(
+            f"{name:>4}: {stats['answers']} answers, accuracy {stats['accuracy']:.1%}, "
+            f"response p50 {stats['response_p50']:.2f}s  p95 {stats['response_p95']:.2f}s  "
+            f"p99 {stats['response_p99']:.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
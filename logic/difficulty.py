@@ -7,25 +7,28 @@ This module contains ONLY one responsibility:
 
 Keeping it separate makes the game logic cleaner
 and very easy to explain.
+
+The defaults are the game's constants; other values are only used
+to try out alternatives (tools/difficulty_tuner.py).
 """
 
 from core.constants import TIME_DECAY, MIN_TIME_LIMIT
 
 
-def next_time_limit(current_limit: float) -> float:
+def next_time_limit(current_limit: float, decay: float = TIME_DECAY, min_limit: float = MIN_TIME_LIMIT) -> float:
     """
     Calculate the next time limit.
 
     Each level:
-    - time is multiplied by TIME_DECAY
-    - but never goes below MIN_TIME_LIMIT
+    - time is multiplied by TIME_DECAY (decay)
+    - but never goes below MIN_TIME_LIMIT (min_limit)
 
     Example:
         6.0 -> 5.52 -> 5.07 -> ...
     """
-    new_limit = current_limit * TIME_DECAY
+    new_limit = current_limit * decay
 
-    if new_limit < MIN_TIME_LIMIT:
-        return MIN_TIME_LIMIT
+    if new_limit < min_limit:
+        return min_limit
 
     return new_limit
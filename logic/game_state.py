@@ -0,0 +1,148 @@
+# logic/game_state.py
+"""
+GameState – the rules of one game, without pygame.
+
+Level, score, the shrinking time limit, the current question and
+game over live here; GameScene only shows them and feeds in the
+keys, and the network server (net/server.py) runs one GameState per
+connected player.
+
+Time is passed in by the caller as `now` (seconds on ANY monotonic
+clock: the scheduler clock in GameScene, the event loop clock in the
+server). The state never reads a clock and never sets a timer: it only
+tells the caller when the current question expires (deadline).
+
+    state = GameState(bank.next_question)
+    state.start(now)
+    answer = state.check_prefix(value, digits, now)  # after every key
+    answer = state.expire(now)                      # at the deadline
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+from core.constants import AUTO_SUBMIT, EARLY_REJECT, START_TIME_LIMIT
+from interfaces.question import BaseQuestion, PrefixMatch
+from logic.difficulty import next_time_limit
+
+# Answer results (also the "result" label of the response histograms)
+CORRECT = "correct"
+WRONG = "wrong"
+TIMEOUT = "timeout"
+
+
+class Answer:
+    """Outcome of one question (what the answer archive records)."""
+
+    __slots__ = ("question", "typed", "result", "response", "time_limit")
+
+    def __init__(self, question: BaseQuestion, typed: int, result: str, response: float, time_limit: float):
+        self.question = question
+        self.typed = typed            # typed value, -1 = nothing typed
+        self.result = result          # CORRECT / WRONG / TIMEOUT
+        self.response = response      # seconds from showing the question
+        self.time_limit = time_limit  # limit the question had
+
+    @property
+    def correct(self) -> bool:
+        return self.result == CORRECT
+
+
+class GameState:
+    """One game: questions until a wrong answer or a timeout."""
+
+    __slots__ = (
+        "next_question", "start_limit", "level", "score", "time_limit",
+        "deadline", "shown_at", "started_at", "question", "over", "wrong_prefix",
+    )
+
+    def __init__(self, next_question: Callable[[], BaseQuestion], start_limit: float = START_TIME_LIMIT):
+        """next_question: where questions come from (e.g. a QuestionBank)."""
+        self.next_question = next_question
+        self.start_limit = start_limit
+        self.reset()
+
+    def reset(self) -> None:
+        """New game with a new question (the clock starts with start())."""
+        self.level: int = 1
+        self.score: int = 0
+        self.time_limit: float = self.start_limit
+        self.deadline: float | None = None
+        self.shown_at: float = 0.0
+        self.started_at: float = time.time()  # wall clock, for the history
+        self.question: BaseQuestion = self.next_question()
+        self.over: bool = False
+        self.wrong_prefix: bool = False  # typed digits can no longer match
+
+    def start(self, now: float) -> None:
+        """The first question is on screen: its time starts running."""
+        self.shown_at = now
+        self.deadline = now + self.time_limit
+
+    def time_left(self, now: float) -> float:
+        """Seconds left for the current question."""
+        if self.deadline is None:
+            return self.time_limit
+        return max(self.deadline - now, 0.0)
+
+    # --------------------------------------------------
+    # Answers (each returns the Answer, or None if nothing happened)
+    # --------------------------------------------------
+    def check_prefix(self, value: int, digits: int, now: float) -> Answer | None:
+        """
+        Check the digits typed so far (value as integer, digit count).
+
+        A prefix that can never match is reported in wrong_prefix
+        (backspace can still fix it), and:
+        - EARLY_REJECT: it is a wrong answer at once
+        - AUTO_SUBMIT : the correct answer is submitted without ENTER
+        """
+        match = self.question.match_prefix(value, digits)
+        self.wrong_prefix = match is PrefixMatch.WRONG
+        if (match is PrefixMatch.WRONG and EARLY_REJECT) or (match is PrefixMatch.EXACT and AUTO_SUBMIT):
+            return self.submit(value, digits, now)
+        return None
+
+    def submit(self, value: int, digits: int, now: float) -> Answer | None:
+        """
+        Submit the typed answer.
+
+        Correct -> next level: a new question and a shorter time limit.
+        Wrong   -> game over.
+        Late    -> a timeout (the time-up timer may not have run yet).
+        """
+        if self.over:
+            return None
+        if self.deadline is not None and now >= self.deadline:
+            return self.expire(now, value, digits)
+        correct = self.question.match_prefix(value, digits) is PrefixMatch.EXACT
+        answer = Answer(
+            self.question, value if digits else -1, CORRECT if correct else WRONG, now - self.shown_at, self.time_limit
+        )
+
+        if correct:
+            self.score += 1
+            self.level += 1
+
+            # Make next level faster
+            self.time_limit = next_time_limit(self.time_limit)
+            self.question = self.next_question()
+            self.wrong_prefix = False
+            self.start(now)
+        else:
+            self.over = True
+        return answer
+
+    def expire(self, now: float, value: int = 0, digits: int = 0) -> Answer | None:
+        """
+        Time is up: game over (value/digits: what was typed meanwhile).
+
+        None if the deadline has not passed yet, e.g. a stale timer of
+        a question that was answered meanwhile.
+        """
+        if self.over or self.deadline is None or now < self.deadline:
+            return None
+        self.over = True
+        return Answer(self.question, value if digits else -1, TIMEOUT, now - self.shown_at, self.time_limit)
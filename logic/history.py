@@ -0,0 +1,330 @@
+# logic/history.py
+"""
+Session history and leaderboard.
+
+Every finished game is stored in a local SQLite database (WAL mode):
+score, level reached, first/last time limit and start/end timestamps.
+
+Fast queries, even with millions of sessions:
+- top(n)            : indexed ORDER BY score DESC LIMIT n
+- best_of_day(day)  : indexed lookup on (day, score)
+- rank / percentile : in-memory Fenwick tree over score values, O(log n)
+
+The Fenwick tree is rebuilt on start from the small `score_counts`
+table (one row per DISTINCT score), not from all sessions. GameApp's
+AssetLoader builds it while the loading screen is shown
+(load_index), so the game loop never opens the database for it.
+
+Inserts happen on a background writer thread (never on the game loop);
+queued sessions are written together in one transaction. Every
+COMPACT_EVERY sessions the WAL is checkpointed and truncated.
+
+Show the leaderboard:
+    python -m logic.history --top 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import queue
+import sqlite3
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+HISTORY_PATH = Path("data/history.db")
+
+# Checkpoint + truncate the WAL after this many inserted sessions
+COMPACT_EVERY: int = 10_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id          INTEGER PRIMARY KEY,
+    score       INTEGER NOT NULL,
+    level       INTEGER NOT NULL,
+    start_limit REAL    NOT NULL,
+    final_limit REAL    NOT NULL,
+    started_at  REAL    NOT NULL,
+    ended_at    REAL    NOT NULL,
+    day         TEXT    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_score ON sessions (score DESC, ended_at);
+CREATE INDEX IF NOT EXISTS sessions_day_score ON sessions (day, score);
+CREATE TABLE IF NOT EXISTS score_counts (
+    score INTEGER PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+"""
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    """Open the database (creating it if needed) in WAL mode."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(_SCHEMA)
+    return connection
+
+
+class ScoreIndex:
+    """
+    Fenwick (binary indexed) tree: how many sessions have each score.
+
+    add() and count_below() are O(log max_score).
+    """
+
+    def __init__(self, capacity: int = 256):
+        self.tree = [0] * (capacity + 1)
+        self.total: int = 0
+
+    def add(self, score: int, count: int = 1) -> None:
+        score = max(score, 0)
+        if score + 1 >= len(self.tree):
+            self._grow(score + 1)
+
+        i = score + 1  # tree is 1-based
+        while i < len(self.tree):
+            self.tree[i] += count
+            i += i & -i
+        self.total += count
+
+    def count_below(self, score: int) -> int:
+        """Number of sessions with a score strictly lower than `score`."""
+        i = min(max(score, 0), len(self.tree) - 1)
+        result = 0
+        while i > 0:
+            result += self.tree[i]
+            i -= i & -i
+        return result
+
+    def count_above(self, score: int) -> int:
+        """Number of sessions with a score strictly higher than `score`."""
+        return self.total - self.count_below(score + 1)
+
+    def _grow(self, needed: int) -> None:
+        # Rebuild with double capacity (rare: only when scores grow)
+        counts = [self.count_below(s + 1) - self.count_below(s) for s in range(len(self.tree) - 1)]
+        capacity = len(self.tree) - 1
+        while capacity < needed:
+            capacity *= 2
+        self.tree = [0] * (capacity + 1)
+        self.total = 0
+        for score, count in enumerate(counts):
+            if count:
+                self.add(score, count)
+
+
+class HistoryStore:
+    """Session history: background inserts, indexed queries, in-memory ranks."""
+
+    def __init__(self, path: Path | None = None):
+        self.path = path
+        self._index: ScoreIndex | None = None  # loaded by load_index / on first use
+        self._index_lock = threading.Lock()
+        self._reader: sqlite3.Connection | None = None
+
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+
+        # Counters
+        self.inserted: int = 0
+        self.failures: int = 0
+        self.last_error: str | None = None
+
+    def _path(self) -> Path:
+        return HISTORY_PATH if self.path is None else self.path
+
+    def open(self, path: Path | None) -> None:
+        """Switch to another database (None = HISTORY_PATH)."""
+        self.flush()
+        if self._reader is not None:
+            self._reader.close()
+        self.path = path
+        self._index = None
+        self._reader = None
+
+    # --------------------------------------------------
+    # Recording
+    # --------------------------------------------------
+    def record(
+        self,
+        score: int,
+        level: int,
+        start_limit: float,
+        final_limit: float,
+        started_at: float,
+        ended_at: float | None = None,
+    ) -> None:
+        """Store a finished session. Returns at once; the insert runs in the background."""
+        ended_at = time.time() if ended_at is None else ended_at
+        day = datetime.fromtimestamp(ended_at).date().isoformat()
+
+        self._ensure_index().add(score)
+        self._queue.put((score, level, start_limit, final_limit, started_at, ended_at, day))
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._writer, name="history-writer", daemon=True)
+            self._thread.start()
+
+    def flush(self) -> None:
+        """Wait until all recorded sessions are in the database."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+
+    def _writer(self) -> None:
+        connection: sqlite3.Connection | None = None
+        connected_path: Path | None = None
+        since_compact = 0
+        while True:
+            rows = [self._queue.get()]
+            # Take everything that is already queued: one transaction
+            while not self._queue.empty():
+                rows.append(self._queue.get_nowait())
+
+            try:
+                # (Re)connect if the store was switched to another file
+                if connection is None or connected_path != self._path():
+                    if connection is not None:
+                        connection.close()
+                    connected_path = self._path()
+                    connection = connect(connected_path)
+
+                with connection:
+                    connection.executemany(
+                        "INSERT INTO sessions (score, level, start_limit, final_limit,"
+                        " started_at, ended_at, day) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                    connection.executemany(
+                        "INSERT INTO score_counts (score, count) VALUES (?, 1)"
+                        " ON CONFLICT (score) DO UPDATE SET count = count + 1",
+                        [(row[0],) for row in rows],
+                    )
+                self.inserted += len(rows)
+                since_compact += len(rows)
+                if since_compact >= COMPACT_EVERY:
+                    self._compact(connection)
+                    since_compact = 0
+            except (sqlite3.Error, OSError) as error:
+                # OSError: data directory cannot be created
+                self.failures += len(rows)
+                self.last_error = str(error)
+            finally:
+                for _ in rows:
+                    self._queue.task_done()
+
+    @staticmethod
+    def _compact(connection: sqlite3.Connection) -> None:
+        """Move the WAL into the database file and truncate it."""
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        connection.execute("PRAGMA optimize")
+
+    # --------------------------------------------------
+    # Queries
+    # --------------------------------------------------
+    def load_index(self) -> None:
+        """
+        Build the rank index now, if not built yet (any thread).
+
+        Uses its own short-lived connection: the reader connection
+        belongs to the game thread. Without a database file the index
+        starts empty and no file is created.
+        """
+        with self._index_lock:
+            if self._index is not None:
+                return
+            index = ScoreIndex()
+            if not self._path().exists():
+                # Nothing recorded yet: the database is created by the first record()
+                self._index = index
+                return
+            try:
+                connection = connect(self._path())
+                try:
+                    rows = connection.execute("SELECT score, count FROM score_counts").fetchall()
+                finally:
+                    connection.close()
+            except (sqlite3.Error, OSError):
+                rows = []
+            for score, count in rows:
+                index.add(score, count)
+            self._index = index
+
+    def _ensure_index(self) -> ScoreIndex:
+        if self._index is None:
+            self.load_index()
+        return self._index
+
+    def _read(self, sql: str, params: tuple = ()) -> list[tuple]:
+        """Run a query on the reader connection (empty result if the DB is unusable)."""
+        try:
+            if self._reader is None:
+                self._reader = connect(self._path())
+            return self._reader.execute(sql, params).fetchall()
+        except (sqlite3.Error, OSError):
+            return []
+
+    def total(self) -> int:
+        return self._ensure_index().total
+
+    def rank(self, score: int) -> int:
+        """1-based leaderboard position of `score` (ties share a rank)."""
+        return self._ensure_index().count_above(score) + 1
+
+    def percentile(self, score: int) -> float:
+        """Percent of all sessions with a LOWER score (0 - 100)."""
+        index = self._ensure_index()
+        if index.total == 0:
+            return 0.0
+        return 100.0 * index.count_below(score) / index.total
+
+    def top(self, n: int = 10) -> list[dict]:
+        """Best n sessions (uses the score index)."""
+        rows = self._read(
+            "SELECT score, level, ended_at FROM sessions ORDER BY score DESC, ended_at LIMIT ?",
+            (n,),
+        )
+        return [{"score": s, "level": lvl, "ended_at": t} for s, lvl, t in rows]
+
+    def best_of_day(self, day: date | str | None = None) -> int | None:
+        """Best score of one day (default: today), None if nobody played."""
+        day = day or date.today()
+        day = day if isinstance(day, str) else day.isoformat()
+        rows = self._read("SELECT MAX(score) FROM sessions WHERE day = ?", (day,))
+        return rows[0][0] if rows else None
+
+    def compact(self) -> None:
+        """Checkpoint the WAL now (normally done automatically)."""
+        self.flush()
+        try:
+            connection = connect(self._path())
+            try:
+                self._compact(connection)
+            finally:
+                connection.close()
+        except sqlite3.Error as error:
+            self.last_error = str(error)
+
+
+# Shared by the whole game
+history_store = HistoryStore()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Session history / leaderboard")
+    parser.add_argument("--top", type=int, default=10, help="show the best N sessions")
+    parser.add_argument("--compact", action="store_true", help="checkpoint the WAL")
+    args = parser.parse_args()
+
+    if args.compact:
+        history_store.compact()
+
+    print(f"sessions: {history_store.total()}, best today: {history_store.best_of_day()}")
+    for position, entry in enumerate(history_store.top(args.top), start=1):
+        ended = datetime.fromtimestamp(entry["ended_at"]).strftime("%Y-%m-%d %H:%M")
+        print(f"{position:>3}. {entry['score']:>4}  (level {entry['level']}, {ended})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+# logic/question_bank.py
+"""
+QuestionBank – generates questions in large batches.
+
+Creating one BaseQuestion object per question (several random calls,
+an f-string and an object) is fine for ONE player, but far too slow for
+simulators and bulk worksheet exports.
+
+The bank generates a whole batch at once and stores it column-wise:
+
+    op[i], a[i], b[i], answer[i]
+
+Text is built only when a question is actually shown (question(i) /
+text(i)), and question(i) returns a normal BaseQuestion, so
+is_correct() keeps working.
+
+NumPy is optional: with NumPy a batch is generated with vectorized
+operations (millions of questions per second); without it the bank
+falls back to a plain Python loop.
+
+Export a worksheet:
+    python -m logic.question_bank --count 100000 --out worksheet.txt
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from array import array
+from typing import Iterator
+
+from core.constants import ADD_MIN, ADD_MAX, MUL_MIN, MUL_MAX
+from logic import questions
+from logic.questions import OP_ADD, OP_MUL, OperandQuestion, question_text
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+
+class QuestionBank:
+    """Column-wise storage of generated questions."""
+
+    def __init__(self, batch_size: int = 1024, seed: int | None = None):
+        """
+        batch_size : questions generated per refill of next_question()
+        seed       : own seed; None = take seeds from logic.questions.rng
+                     (so questions.seed() makes the bank reproducible too)
+        """
+        self.batch_size = batch_size
+        self._seed_rng = random.Random(seed) if seed is not None else None
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self.answer)
+
+    def _next_seed(self) -> int:
+        return (self._seed_rng or questions.rng).getrandbits(64)
+
+    # --------------------------------------------------
+    # Generation
+    # --------------------------------------------------
+    def generate(self, count: int) -> None:
+        """Replace the bank content with `count` new mixed questions."""
+        if np is not None:
+            self._generate_numpy(count)
+        else:
+            self._generate_python(count)
+        self.cursor = 0
+
+    def _generate_numpy(self, count: int) -> None:
+        generator = np.random.default_rng(self._next_seed())
+
+        op = generator.integers(OP_ADD, OP_MUL + 1, count, dtype=np.int32)
+        is_add = op == OP_ADD
+        a = np.where(
+            is_add,
+            generator.integers(ADD_MIN, ADD_MAX + 1, count, dtype=np.int32),
+            generator.integers(MUL_MIN, MUL_MAX + 1, count, dtype=np.int32),
+        )
+        b = np.where(
+            is_add,
+            generator.integers(ADD_MIN, ADD_MAX + 1, count, dtype=np.int32),
+            generator.integers(MUL_MIN, MUL_MAX + 1, count, dtype=np.int32),
+        )
+
+        self.op, self.a, self.b = op, a, b
+        self.answer = np.where(is_add, a + b, a * b)
+
+    def _generate_python(self, count: int) -> None:
+        rng = random.Random(self._next_seed())
+        op, a, b, answer = array("i"), array("i"), array("i"), array("i")
+
+        for _ in range(count):
+            if rng.random() < 0.5:
+                x = rng.randint(ADD_MIN, ADD_MAX)
+                y = rng.randint(ADD_MIN, ADD_MAX)
+                op.append(OP_ADD)
+                answer.append(x + y)
+            else:
+                x = rng.randint(MUL_MIN, MUL_MAX)
+                y = rng.randint(MUL_MIN, MUL_MAX)
+                op.append(OP_MUL)
+                answer.append(x * y)
+            a.append(x)
+            b.append(y)
+
+        self.op, self.a, self.b, self.answer = op, a, b, answer
+
+    # --------------------------------------------------
+    # Access
+    # --------------------------------------------------
+    def question(self, index: int) -> OperandQuestion:
+        """Question number `index` as a normal BaseQuestion."""
+        return OperandQuestion(int(self.op[index]), int(self.a[index]), int(self.b[index]))
+
+    def text(self, index: int) -> str:
+        return question_text(int(self.op[index]), int(self.a[index]), int(self.b[index]))
+
+    def texts(self, start: int = 0, stop: int | None = None) -> Iterator[str]:
+        """Texts of questions start..stop (exclusive)."""
+        stop = len(self) if stop is None else stop
+        for index in range(start, stop):
+            yield self.text(index)
+
+    def clear(self) -> None:
+        """Drop all generated questions (next_question() starts a new batch)."""
+        self.op = self.a = self.b = self.answer = array("i")
+        self.cursor = 0
+
+    def next_question(self) -> OperandQuestion:
+        """Next unused question; generates a new batch when empty."""
+        if self.cursor >= len(self):
+            self.generate(self.batch_size)
+
+        question = self.question(self.cursor)
+        self.cursor += 1
+        return question
+
+    def write_worksheet(self, path: str, with_answers: bool = False) -> None:
+        """Write all questions of the bank, one per line."""
+        with open(path, "w", encoding="utf-8") as file:
+            for index in range(len(self)):
+                line = self.text(index)
+                if with_answers:
+                    line = f"{line} {int(self.answer[index])}"
+                file.write(line + "\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export a math worksheet")
+    parser.add_argument("--count", type=int, default=100, help="number of questions")
+    parser.add_argument("--seed", type=int, help="RNG seed")
+    parser.add_argument("--answers", action="store_true", help="include answers")
+    parser.add_argument("--out", default="worksheet.txt", help="output file")
+    args = parser.parse_args()
+
+    bank = QuestionBank(seed=args.seed)
+    bank.generate(args.count)
+    bank.write_worksheet(args.out, with_answers=args.answers)
+    print(f"{args.count} questions written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
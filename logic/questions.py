@@ -6,10 +6,32 @@ This file contains VERY SIMPLE question types.
 No tricks, no complex logic – easy to explain in defense.
 
 All question classes inherit from BaseQuestion.
+
+All randomness goes through the module-level `rng`, so a run can be
+made reproducible with seed() (used by the headless simulation).
 """
 
 import random
 from interfaces.question import BaseQuestion
+from core.constants import ADD_MIN, ADD_MAX, MUL_MIN, MUL_MAX
+
+# Shared random generator for every question type
+rng = random.Random()
+
+# Operator codes (used by OperandQuestion and logic/question_bank.py)
+OP_ADD: int = 0
+OP_MUL: int = 1
+OP_SYMBOLS = ("+", "×")
+
+
+def seed(value: int | None) -> None:
+    """Seed the question generator (None = random seed)."""
+    rng.seed(value)
+
+
+def question_text(op: int, a: int, b: int) -> str:
+    """Text shown to the player, e.g. "7 + 5 = ?"."""
+    return f"{a} {OP_SYMBOLS[op]} {b} = ?"
 
 
 class AddQuestion(BaseQuestion):
@@ -19,8 +41,8 @@ class AddQuestion(BaseQuestion):
     """
 
     def generate(self) -> None:
-        a = random.randint(1, 20)
-        b = random.randint(1, 20)
+        a = rng.randint(ADD_MIN, ADD_MAX)
+        b = rng.randint(ADD_MIN, ADD_MAX)
 
         self.text = f"{a} + {b} = ?"
         self.answer = a + b
@@ -33,8 +55,8 @@ class MulQuestion(BaseQuestion):
     """
 
     def generate(self) -> None:
-        a = random.randint(2, 10)
-        b = random.randint(2, 10)
+        a = rng.randint(MUL_MIN, MUL_MAX)
+        b = rng.randint(MUL_MIN, MUL_MAX)
 
         self.text = f"{a} × {b} = ?"
         self.answer = a * b
@@ -51,13 +73,32 @@ class MixedQuestion(BaseQuestion):
     """
 
     def generate(self) -> None:
-        if random.choice([True, False]):
-            a = random.randint(1, 20)
-            b = random.randint(1, 20)
+        if rng.choice([True, False]):
+            a = rng.randint(ADD_MIN, ADD_MAX)
+            b = rng.randint(ADD_MIN, ADD_MAX)
             self.text = f"{a} + {b} = ?"
             self.answer = a + b
         else:
-            a = random.randint(2, 10)
-            b = random.randint(2, 10)
+            a = rng.randint(MUL_MIN, MUL_MAX)
+            b = rng.randint(MUL_MIN, MUL_MAX)
             self.text = f"{a} × {b} = ?"
             self.answer = a * b
+
+
+class OperandQuestion(BaseQuestion):
+    """
+    Question with KNOWN operands (nothing random).
+
+    Used to show a question that was generated elsewhere,
+    e.g. by the batched QuestionBank.
+    """
+
+    def __init__(self, op: int, a: int, b: int) -> None:
+        self.op = op
+        self.a = a
+        self.b = b
+        super().__init__()
+
+    def generate(self) -> None:
+        self.text = question_text(self.op, self.a, self.b)
+        self.answer = self.a + self.b if self.op == OP_ADD else self.a * self.b
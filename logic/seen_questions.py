@@ -0,0 +1,219 @@
+# logic/seen_questions.py
+"""
+Remembers which questions the player has already seen.
+
+The question space is finite:
+- addition      : a, b in ADD_MIN..ADD_MAX  (20 x 20 = 400 questions)
+- multiplication: a, b in MUL_MIN..MUL_MAX  ( 9 x  9 =  81 questions)
+
+Every question gets an id, and one BIT per id records "seen".
+New questions are drawn only from the unseen ones; when all questions
+of an operator were seen, a new round starts for that operator.
+
+Sampling is O(1): the unseen ids are kept in a pool, a random slot is
+taken and the last id moves into its place (swap-remove).
+
+The bits are saved to a small binary file, so repeats are avoided
+across sessions too. save() only takes a snapshot; a write-behind
+thread (like HighScoreStore's) writes it, never the game loop:
+
+    header : b"SEEN", version, number of sets
+    per set: op, low, high (operand range), then the bitset bytes
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import threading
+from array import array
+from pathlib import Path
+
+from core.constants import ADD_MIN, ADD_MAX, MUL_MIN, MUL_MAX
+from logic import questions
+from logic.questions import OP_ADD, OP_MUL, OperandQuestion
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+SEEN_PATH = Path("data/seen_questions.bin")
+
+_MAGIC = b"SEEN"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBB")
+_SET_HEADER = struct.Struct("<BII")
+
+
+class SeenSet:
+    """Seen-bits of ONE operator over the square operand range low..high."""
+
+    def __init__(self, op: int, low: int, high: int):
+        self.op = op
+        self.low = low
+        self.high = high
+        self.span = high - low + 1
+        self.size = self.span * self.span
+
+        self.bits = bytearray((self.size + 7) // 8)
+        self.pool = array("I", range(self.size))  # unseen ids
+
+    def is_seen(self, question_id: int) -> bool:
+        return bool(self.bits[question_id >> 3] & (1 << (question_id & 7)))
+
+    def operands(self, question_id: int) -> tuple[int, int]:
+        a, b = divmod(question_id, self.span)
+        return a + self.low, b + self.low
+
+    def sample(self, rng) -> int:
+        """Take a random unseen id and mark it seen (starts a new round if none left)."""
+        if not self.pool:
+            self.reset()
+
+        index = rng.randrange(len(self.pool))
+        question_id = self.pool[index]
+
+        # Swap-remove: O(1)
+        last = self.pool.pop()
+        if index < len(self.pool):
+            self.pool[index] = last
+
+        self.bits[question_id >> 3] |= 1 << (question_id & 7)
+        return question_id
+
+    def reset(self) -> None:
+        """Forget everything (new round)."""
+        self.bits = bytearray(len(self.bits))
+        self.pool = array("I", range(self.size))
+
+    def load_bits(self, bits: bytes) -> None:
+        """Restore saved bits and rebuild the pool of unseen ids."""
+        self.bits = bytearray(bits)
+        if np is not None:
+            flags = np.unpackbits(np.frombuffer(self.bits, dtype=np.uint8), bitorder="little")
+            unseen = np.flatnonzero(flags[: self.size] == 0).astype(np.uint32)
+            self.pool = array("I", unseen.tobytes())
+        else:
+            self.pool = array("I", (i for i in range(self.size) if not self.is_seen(i)))
+
+
+class SeenQuestions:
+    """Unseen-first question source for GameScene (one SeenSet per operator)."""
+
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path) if path is not None else SEEN_PATH
+        self.sets: dict[int, SeenSet] | None = None  # loaded on first use
+
+        # Writer thread state (guarded by _condition)
+        self._condition = threading.Condition()
+        self._pending: tuple[Path, bytes] | None = None
+        self._writing: bool = False
+        self._thread: threading.Thread | None = None
+
+    def open(self, path: str | Path) -> None:
+        """Switch to another file (loaded again on next use). Pending writes are flushed first."""
+        self.flush()
+        self.path = Path(path)
+        self.sets = None
+
+    def _ensure_loaded(self) -> dict[int, SeenSet]:
+        if self.sets is None:
+            self.sets = {
+                OP_ADD: SeenSet(OP_ADD, ADD_MIN, ADD_MAX),
+                OP_MUL: SeenSet(OP_MUL, MUL_MIN, MUL_MAX),
+            }
+            self.load()
+        return self.sets
+
+    def next_question(self) -> OperandQuestion:
+        """Random unseen question; addition and multiplication 50/50."""
+        sets = self._ensure_loaded()
+        op = OP_ADD if questions.rng.random() < 0.5 else OP_MUL
+        seen_set = sets[op]
+        a, b = seen_set.operands(seen_set.sample(questions.rng))
+        return OperandQuestion(op, a, b)
+
+    # --------------------------------------------------
+    # File
+    # --------------------------------------------------
+    def load(self) -> None:
+        """
+        Load saved bits.
+
+        A missing / broken file, or a set whose operand range no longer
+        matches the constants, simply starts from "nothing seen".
+        """
+        sets = self.sets
+        try:
+            data = self.path.read_bytes()
+            magic, version, count = _HEADER.unpack_from(data, 0)
+            if magic != _MAGIC or version != _VERSION:
+                return
+
+            offset = _HEADER.size
+            for _ in range(count):
+                op, low, high = _SET_HEADER.unpack_from(data, offset)
+                offset += _SET_HEADER.size
+                length = ((high - low + 1) ** 2 + 7) // 8
+                bits = data[offset:offset + length]
+                offset += length
+
+                seen_set = sets.get(op)
+                if seen_set and (seen_set.low, seen_set.high) == (low, high) and len(bits) == length:
+                    seen_set.load_bits(bits)
+        except (OSError, struct.error):
+            return
+
+    def save(self) -> None:
+        """Queue a snapshot of all bits for the writer thread (no IO here)."""
+        if self.sets is None:
+            return
+
+        parts = [_HEADER.pack(_MAGIC, _VERSION, len(self.sets))]
+        for seen_set in self.sets.values():
+            parts.append(_SET_HEADER.pack(seen_set.op, seen_set.low, seen_set.high))
+            parts.append(bytes(seen_set.bits))
+
+        with self._condition:
+            # An older snapshot not written yet is simply replaced
+            self._pending = (self.path, b"".join(parts))
+            self._ensure_thread()
+            self._condition.notify()
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Wait until the queued snapshot is written. Returns False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._pending is None and not self._writing, timeout
+            )
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._writer, name="seen-questions-writer", daemon=True)
+            self._thread.start()
+
+    def _writer(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None)
+                (path, data), self._pending = self._pending, None
+                self._writing = True
+
+            # Temp file + rename, so the file is never torn
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(".tmp")
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, path)
+            except OSError:
+                # Losing "seen" history is not worth crashing the game
+                pass
+
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
+
+
+# Used by GameScene
+default_index = SeenQuestions()
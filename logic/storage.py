@@ -9,16 +9,28 @@ Responsibilities:
 - Load high score from file
 - Save high score to file
 - Handle errors safely (file missing / corrupted)
+
+HighScoreStore (used by the game) adds:
+- the high score is cached in memory after the first load
+- saving happens on a background writer thread, never on the game loop
+- several quick updates are merged into ONE write
+- writes are atomic (temp file + rename): a crash never leaves a torn file
+- write latency and failures are counted (see stats())
 """
 
+from __future__ import annotations
+
 import json
+import os
+import threading
+import time
 from pathlib import Path
 
 # File path for saving high score
 FILE_PATH = Path("data/highscore.json")
 
 
-def load_highscore() -> int:
+def load_highscore(path: Path | None = None) -> int:
     """
     Load high score from file.
 
@@ -26,11 +38,12 @@ def load_highscore() -> int:
         int: saved high score
              0 if file does not exist or is invalid
     """
+    path = FILE_PATH if path is None else path
     try:
-        if not FILE_PATH.exists():
+        if not path.exists():
             return 0
 
-        with open(FILE_PATH, "r", encoding="utf-8") as file:
+        with open(path, "r", encoding="utf-8") as file:
             data = json.load(file)
             return int(data.get("highscore", 0))
 
@@ -39,19 +52,128 @@ def load_highscore() -> int:
         return 0
 
 
-def save_highscore(score: int) -> None:
+def save_highscore(score: int, path: Path | None = None) -> None:
     """
-    Save new high score to file.
+    Save new high score to file (synchronously, atomic).
 
-    Creates directory if needed.
+    Creates directory if needed. Raises OSError if saving fails.
     """
-    try:
-        FILE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    path = FILE_PATH if path is None else path
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write a temp file next to the target, then rename over it.
+    # os.replace is atomic: readers see the old or the new file, never half.
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump({"highscore": score}, file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, path)
+
+
+class HighScoreStore:
+    """Cached high score with a write-behind background writer."""
+
+    def __init__(self, path: Path | None = None):
+        self.path = path
+        self._cached: int | None = None
+
+        # Writer thread state (guarded by _condition)
+        self._condition = threading.Condition()
+        self._pending: int | None = None
+        self._writing: bool = False
+        self._thread: threading.Thread | None = None
+
+        # Counters
+        self.writes: int = 0
+        self.failures: int = 0
+        self.merged: int = 0
+        self.last_error: str | None = None
+        self.last_write_ms: float = 0.0
+        self.max_write_ms: float = 0.0
+        self.total_write_ms: float = 0.0
+
+    def open(self, path: Path | None) -> None:
+        """Switch to another file (None = FILE_PATH). Pending writes are flushed first."""
+        self.flush()
+        self.path = path
+        self._cached = None
+
+    def get(self) -> int:
+        """Current high score (file is read only the first time)."""
+        if self._cached is None:
+            self._cached = load_highscore(self.path)
+        return self._cached
+
+    def submit(self, score: int) -> bool:
+        """
+        Offer a new score. If it beats the high score, it is cached and
+        queued for writing. Returns True if it is a new high score.
+        """
+        if score <= self.get():
+            return False
+
+        self._cached = score
+        with self._condition:
+            if self._pending is not None:
+                self.merged += 1  # previous value never hit the disk
+            self._pending = score
+            self._ensure_thread()
+            self._condition.notify()
+        return True
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Wait until everything queued is written. Returns False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._pending is None and not self._writing, timeout
+            )
+
+    def stats(self) -> dict:
+        attempts = self.writes + self.failures
+        return {
+            "writes": self.writes,
+            "failures": self.failures,
+            "merged": self.merged,
+            "last_error": self.last_error,
+            "last_write_ms": self.last_write_ms,
+            "max_write_ms": self.max_write_ms,
+            "avg_write_ms": self.total_write_ms / attempts if attempts else 0.0,
+        }
+
+    # --------------------------------------------------
+    # Writer thread
+    # --------------------------------------------------
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._writer, name="highscore-writer", daemon=True)
+            self._thread.start()
+
+    def _writer(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None)
+                score, self._pending = self._pending, None
+                path = self.path
+                self._writing = True
+
+            start = time.perf_counter()
+            try:
+                save_highscore(score, path)
+                self.writes += 1
+            except OSError as error:
+                # Game must never crash because of file IO, but we count it
+                self.failures += 1
+                self.last_error = str(error)
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+            self.last_write_ms = elapsed_ms
+            self.max_write_ms = max(self.max_write_ms, elapsed_ms)
+            self.total_write_ms += elapsed_ms
+
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
 
-        with open(FILE_PATH, "w", encoding="utf-8") as file:
-            json.dump({"highscore": score}, file)
 
-    except OSError:
-        # If saving fails, we silently ignore
-        # (game should never crash because of file IO)
-        pass
+# Shared by the whole game
+highscore_store = HighScoreStore()
@@ -4,14 +4,70 @@ Entry point of the project.
 
 Run:
     python main.py
+    python main.py --record input.json   (record input for core/simulation.py)
+    python main.py --profile frames.json (export frame timings on exit, F3 = overlay)
+    python main.py --metrics-port 9108   (latency histograms at http://127.0.0.1:9108/metrics)
+    python main.py --metrics-file data/metrics.prom (same, written to a file every 15 s)
+    python main.py --low-latency         (wait on input instead of clock.tick, see core/app.py)
+    python main.py --connect 127.0.0.1:8765 (play on a game server, see net/server.py)
+    python main.py --renderer texture --window-size 1920x1080 (scaled window, see core/renderers.py)
 """
 
+import argparse
+
 from core.app import GameApp
+from core.telemetry import telemetry
 
 
 def main() -> None:
     """Create the app and start the main loop."""
-    app = GameApp()
+    parser = argparse.ArgumentParser(description="Math Escape Game")
+    parser.add_argument("--record", help="save all input events to this JSON file")
+    parser.add_argument("--profile", help="write per-phase frame timings to this JSON file on exit")
+    parser.add_argument("--metrics-port", type=int, help="serve Prometheus metrics on this localhost port")
+    parser.add_argument("--metrics-file", help="write Prometheus metrics to this file (every 15 s and on exit)")
+    parser.add_argument("--low-latency", action="store_true", help="draw key presses at once, precise frame pacing")
+    parser.add_argument("--connect", metavar="HOST:PORT", help="play on a game server (python -m net.server)")
+    parser.add_argument("--renderer", choices=("software", "texture"), default="software", help="display backend")
+    parser.add_argument("--window-size", metavar="WxH", help="window size (texture renderer scales to it)")
+    parser.add_argument("--fullscreen", action="store_true", help="fullscreen at desktop resolution (texture renderer)")
+    args = parser.parse_args()
+
+    window_size = None
+    if args.window_size:
+        try:
+            width, height = (int(value) for value in args.window_size.lower().split("x"))
+        except ValueError:
+            parser.error("--window-size must look like 1920x1080")
+        window_size = (width, height)
+    if (window_size or args.fullscreen) and args.renderer != "texture":
+        parser.error("--window-size / --fullscreen need --renderer texture")
+
+    if args.connect:
+        from core.registry import register_scene
+        from net.protocol import split_address
+
+        # The server runs the game: only the game scene is replaced
+        register_scene("game", "ui.remote_game_scene:RemoteGameScene", address=split_address(args.connect))
+
+    app = GameApp(
+        profile_path=args.profile,
+        metrics_path=args.metrics_file,
+        low_latency=args.low_latency,
+        renderer=args.renderer,
+        window_size=window_size,
+        fullscreen=args.fullscreen,
+    )
+
+    if args.metrics_port:
+        telemetry.serve(args.metrics_port)
+    if args.metrics_file:
+        telemetry.start_file_writer(args.metrics_file)
+
+    if args.record:
+        from core.simulation import EventRecorder
+        app.recorder = EventRecorder(args.record)
+
     app.run()
 
 
@@ -0,0 +1,77 @@
+# net/client.py
+"""
+Client side connection to the game server (used by the pygame client,
+ui/remote_game_scene.py).
+
+A blocking socket with a reader thread: every message from the server
+is handed to `on_message` ON THE READER THREAD. The pygame client only
+posts it as an event there (pygame.event.post is thread safe), so the
+game loop never waits for the network.
+
+    connection = Connection(("127.0.0.1", 8765), on_message)
+    connection.send({"type": "start"})
+    connection.close()
+"""
+
+from __future__ import annotations
+
+import socket
+import threading
+from typing import Callable
+
+from net import protocol
+
+# Seconds to wait for the server when connecting
+CONNECT_TIMEOUT: float = 3.0
+
+
+class Connection:
+    """One connection to the game server."""
+
+    def __init__(self, address: tuple[str, int], on_message: Callable[[dict], None]):
+        """Connect (OSError if the server cannot be reached) and start reading."""
+        self.on_message = on_message
+        self.sock = socket.create_connection(address, timeout=CONNECT_TIMEOUT)
+        self.sock.settimeout(None)
+        # Small messages that should leave at once (every key press)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.closed = False
+
+        self._reader = threading.Thread(target=self._read, name="net-reader", daemon=True)
+        self._reader.start()
+
+    def send(self, message: dict) -> None:
+        """Send one message (a lost connection is reported as an error message)."""
+        if self.closed:
+            return
+        try:
+            self.sock.sendall(protocol.encode(message))
+        except OSError as error:
+            self._lost(error)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+
+    def _read(self) -> None:
+        try:
+            with self.sock.makefile("rb") as lines:
+                for line in lines:
+                    self.on_message(protocol.decode(line))
+            self._lost(None)
+        except (OSError, ValueError) as error:
+            self._lost(error)
+
+    def _lost(self, error: Exception | None) -> None:
+        if self.closed:
+            return  # closed on purpose
+        self.closed = True
+        self.sock.close()
+        reason = str(error) if error is not None else "server closed the connection"
+        self.on_message({"type": protocol.ERROR, "message": f"connection lost: {reason}", "lost": True})
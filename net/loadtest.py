@@ -0,0 +1,135 @@
+# net/loadtest.py
+"""
+Load test for the game server: many simulated players in one process.
+
+Every player is a small asyncio task with its own connection. It plays
+like core/simulation.AutoPlayer: it "thinks" for a random time, then
+types the answer digit by digit (one "input" message per key, like the
+real client, then "submit" for ENTER unless AUTO_SUBMIT is on),
+sometimes wrong; after a game over it starts a new game.
+
+Measured on the player side: the round trip from the key that answers
+a question to the next question (or game over).
+Watch the server's own "us/msg" and "us/player/s" output for its cost.
+
+Run (server in another terminal: python -m net.server):
+    python -m net.loadtest --players 2000 --seconds 30
+    python -m net.loadtest --connect 192.168.1.10:8765 --players 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+
+from core.constants import AUTO_SUBMIT
+from net import protocol
+
+
+class LoadStats:
+    def __init__(self):
+        self.games = 0
+        self.answers = 0
+        self.errors = 0
+        self.round_trips: list[float] = []  # seconds
+
+
+async def play(address: tuple[str, int], rng: random.Random, stats: LoadStats, stop: asyncio.Event,
+               think: tuple[float, float], error_rate: float) -> None:
+    """One simulated player, until `stop` is set."""
+    try:
+        reader, writer = await asyncio.open_connection(*address, limit=protocol.MAX_LINE)
+    except OSError:
+        stats.errors += 1
+        return
+    try:
+        writer.write(protocol.encode({"type": protocol.START}))
+        message = protocol.decode(await reader.readline())
+        while not stop.is_set():
+            kind = message["type"]
+            if kind == protocol.ERROR:
+                stats.errors += 1
+                message = protocol.decode(await reader.readline())
+                continue
+            if kind == protocol.OVER:
+                stats.games += 1
+                await asyncio.sleep(rng.uniform(*think))
+                writer.write(protocol.encode({"type": protocol.START}))
+                message = protocol.decode(await reader.readline())
+                continue
+
+            # A question "a op b = ?": think (the time may run out meanwhile)
+            try:
+                message = protocol.decode(await asyncio.wait_for(reader.readline(), rng.uniform(*think)))
+                continue  # time is up: "over" arrived while thinking
+            except asyncio.TimeoutError:
+                pass
+
+            a, op, b = message["text"].split()[:3]
+            answer = int(a) + int(b) if op == "+" else int(a) * int(b)
+            if rng.random() < error_rate:
+                answer += 1 if answer % 10 < 9 else -1  # wrong in the last digit only
+
+            # One message per key, like the real client. The reply comes
+            # for the last digit (AUTO_SUBMIT) or for ENTER
+            text = str(answer)
+            for length in range(1, len(text)):
+                writer.write(protocol.encode({"type": protocol.INPUT, "text": text[:length]}))
+            sent = time.perf_counter()
+            writer.write(protocol.encode({"type": protocol.INPUT if AUTO_SUBMIT else protocol.SUBMIT, "text": text}))
+            await writer.drain()
+
+            message = protocol.decode(await reader.readline())
+            stats.round_trips.append(time.perf_counter() - sent)
+            stats.answers += 1
+    except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+        stats.errors += 1
+    finally:
+        writer.close()
+
+
+async def run(address: tuple[str, int], players: int, seconds: float, think: tuple[float, float],
+              error_rate: float, seed: int) -> LoadStats:
+    stats = LoadStats()
+    stop = asyncio.Event()
+    tasks = []
+    for index in range(players):
+        rng = random.Random(seed * 1_000_003 + index)
+        tasks.append(asyncio.create_task(play(address, rng, stats, stop, think, error_rate)))
+        if index % 100 == 99:
+            await asyncio.sleep(0.01)  # do not flood the listen backlog
+
+    await asyncio.sleep(seconds)
+    stop.set()
+    await asyncio.wait(tasks, timeout=max(think[1], 1.0) + 1.0)
+    for task in tasks:
+        task.cancel()
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test the game server with simulated players")
+    parser.add_argument("--connect", default="", help="server host:port")
+    parser.add_argument("--players", type=int, default=500, help="simulated players")
+    parser.add_argument("--seconds", type=float, default=20.0, help="test duration")
+    parser.add_argument("--think", type=float, nargs=2, default=(0.5, 3.0), help="min/max seconds per answer")
+    parser.add_argument("--error-rate", type=float, default=0.05, help="wrong answer rate")
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed")
+    args = parser.parse_args()
+
+    address = protocol.split_address(args.connect)
+    stats = asyncio.run(run(address, args.players, args.seconds, tuple(args.think), args.error_rate, args.seed))
+
+    ordered = sorted(stats.round_trips) or [0.0]
+
+    def ms(p: float) -> float:
+        return ordered[int(p / 100.0 * (len(ordered) - 1))] * 1000.0
+
+    print(f"{args.players} players, {stats.answers} answers, {stats.games} games, {stats.errors} errors")
+    print(f"answer -> reply: p50 {ms(50):.2f} ms  p95 {ms(95):.2f} ms  p99 {ms(99):.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
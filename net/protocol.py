@@ -0,0 +1,71 @@
+# net/protocol.py
+"""
+Line protocol between the game server (net/server.py) and its clients.
+
+Plain TCP, one JSON object per line (UTF-8, ends with "\\n"), every
+object has a "type". No third-party library on either side.
+
+Client -> server:
+    {"type": "start"}                   start a new game
+    {"type": "input", "text": "12"}     digits typed so far (after every key)
+    {"type": "submit", "text": "12"}    ENTER
+
+Server -> client:
+    {"type": "question", "text": "7 + 5 = ?", "level": 2, "score": 1,
+     "time_limit": 5.52, "time_left": 5.52}
+    {"type": "over", "result": "wrong", "answer": 12, "level": 2, "score": 1}
+    {"type": "error", "message": "..."}
+
+The server owns the rules and the clock (logic/game_state.py): the
+client only shows what it gets, sends what is typed, and counts
+time_left down on its own clock until the next message.
+"""
+
+from __future__ import annotations
+
+import json
+
+DEFAULT_HOST: str = "127.0.0.1"
+DEFAULT_PORT: int = 8765
+
+# Longest accepted line (bytes); anything longer closes the connection
+MAX_LINE: int = 1024
+
+# Same limit as the InputBox
+MAX_DIGITS: int = 13
+
+# Client -> server
+START = "start"
+INPUT = "input"
+SUBMIT = "submit"
+
+# Server -> client
+QUESTION = "question"
+OVER = "over"
+ERROR = "error"
+
+
+def encode(message: dict) -> bytes:
+    """One message as a line."""
+    return json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def decode(line: bytes) -> dict:
+    """One line as a message (ValueError if it is not one)."""
+    message = json.loads(line)
+    if not isinstance(message, dict) or not isinstance(message.get("type"), str):
+        raise ValueError("not a message")
+    return message
+
+
+def parse_digits(text) -> tuple[int, int]:
+    """Typed text -> (value, digits), like InputBox keeps them (ValueError if invalid)."""
+    if not isinstance(text, str) or len(text) > MAX_DIGITS or (text and not text.isdigit()):
+        raise ValueError(f"invalid answer text {text!r}")
+    return (int(text) if text else 0), len(text)
+
+
+def split_address(address: str) -> tuple[str, int]:
+    """"host:port", "host" or ":port" -> (host, port) with the defaults filled in."""
+    host, _, port = address.rpartition(":") if ":" in address else (address, "", "")
+    return host or DEFAULT_HOST, int(port) if port else DEFAULT_PORT
@@ -0,0 +1,294 @@
+# net/server.py
+"""
+Game server: many players, one process, no pygame.
+
+Every connection is one player with its own GameState
+(logic/game_state.py) - the same rules GameScene uses - and the
+server only moves messages in and out (net/protocol.py).
+
+Cheap per player:
+- ONE timer heap for all deadlines (core/scheduler.Scheduler on the
+  event loop clock) and ONE event loop timer armed for its first
+  entry - not one asyncio timer or task per player
+- ONE QuestionBank for all players: questions are generated in large
+  batches (vectorized with NumPy when available)
+- a connection is a plain asyncio.Protocol (Session), not a task
+  with a stream reader: a message is parsed straight from the received
+  bytes, handled with one GameState call and answered with one write;
+  the server never waits for a client
+
+Run (a whole classroom on one machine):
+    python -m net.server
+    python -m net.server --host 0.0.0.0 --port 8765 --stats 10
+Players connect with:
+    python main.py --connect 192.168.1.10:8765
+Load test with simulated players: python -m net.loadtest --players 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+from functools import partial
+
+from core.scheduler import Scheduler, Timer
+from logic.game_state import CORRECT, TIMEOUT, WRONG, Answer, GameState
+from logic.question_bank import QuestionBank
+from net import protocol
+
+# Questions generated per QuestionBank refill (shared by all players)
+QUESTION_BATCH: int = 65536
+
+# A client that does not read its messages is dropped at this many
+# unsent bytes (the server never waits for one slow client)
+MAX_BUFFERED: int = 64 * 1024
+
+log = logging.getLogger(__name__)
+
+
+class Session(asyncio.Protocol):
+    """One connected player (the protocol instance of its connection)."""
+
+    __slots__ = ("server", "state", "transport", "timer", "_pending")
+
+    def __init__(self, server: GameServer):
+        self.server = server
+        self.state = GameState(server.bank.next_question)
+        self.transport: asyncio.Transport | None = None
+        self.timer: Timer | None = None  # deadline of the current question
+        self._pending = b""  # start of a line not complete yet
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self.transport = transport
+        self.server.sessions.add(self)
+        self.server.connections += 1
+
+    def data_received(self, data: bytes) -> None:
+        *lines, self._pending = (self._pending + data).split(b"\n")
+        if len(self._pending) > protocol.MAX_LINE:
+            log.warning("dropping %s: line longer than %d bytes", self._peer(), protocol.MAX_LINE)
+            self.transport.close()
+            return
+        for line in lines:
+            if line and not self.transport.is_closing():
+                self.server.handle(self, line)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        if exc is not None:
+            log.info("connection to %s lost: %s", self._peer(), exc)
+        if self.timer is not None:
+            self.timer.cancel()
+        self.server.sessions.discard(self)
+
+    def send(self, message: dict) -> None:
+        if self.transport.is_closing():
+            return
+        self.transport.write(protocol.encode(message))
+        if self.transport.get_write_buffer_size() > MAX_BUFFERED:
+            log.warning("dropping %s: not reading its messages", self._peer())
+            self.transport.close()
+
+    def _peer(self) -> str:
+        peer = self.transport.get_extra_info("peername") if self.transport is not None else None
+        return f"{peer[0]}:{peer[1]}" if peer else "client"
+
+
+class GameServer:
+    """Hosts one GameState per connection over the line protocol."""
+
+    def __init__(self, batch_size: int = QUESTION_BATCH, seed: int | None = None):
+        self.bank = QuestionBank(batch_size=batch_size, seed=seed)
+        self.scheduler: Scheduler | None = None  # created on the running loop (start)
+        self.sessions: set[Session] = set()
+        self._server: asyncio.AbstractServer | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        # The one event loop timer: (due, handle) of the earliest deadline
+        self._wakeup: asyncio.TimerHandle | None = None
+        self._wakeup_due: float | None = None
+
+        # Counters
+        self.connections: int = 0
+        self.games: int = 0
+        self.messages: int = 0
+        self.answers: dict[str, int] = {CORRECT: 0, WRONG: 0, TIMEOUT: 0}
+
+    async def start(self, host: str = protocol.DEFAULT_HOST, port: int = protocol.DEFAULT_PORT) -> None:
+        self._loop = asyncio.get_running_loop()
+        self.scheduler = Scheduler(clock=self._loop.time)
+        self._server = await self._loop.create_server(lambda: Session(self), host, port)
+
+    @property
+    def port(self) -> int:
+        """Port actually listened on (useful with port=0)."""
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        async with self._server:
+            await self._server.serve_forever()
+
+    def close(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+        if self._server is not None:
+            self._server.close()
+        for session in list(self.sessions):
+            session.transport.close()
+
+    def stats(self) -> dict:
+        return {
+            "sessions": len(self.sessions),
+            "connections": self.connections,
+            "games": self.games,
+            "messages": self.messages,
+            "answers": dict(self.answers),
+        }
+
+    # --------------------------------------------------
+    # Messages
+    # --------------------------------------------------
+    def handle(self, session: Session, line: bytes) -> None:
+        """Handle one message of a player."""
+        self.messages += 1
+        state = session.state
+        try:
+            message = protocol.decode(line)
+            kind = message["type"]
+            if kind == protocol.START:
+                self.games += 1
+                state.reset()
+                state.start(self.scheduler.now())
+                self._arm(session)
+                self._send_question(session)
+            elif kind == protocol.INPUT or kind == protocol.SUBMIT:
+                if state.deadline is None or state.over:
+                    raise ValueError("no game running")
+                value, digits = protocol.parse_digits(message.get("text"))
+                if kind == protocol.INPUT:
+                    answer = state.check_prefix(value, digits, self.scheduler.now())
+                else:
+                    answer = state.submit(value, digits, self.scheduler.now())
+                if answer is not None:
+                    self._on_answer(session, answer)
+            else:
+                raise ValueError(f"unknown message type {kind!r}")
+        except ValueError as error:
+            session.send({"type": protocol.ERROR, "message": str(error)})
+
+    def _send_question(self, session: Session) -> None:
+        state = session.state
+        session.send(
+            {
+                "type": protocol.QUESTION,
+                "text": state.question.text,
+                "level": state.level,
+                "score": state.score,
+                "time_limit": state.time_limit,
+                "time_left": state.time_left(self.scheduler.now()),
+            },
+        )
+
+    def _on_answer(self, session: Session, answer: Answer) -> None:
+        self.answers[answer.result] += 1
+        state = session.state
+        if not state.over:
+            self._arm(session)
+            self._send_question(session)
+            return
+
+        if session.timer is not None:
+            session.timer.cancel()
+            session.timer = None
+        session.send(
+            {
+                "type": protocol.OVER,
+                "result": answer.result,
+                "answer": answer.question.answer,
+                "level": state.level,
+                "score": state.score,
+            },
+        )
+
+    # --------------------------------------------------
+    # Deadlines: one heap, one event loop timer
+    # --------------------------------------------------
+    def _arm(self, session: Session) -> None:
+        """(Re)schedule the deadline of the session's current question."""
+        if session.timer is not None:
+            session.timer.cancel()
+        due = session.state.deadline
+        session.timer = self.scheduler.call_at(due, partial(self._expire, session), owner=session)
+        if self._wakeup_due is None or due < self._wakeup_due:
+            self._wake_at(due)
+
+    def _wake_at(self, due: float) -> None:
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+        self._wakeup_due = due
+        self._wakeup = self._loop.call_at(due, self._run_timers)
+
+    def _run_timers(self) -> None:
+        self._wakeup = self._wakeup_due = None
+        self.scheduler.run_due()
+        delay = self.scheduler.next_deadline()
+        if delay is not None:
+            self._wake_at(self.scheduler.now() + delay)
+
+    def _expire(self, session: Session) -> None:
+        answer = session.state.expire(self.scheduler.now())
+        if answer is not None:
+            self._on_answer(session, answer)
+
+
+async def _log_stats(server: GameServer, interval: float) -> None:
+    """One line every `interval` seconds: players, messages/s and CPU cost."""
+    last_cpu, last_messages = time.process_time(), server.messages
+    while True:
+        await asyncio.sleep(interval)
+        cpu, messages = time.process_time(), server.messages
+        handled = messages - last_messages
+        sessions = len(server.sessions)
+        cpu_us = (cpu - last_cpu) * 1e6
+        log.info(
+            "%d players, %.0f msg/s, cpu %.1f%%, %.1f us/msg, %.1f us/player/s",
+            sessions,
+            handled / interval,
+            cpu_us / interval / 1e4,
+            cpu_us / handled if handled else 0.0,
+            cpu_us / interval / sessions if sessions else 0.0,
+        )
+        last_cpu, last_messages = cpu, messages
+
+
+async def _serve(host: str, port: int, stats_interval: float, seed: int | None) -> None:
+    server = GameServer(seed=seed)
+    await server.start(host, port)
+    print(f"game server on {host}:{server.port}")
+    stats = asyncio.create_task(_log_stats(server, stats_interval)) if stats_interval > 0 else None
+    try:
+        await server.serve_forever()
+    finally:
+        if stats is not None:
+            stats.cancel()
+        server.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Math game server (many players, one process)")
+    parser.add_argument("--host", default=protocol.DEFAULT_HOST, help="address to listen on (0.0.0.0 = LAN)")
+    parser.add_argument("--port", type=int, default=protocol.DEFAULT_PORT, help="TCP port")
+    parser.add_argument("--stats", type=float, default=10.0, help="log load statistics every N seconds (0 = off)")
+    parser.add_argument("--seed", type=int, help="question RNG seed")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    try:
+        asyncio.run(_serve(args.host, args.port, args.stats, args.seed))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+# tests/conftest.py
+"""
+Shared test setup.
+
+- SDL dummy drivers: no window, no audio device
+- every test session runs in a temporary working directory, so the
+  relative data paths (data/highscore.json, data/history.db, ...)
+  never touch the real data files
+
+Run (from the project root):
+    python -m pytest -q
+"""
+
+import os
+
+# Must be set BEFORE pygame is initialised
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _temporary_cwd(tmp_path_factory):
+    previous = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("cwd"))
+    yield
+    os.chdir(previous)
@@ -0,0 +1,84 @@
+# tests/test_answer_archive.py
+"""Fixed-width answer records, torn-tail recovery and the NumPy view."""
+
+import pytest
+
+from logic.answer_archive import HEADER, RECORD, AnswerArchive, load_records, summary
+from logic.questions import OP_ADD, OP_MUL
+
+pytest.importorskip("numpy")  # analytics (load_records) need NumPy
+
+FIELDS = ["a", "b", "typed", "response", "limit", "op", "correct"]
+
+
+def _rows(records):
+    return records[FIELDS].tolist()
+
+
+def test_records_round_trip(tmp_path):
+    path = tmp_path / "answers.bin"
+    archive = AnswerArchive(path)
+    archive.append(OP_ADD, 3, 4, 7, True, 1.5, 6.0)
+    archive.append(OP_MUL, 5, 6, -1, False, 6.25, 6.0)
+    archive.flush(wait=True)
+
+    assert path.stat().st_size == HEADER.size + 2 * RECORD.size
+    assert _rows(load_records(path)) == [(3, 4, 7, 1.5, 6.0, 0, 1), (5, 6, -1, 6.25, 6.0, 1, 0)]
+
+
+def test_torn_last_record_is_ignored(tmp_path):
+    path = tmp_path / "answers.bin"
+    archive = AnswerArchive(path)
+    archive.append(OP_ADD, 1, 2, 3, True, 1.0, 6.0)
+    archive.flush(wait=True)
+    with open(path, "ab") as file:
+        file.write(b"x" * 13)
+
+    assert len(load_records(path)) == 1
+
+
+def test_append_after_a_torn_record_stays_aligned(tmp_path):
+    path = tmp_path / "answers.bin"
+    archive = AnswerArchive(path)
+    archive.append(OP_ADD, 1, 2, 3, True, 1.0, 6.0)
+    archive.flush(wait=True)
+    with open(path, "ab") as file:
+        file.write(b"x" * 13)
+
+    archive.append(OP_MUL, 5, 5, 25, True, 2.5, 4.0)
+    archive.flush(wait=True)
+    assert _rows(load_records(path)) == [(1, 2, 3, 1.0, 6.0, 0, 1), (5, 5, 25, 2.5, 4.0, 1, 1)]
+
+
+def test_torn_header_starts_a_new_file(tmp_path):
+    path = tmp_path / "answers.bin"
+    path.write_bytes(b"ANS")
+    archive = AnswerArchive(path)
+    archive.append(OP_ADD, 7, 8, 15, True, 1.0, 6.0)
+    archive.flush(wait=True)
+    assert _rows(load_records(path)) == [(7, 8, 15, 1.0, 6.0, 0, 1)]
+
+
+def test_missing_file_has_no_records(tmp_path):
+    assert len(load_records(tmp_path / "missing.bin")) == 0
+
+
+def test_foreign_file_is_rejected(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"NOPE" + bytes(HEADER.size - 4 + RECORD.size))
+    with pytest.raises(ValueError):
+        load_records(path)
+
+
+def test_summary_per_operator(tmp_path):
+    path = tmp_path / "answers.bin"
+    archive = AnswerArchive(path)
+    for i in range(10):
+        archive.append(OP_ADD, i, i, 2 * i, i % 2 == 0, 1.0 + i, 6.0)
+    archive.append(OP_MUL, 2, 3, 6, True, 2.0, 6.0)
+    archive.flush(wait=True)
+
+    result = summary(load_records(path))
+    assert result["all"]["answers"] == 11
+    assert result["add"]["accuracy"] == 0.5
+    assert result["mul"]["answers"] == 1
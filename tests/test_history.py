@@ -0,0 +1,87 @@
+# tests/test_history.py
+"""Fenwick-tree rank index and the SQLite session history."""
+
+import random
+
+from logic.history import HistoryStore, ScoreIndex
+
+
+def _brute_below(scores, score):
+    return sum(1 for s in scores if s < score)
+
+
+def test_score_index_matches_brute_force():
+    rng = random.Random(1)
+    scores = [rng.randrange(0, 60) for _ in range(500)]
+    index = ScoreIndex(capacity=64)
+    for score in scores:
+        index.add(score)
+
+    assert index.total == len(scores)
+    for score in range(-1, 70):
+        assert index.count_below(score) == _brute_below(scores, score)
+        assert index.count_above(score) == sum(1 for s in scores if s > score)
+
+
+def test_score_index_grows_and_keeps_counts():
+    index = ScoreIndex(capacity=4)
+    index.add(2, 3)
+    index.add(1000)
+    assert len(index.tree) > 1001
+    assert index.total == 4
+    assert index.count_below(3) == 3
+    assert index.count_above(2) == 1
+
+
+def test_negative_scores_count_as_zero():
+    index = ScoreIndex()
+    index.add(-5)
+    assert index.count_below(1) == 1
+
+
+def test_record_rank_and_top(tmp_path):
+    store = HistoryStore(tmp_path / "history.db")
+    for score in (3, 7, 5, 7):
+        store.record(score, score + 1, 6.0, 3.0, started_at=1000.0, ended_at=2000.0 + score)
+    store.flush()
+
+    assert store.failures == 0 and store.inserted == 4
+    assert store.total() == 4
+    assert store.rank(7) == 1
+    assert store.rank(5) == 3
+    assert store.percentile(5) == 25.0
+    assert [entry["score"] for entry in store.top(3)] == [7, 7, 5]
+
+
+def test_index_is_rebuilt_from_the_database(tmp_path):
+    path = tmp_path / "history.db"
+    store = HistoryStore(path)
+    for score in (1, 2, 2, 9):
+        store.record(score, 1, 6.0, 6.0, started_at=0.0)
+    store.flush()
+
+    reopened = HistoryStore(path)
+    reopened.load_index()
+    assert reopened.total() == 4
+    assert reopened.rank(2) == 2
+
+
+def test_load_index_without_database_creates_no_file(tmp_path):
+    path = tmp_path / "data" / "history.db"
+    store = HistoryStore(path)
+    store.load_index()
+    assert store.total() == 0
+    assert not path.parent.exists()
+
+
+def test_writer_survives_an_unusable_directory(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("not a directory")
+    store = HistoryStore(blocker / "history.db")
+
+    store.record(1, 1, 6.0, 6.0, started_at=0.0)
+    store.flush()
+    store.record(2, 1, 6.0, 6.0, started_at=0.0)
+    store.flush()
+    assert store.failures == 2
+    assert store._thread.is_alive()
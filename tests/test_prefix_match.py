@@ -0,0 +1,77 @@
+# tests/test_prefix_match.py
+"""Incremental answer checking: match_prefix and GameState.check_prefix."""
+
+import pytest
+
+from interfaces.question import PrefixMatch
+from logic import game_state
+from logic.game_state import CORRECT, WRONG, GameState
+from logic.questions import OP_ADD, OP_MUL, OperandQuestion
+
+
+def _question(a: int = 62, b: int = 62, op: int = OP_ADD) -> OperandQuestion:
+    """Default: 62 + 62 = 124."""
+    return OperandQuestion(op, a, b)
+
+
+@pytest.mark.parametrize(
+    "value, digits, expected",
+    [
+        (0, 0, PrefixMatch.EMPTY),
+        (1, 1, PrefixMatch.PARTIAL),
+        (12, 2, PrefixMatch.PARTIAL),
+        (124, 3, PrefixMatch.EXACT),
+        (13, 2, PrefixMatch.WRONG),
+        (2, 1, PrefixMatch.WRONG),
+        (1240, 4, PrefixMatch.WRONG),  # too many digits
+    ],
+)
+def test_match_prefix(value, digits, expected):
+    assert _question().match_prefix(value, digits) is expected
+
+
+def test_leading_zero_is_wrong():
+    assert _question().match_prefix(0, 1) is PrefixMatch.WRONG
+
+
+def test_single_digit_answer():
+    question = _question(2, 3, OP_MUL)  # 6
+    assert question.answer_digits == 1
+    assert question.match_prefix(6, 1) is PrefixMatch.EXACT
+    assert question.match_prefix(7, 1) is PrefixMatch.WRONG
+
+
+def _state(*questions) -> GameState:
+    pending = list(questions)
+    state = GameState(lambda: pending.pop(0) if pending else _question())
+    state.start(0.0)
+    return state
+
+
+def test_wrong_prefix_is_reported_not_submitted(monkeypatch):
+    monkeypatch.setattr(game_state, "EARLY_REJECT", False)
+    state = _state(_question())
+    assert state.check_prefix(13, 2, 1.0) is None
+    assert state.wrong_prefix and not state.over
+
+    # Backspace fixes it
+    assert state.check_prefix(1, 1, 1.1) is None
+    assert not state.wrong_prefix
+
+
+def test_early_reject_ends_the_game(monkeypatch):
+    monkeypatch.setattr(game_state, "EARLY_REJECT", True)
+    state = _state(_question())
+    answer = state.check_prefix(13, 2, 1.0)
+    assert answer.result == WRONG and state.over
+
+
+@pytest.mark.parametrize("auto_submit", [True, False])
+def test_auto_submit(monkeypatch, auto_submit):
+    monkeypatch.setattr(game_state, "AUTO_SUBMIT", auto_submit)
+    state = _state(_question())
+    answer = state.check_prefix(124, 3, 1.0)
+    if auto_submit:
+        assert answer.result == CORRECT and state.level == 2
+    else:
+        assert answer is None and state.level == 1
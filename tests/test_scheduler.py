@@ -0,0 +1,108 @@
+# tests/test_scheduler.py
+"""Timer heap: ordering, cancelling, pause and missed-tick coalescing."""
+
+from core.scheduler import Scheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+def _scheduler():
+    clock = FakeClock()
+    return Scheduler(clock), clock
+
+
+def test_one_shot_fires_once_when_due():
+    scheduler, clock = _scheduler()
+    calls = []
+    scheduler.call_later(1.0, lambda: calls.append("a"))
+
+    clock.time = 0.99
+    assert scheduler.run_due() == 0
+    clock.time = 1.0
+    assert scheduler.run_due() == 1
+    clock.time = 5.0
+    assert scheduler.run_due() == 0
+    assert calls == ["a"]
+
+
+def test_order_by_due_then_registration():
+    scheduler, clock = _scheduler()
+    calls = []
+    scheduler.call_at(2.0, lambda: calls.append("late"))
+    scheduler.call_at(1.0, lambda: calls.append("first"))
+    scheduler.call_at(1.0, lambda: calls.append("second"))
+    clock.time = 3.0
+    scheduler.run_due()
+    assert calls == ["first", "second", "late"]
+
+
+def test_cancel_and_cancel_owner():
+    scheduler, clock = _scheduler()
+    calls = []
+    owner = object()
+    timer = scheduler.call_later(1.0, lambda: calls.append("timer"))
+    scheduler.call_every(0.5, lambda: calls.append("owned"), owner=owner)
+    scheduler.call_later(1.0, lambda: calls.append("other"))
+
+    timer.cancel()
+    scheduler.cancel_owner(owner)
+    clock.time = 2.0
+    scheduler.run_due()
+    assert calls == ["other"]
+    assert scheduler.remaining(timer) == 0.0
+
+
+def test_missed_intervals_fire_once_and_stay_on_the_grid():
+    scheduler, clock = _scheduler()
+    calls = []
+    scheduler.call_every(0.1, lambda: calls.append(clock.time))
+
+    clock.time = 0.35  # stalled frame: 0.1, 0.2 and 0.3 were missed
+    assert scheduler.run_due() == 1
+    assert scheduler.coalesced == 2
+    assert abs(scheduler.next_deadline() - 0.05) < 1e-9  # next due at 0.4
+
+    clock.time = 0.4
+    assert scheduler.run_due() == 1
+    assert len(calls) == 2
+
+
+def test_pause_freezes_time_and_deadlines():
+    scheduler, clock = _scheduler()
+    calls = []
+    scheduler.call_later(1.0, lambda: calls.append("due"))
+
+    clock.time = 0.5
+    scheduler.pause()
+    assert scheduler.next_deadline() is None
+    clock.time = 10.0
+    assert scheduler.now() == 0.5
+    assert scheduler.run_due() == 0
+
+    scheduler.resume()
+    assert scheduler.now() == 0.5
+    clock.time = 10.4
+    assert scheduler.run_due() == 0
+    clock.time = 10.5
+    assert scheduler.run_due() == 1
+    assert calls == ["due"]
+
+
+def test_next_deadline_skips_cancelled_timers():
+    scheduler, clock = _scheduler()
+    scheduler.call_later(1.0, lambda: None).cancel()
+    scheduler.call_later(3.0, lambda: None)
+    assert scheduler.next_deadline() == 3.0
+
+
+def test_set_clock_drops_all_timers():
+    scheduler, clock = _scheduler()
+    scheduler.call_later(1.0, lambda: None)
+    scheduler.set_clock(FakeClock())
+    assert scheduler.next_deadline() is None
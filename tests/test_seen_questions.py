@@ -0,0 +1,72 @@
+# tests/test_seen_questions.py
+"""Seen-question bitset, swap-remove pool and the saved file."""
+
+import random
+
+import pytest
+
+from logic import seen_questions
+from logic.questions import OP_ADD, OP_MUL
+from logic.seen_questions import SeenQuestions, SeenSet
+
+
+def test_sample_never_repeats_within_a_round():
+    seen_set = SeenSet(OP_ADD, 1, 5)  # 25 questions
+    rng = random.Random(1)
+    ids = [seen_set.sample(rng) for _ in range(seen_set.size)]
+    assert sorted(ids) == list(range(seen_set.size))
+    assert not seen_set.pool
+    assert all(seen_set.is_seen(i) for i in range(seen_set.size))
+
+
+def test_new_round_when_everything_was_seen():
+    seen_set = SeenSet(OP_ADD, 1, 2)
+    rng = random.Random(2)
+    for _ in range(seen_set.size):
+        seen_set.sample(rng)
+    question_id = seen_set.sample(rng)
+    assert seen_set.is_seen(question_id)
+    assert len(seen_set.pool) == seen_set.size - 1
+
+
+def test_operands_cover_the_range():
+    seen_set = SeenSet(OP_MUL, 2, 10)
+    operands = {seen_set.operands(i) for i in range(seen_set.size)}
+    assert operands == {(a, b) for a in range(2, 11) for b in range(2, 11)}
+
+
+@pytest.mark.parametrize("with_numpy", [True, False])
+def test_load_bits_rebuilds_the_pool(monkeypatch, with_numpy):
+    if not with_numpy:
+        monkeypatch.setattr(seen_questions, "np", None)
+    elif seen_questions.np is None:
+        pytest.skip("NumPy not installed")
+
+    original = SeenSet(OP_ADD, 1, 20)
+    rng = random.Random(3)
+    taken = {original.sample(rng) for _ in range(150)}
+
+    restored = SeenSet(OP_ADD, 1, 20)
+    restored.load_bits(bytes(original.bits))
+    assert sorted(restored.pool) == sorted(set(range(restored.size)) - taken)
+
+
+def test_saved_bits_survive_a_restart(tmp_path):
+    path = tmp_path / "seen.bin"
+    index = SeenQuestions(path)
+    shown = {(q.op, q.a, q.b) for q in (index.next_question() for _ in range(40))}
+    index.save()
+    assert index.flush()
+
+    restarted = SeenQuestions(path)
+    sets = restarted._ensure_loaded()
+    unseen = sum(len(seen_set.pool) for seen_set in sets.values())
+    total = sum(seen_set.size for seen_set in sets.values())
+    assert unseen == total - len(shown)
+
+
+def test_broken_file_starts_from_nothing_seen(tmp_path):
+    path = tmp_path / "seen.bin"
+    path.write_bytes(b"garbage")
+    sets = SeenQuestions(path)._ensure_loaded()
+    assert all(len(seen_set.pool) == seen_set.size for seen_set in sets.values())
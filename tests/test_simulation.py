@@ -0,0 +1,32 @@
+# tests/test_simulation.py
+"""Headless simulation: same seed, same run."""
+
+from pathlib import Path
+
+from core.simulation import Simulation
+from logic import storage
+
+
+def _run(seed: int, sessions: int = 3) -> dict:
+    simulation = Simulation(seed=seed)
+    try:
+        return simulation.run(sessions)
+    finally:
+        simulation.close()
+
+
+def test_runs_the_requested_sessions():
+    report = _run(seed=1)
+    assert report["sessions"] == 3
+    assert report["frames"] > 0
+
+
+def test_same_seed_same_frames():
+    assert _run(seed=2)["frames"] == _run(seed=2)["frames"]
+
+
+def test_real_data_files_are_restored():
+    before = storage.highscore_store.path
+    _run(seed=3, sessions=1)
+    assert storage.highscore_store.path == before
+    assert not Path("data/highscore.json").exists()
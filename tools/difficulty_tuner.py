@@ -0,0 +1,319 @@
+# tools/difficulty_tuner.py
+"""
+Monte Carlo tuner for the difficulty constants.
+
+START_TIME_LIMIT, TIME_DECAY and MIN_TIME_LIMIT (core/constants.py)
+decide how long a game lasts. This tool plays millions of games with
+synthetic players for every combination of candidate values and
+prints, for each one, the score distribution and the session length.
+
+Synthetic player (PLAYER_MODEL):
+- response time per question: log-normal by question type (median,
+  sigma of the log), times a skill factor drawn once per game
+  (log-normal, SKILL_SIGMA: some players are faster than others)
+- a wrong answer with a fixed probability per question type
+- a question is lost when the response time reaches the time limit
+The rules are the game's: addition / multiplication 50/50 like the
+QuestionBank, the limits come from logic/difficulty.next_time_limit,
+one lost question ends the game.
+
+--archive fits the model to recorded answers (data/answers.bin).
+Questions that timed out (response >= limit, with or without digits
+typed) are left out of the fit, so slow players look a bit faster
+than they are.
+
+Work is split into chunks of --chunk games, run on a process pool
+(all cores by default) with fixed per-chunk seeds: the result does
+not depend on the number of workers. With NumPy a chunk plays all
+its games level by level at once (vectorized); without NumPy game by
+game (much slower). pygame is never imported.
+
+Run:
+    python -m tools.difficulty_tuner
+    python -m tools.difficulty_tuner --games 2000000 --decay 0.88 0.90 0.92 0.94 --min-limit 1.0 1.5 2.0
+    python -m tools.difficulty_tuner --archive data/answers.bin --output sweep.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from core.constants import MIN_TIME_LIMIT, START_TIME_LIMIT, TIME_DECAY
+from logic.difficulty import next_time_limit
+from logic.questions import OP_ADD, OP_MUL
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency (pure Python fallback)
+    np = None
+
+# Question type -> (median response seconds, sigma of log response, wrong answer rate)
+PLAYER_MODEL: dict[str, tuple[float, float, float]] = {
+    "add": (1.6, 0.45, 0.03),
+    "mul": (2.1, 0.50, 0.06),
+}
+
+# Spread of the per-game skill factor (sigma of its log; 0 = all players alike)
+SKILL_SIGMA: float = 0.3
+
+# A game is cut off after this many questions (counted as a score of MAX_LEVELS)
+MAX_LEVELS: int = 300
+
+# Resolution of the session length distribution (seconds)
+LENGTH_BIN: float = 1.0
+
+# Games per work unit of the process pool
+CHUNK: int = 100_000
+
+
+def time_limits(start: float, decay: float, min_limit: float, levels: int = MAX_LEVELS) -> list[float]:
+    """Time limit of every level, exactly as the game shrinks it."""
+    limits = [start]
+    while len(limits) < levels:
+        limits.append(next_time_limit(limits[-1], decay, min_limit))
+    return limits
+
+
+# --------------------------------------------------
+# Simulation of one chunk (runs in a worker process)
+# --------------------------------------------------
+def simulate_chunk(job: tuple) -> tuple[tuple, dict]:
+    """Play `games` games of one parameter set. Returns (params, counts)."""
+    params, games, seed, model, skill_sigma = job
+    limits = time_limits(*params)
+    if np is not None:
+        scores, lengths, timeouts = _simulate_numpy(limits, games, seed, model, skill_sigma)
+    else:
+        scores, lengths, timeouts = _simulate_python(limits, games, seed, model, skill_sigma)
+    return params, {"scores": scores, "lengths": lengths, "timeouts": timeouts, "games": games}
+
+
+def _simulate_numpy(limits, games, seed, model, skill_sigma):
+    rng = np.random.default_rng(seed)
+    (add_median, add_sigma, add_error), (mul_median, mul_sigma, mul_error) = model["add"], model["mul"]
+
+    skill = rng.lognormal(0.0, skill_sigma, games) if skill_sigma > 0 else np.ones(games)
+    score = np.full(games, len(limits), dtype=np.int32)  # survivors of every level
+    length = np.zeros(games)
+    timeouts = 0
+
+    alive = np.arange(games)
+    for level, limit in enumerate(limits):
+        count = len(alive)
+        if count == 0:
+            break
+        is_mul = rng.random(count) < 0.5
+        response = (
+            np.where(is_mul, mul_median, add_median)
+            * skill[alive]
+            * np.exp(np.where(is_mul, mul_sigma, add_sigma) * rng.standard_normal(count))
+        )
+        timed_out = response >= limit
+        lost = timed_out | (rng.random(count) < np.where(is_mul, mul_error, add_error))
+
+        length[alive] += np.minimum(response, limit)
+        timeouts += int(timed_out.sum())
+        score[alive[lost]] = level
+        alive = alive[~lost]
+
+    scores = np.bincount(score, minlength=len(limits) + 1)
+    lengths = np.bincount((length / LENGTH_BIN).astype(np.int64))
+    return scores.tolist(), lengths.tolist(), timeouts
+
+
+def _simulate_python(limits, games, seed, model, skill_sigma):
+    rng = random.Random(seed)
+    ops = (model["add"], model["mul"])
+    scores = [0] * (len(limits) + 1)
+    lengths: list[int] = []
+    timeouts = 0
+
+    for _ in range(games):
+        skill = rng.lognormvariate(0.0, skill_sigma) if skill_sigma > 0 else 1.0
+        length = 0.0
+        score = len(limits)
+        for level, limit in enumerate(limits):
+            median, sigma, error = ops[rng.random() < 0.5]
+            response = median * skill * math.exp(sigma * rng.gauss(0.0, 1.0))
+            length += min(response, limit)
+            if response >= limit:
+                timeouts += 1
+                score = level
+                break
+            if rng.random() < error:
+                score = level
+                break
+        scores[score] += 1
+
+        index = int(length / LENGTH_BIN)
+        if index >= len(lengths):
+            lengths.extend([0] * (index + 1 - len(lengths)))
+        lengths[index] += 1
+
+    return scores, lengths, timeouts
+
+
+# --------------------------------------------------
+# Sweep
+# --------------------------------------------------
+def _add_counts(total: list[int], counts: list[int]) -> None:
+    if len(counts) > len(total):
+        total.extend([0] * (len(counts) - len(total)))
+    for index, count in enumerate(counts):
+        total[index] += count
+
+
+def _percentile(counts: list[int], p: float) -> int:
+    """Index (value) of the p-th percentile of a histogram."""
+    target = p / 100.0 * sum(counts)
+    running = 0
+    for index, count in enumerate(counts):
+        running += count
+        if running >= target and count:
+            return index
+    return len(counts) - 1
+
+
+def summarize(params: tuple, merged: dict) -> dict:
+    """Score and session length distribution of one parameter set."""
+    start, decay, min_limit = params
+    games, scores, lengths = merged["games"], merged["scores"], merged["lengths"]
+    return {
+        "start": start,
+        "decay": decay,
+        "min_limit": min_limit,
+        "games": games,
+        "mean_score": sum(score * count for score, count in enumerate(scores)) / games,
+        "score_p10": _percentile(scores, 10),
+        "score_p50": _percentile(scores, 50),
+        "score_p90": _percentile(scores, 90),
+        # Bin centres
+        "mean_length_s": sum((index + 0.5) * LENGTH_BIN * count for index, count in enumerate(lengths)) / games,
+        "length_p50_s": (_percentile(lengths, 50) + 0.5) * LENGTH_BIN,
+        "length_p90_s": (_percentile(lengths, 90) + 0.5) * LENGTH_BIN,
+        "timeout_share": merged["timeouts"] / games,
+        "cut_off": scores[MAX_LEVELS] / games if len(scores) > MAX_LEVELS else 0.0,
+        "score_counts": scores,
+    }
+
+
+def sweep(
+    starts: list[float],
+    decays: list[float],
+    min_limits: list[float],
+    games: int,
+    workers: int | None = None,
+    chunk: int = CHUNK,
+    seed: int = 0,
+    model: dict | None = None,
+    skill_sigma: float = SKILL_SIGMA,
+) -> list[dict]:
+    """Simulate `games` games for every parameter combination (on a process pool)."""
+    model = PLAYER_MODEL if model is None else model
+    grid = list(itertools.product(starts, decays, min_limits))
+
+    # Fixed seed per chunk: same result for any number of workers
+    seeds = random.Random(seed)
+    jobs = []
+    for params in grid:
+        for offset in range(0, games, chunk):
+            jobs.append((params, min(chunk, games - offset), seeds.getrandbits(64), model, skill_sigma))
+
+    merged = {params: {"games": 0, "scores": [], "lengths": [], "timeouts": 0} for params in grid}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for future in as_completed([pool.submit(simulate_chunk, job) for job in jobs]):
+            params, result = future.result()
+            total = merged[params]
+            total["games"] += result["games"]
+            total["timeouts"] += result["timeouts"]
+            _add_counts(total["scores"], result["scores"])
+            _add_counts(total["lengths"], result["lengths"])
+
+    return [summarize(params, merged[params]) for params in grid]
+
+
+def fit_model(path: Path) -> dict:
+    """PLAYER_MODEL fitted to an answer archive (types with too few answers keep the default)."""
+    from logic.answer_archive import load_records
+
+    records = load_records(path)
+    model = dict(PLAYER_MODEL)
+    for name, op in (("add", OP_ADD), ("mul", OP_MUL)):
+        # Timeouts are game overs, not answers: typed may hold a partial input
+        answered = records[(records["op"] == op) & (records["response"] < records["limit"])]
+        if len(answered) < 20:
+            continue
+        log_response = np.log(np.maximum(answered["response"].astype(float), 0.05))
+        model[name] = (
+            float(np.exp(np.median(log_response))),
+            float(log_response.std()),
+            float(1.0 - answered["correct"].mean()),
+        )
+    return model
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Monte Carlo tuner for the time limit constants")
+    parser.add_argument("--games", type=int, default=1_000_000, help="games per parameter combination")
+    parser.add_argument("--start", type=float, nargs="+", default=[START_TIME_LIMIT], help="START_TIME_LIMIT values")
+    parser.add_argument("--decay", type=float, nargs="+", default=[0.88, 0.90, TIME_DECAY, 0.94], help="TIME_DECAY values")
+    parser.add_argument("--min-limit", type=float, nargs="+", default=[1.0, MIN_TIME_LIMIT, 2.0], help="MIN_TIME_LIMIT values")
+    parser.add_argument("--workers", type=int, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk", type=int, default=CHUNK, help="games per work unit")
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed")
+    parser.add_argument("--archive", help="fit the player model to this answer archive (needs NumPy)")
+    parser.add_argument("--skill-sigma", type=float, help=f"player skill spread (default {SKILL_SIGMA}; 0 with --archive)")
+    parser.add_argument("--output", help="write all results (with score distributions) to this JSON file")
+    args = parser.parse_args()
+
+    model = PLAYER_MODEL
+    skill_sigma = SKILL_SIGMA if args.skill_sigma is None else args.skill_sigma
+    if args.archive:
+        if np is None:
+            parser.error("--archive needs NumPy")
+        model = fit_model(Path(args.archive))
+        # The fitted spread already includes the differences between players
+        skill_sigma = 0.0 if args.skill_sigma is None else args.skill_sigma
+    for name, (median, sigma, error) in model.items():
+        print(f"{name}: median {median:.2f}s, sigma {sigma:.2f}, wrong {error:.1%}")
+
+    started = time.perf_counter()
+    results = sweep(
+        args.start, args.decay, args.min_limit, args.games,
+        workers=args.workers, chunk=args.chunk, seed=args.seed, model=model, skill_sigma=skill_sigma,
+    )
+    elapsed = time.perf_counter() - started
+    total_games = args.games * len(results)
+    print(
+        f"{total_games} games in {elapsed:.1f}s ({total_games / elapsed:,.0f} games/s, "
+        f"{args.workers or os.cpu_count()} workers, {'numpy' if np is not None else 'pure Python'})"
+    )
+
+    print(f"{'start':>6} {'decay':>6} {'min':>5}  {'score mean':>10} {'p10':>4} {'p50':>4} {'p90':>4}"
+          f"  {'length mean':>11} {'p50':>6} {'p90':>6}  {'timeouts':>8}")
+    for row in results:
+        current = (row["start"], row["decay"], row["min_limit"]) == (START_TIME_LIMIT, TIME_DECAY, MIN_TIME_LIMIT)
+        print(
+            f"{row['start']:>6.2f} {row['decay']:>6.3f} {row['min_limit']:>5.2f}"
+            f"  {row['mean_score']:>10.2f} {row['score_p10']:>4} {row['score_p50']:>4} {row['score_p90']:>4}"
+            f"  {row['mean_length_s']:>10.1f}s {row['length_p50_s']:>5.1f}s {row['length_p90_s']:>5.1f}s"
+            f"  {row['timeout_share']:>8.1%}{'  <- current' if current else ''}"
+        )
+
+    if args.output:
+        Path(args.output).write_text(
+            json.dumps({"model": model, "skill_sigma": skill_sigma, "results": results}, indent=2),
+            encoding="utf-8",
+        )
+
+
+if __name__ == "__main__":
+    main()
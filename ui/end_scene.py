@@ -5,6 +5,7 @@ EndScene – shown when the game ends.
 Responsibilities:
 - Show final score
 - Show high score
+- Show rank and percentile among all sessions played
 - Allow restarting the game or returning to menu
 
 Very simple logic, easy to explain in defense.
@@ -14,27 +15,25 @@ import pygame
 
 from interfaces.scene import BaseScene
 from ui.widgets import Button
+from ui.fonts import get_font
 from core.constants import WIDTH, HEIGHT, COLOR_WHITE
-from logic.storage import load_highscore, save_highscore
+from logic.storage import highscore_store
+from logic.history import history_store
+from ui.text_cache import render_text
 
 
 class EndScene(BaseScene):
     """Game over screen."""
 
     def __init__(self, scene_manager, score: int):
+        super().__init__()
         self.scene_manager = scene_manager
-        self.score = score
-
-        # Load and update high score
-        self.highscore = load_highscore()
-        if self.score > self.highscore:
-            self.highscore = self.score
-            save_highscore(self.highscore)
 
         # Fonts
-        self.title_font = pygame.font.SysFont(None, 56)
-        self.text_font = pygame.font.SysFont(None, 32)
-        self.button_font = pygame.font.SysFont(None, 32)
+        self.title_font = get_font(56)
+        self.text_font = get_font(32)
+        self.button_font = get_font(32)
+        self.rank_font = get_font(24)
 
         # Buttons
         self.restart_button = Button(
@@ -49,47 +48,93 @@ class EndScene(BaseScene):
             self.button_font,
         )
 
-    def handle_event(self, event: pygame.event.Event) -> None:
-        if self.restart_button.is_clicked(event) or (event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN):
-            from ui.game_scene import GameScene
-            self.scene_manager.set_scene(GameScene(self.scene_manager))
+        self.reset(score)
+
+    def reset(self, score: int) -> None:
+        """Show the result of another game (the scene is reused)."""
+        self.score = score
+
+        # Update high score (cached; written in the background)
+        highscore_store.submit(self.score)
+        self.highscore = highscore_store.get()
+
+        # Leaderboard position (in-memory index, no history scan)
+        self.rank = history_store.rank(self.score)
+        self.percentile = history_store.percentile(self.score)
+        self.sessions = history_store.total()
+
+        # The texts are in the static layer
+        self.invalidate_static_layer()
 
-        if self.menu_button.is_clicked(event):
-            from ui.menu_scene import MenuScene
-            self.scene_manager.set_scene(MenuScene(self.scene_manager))
+    def event_handlers(self) -> dict:
+        return {
+            pygame.KEYDOWN: self.on_key,
+            pygame.MOUSEBUTTONDOWN: self.on_click,
+        }
 
-        # Always allow ESC to return to menu
-        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-            from ui.menu_scene import MenuScene
-            self.scene_manager.set_scene(MenuScene(self.scene_manager))
-            return
+    def on_key(self, event: pygame.event.Event) -> None:
+        if event.key == pygame.K_RETURN:
+            self.restart()
+        elif event.key == pygame.K_ESCAPE:
+            # Always allow ESC to return to menu
+            self.open_menu()
+
+    def on_click(self, event: pygame.event.Event) -> None:
+        if self.restart_button.is_clicked(event):
+            self.restart()
+        elif self.menu_button.is_clicked(event):
+            self.open_menu()
+
+    def restart(self) -> None:
+        self.scene_manager.switch("game")
+
+    def open_menu(self) -> None:
+        self.scene_manager.switch("menu")
 
     def update(self, dt: float) -> None:
         """No logic to update on end screen."""
         pass
 
+    def is_idle(self) -> bool:
+        """Static screen: redraw only after input."""
+        return True
+
     def draw(self, screen: pygame.Surface) -> None:
-        """Draw end screen UI."""
+        """Nothing dynamic: the whole end screen is in the static layer."""
+        pass
+
+    def draw_static(self, surface: pygame.Surface) -> None:
+        """Draw end screen UI (once, into the static layer)."""
 
         # Title
-        title_surface = self.title_font.render("GAME OVER", True, COLOR_WHITE)
+        title_surface = render_text(self.title_font, "GAME OVER", True, COLOR_WHITE)
         title_rect = title_surface.get_rect(center=(WIDTH // 2, 120))
-        screen.blit(title_surface, title_rect)
+        surface.blit(title_surface, title_rect)
 
         # Score
-        score_surface = self.text_font.render(
-            f"Your Score: {self.score}", True, COLOR_WHITE
+        score_surface = render_text(
+            self.text_font, f"Your Score: {self.score}", True, COLOR_WHITE
         )
         score_rect = score_surface.get_rect(center=(WIDTH // 2, 180))
-        screen.blit(score_surface, score_rect)
+        surface.blit(score_surface, score_rect)
 
         # High score
-        highscore_surface = self.text_font.render(
-            f"High Score: {self.highscore}", True, COLOR_WHITE
+        highscore_surface = render_text(
+            self.text_font, f"High Score: {self.highscore}", True, COLOR_WHITE
+        )
+        highscore_rect = highscore_surface.get_rect(center=(WIDTH // 2, 215))
+        surface.blit(highscore_surface, highscore_rect)
+
+        # Rank
+        rank_surface = render_text(
+            self.rank_font,
+            f"Rank #{self.rank} of {self.sessions}  (better than {self.percentile:.0f}%)",
+            True,
+            COLOR_WHITE,
         )
-        highscore_rect = highscore_surface.get_rect(center=(WIDTH // 2, 220))
-        screen.blit(highscore_surface, highscore_rect)
+        rank_rect = rank_surface.get_rect(center=(WIDTH // 2, 245))
+        surface.blit(rank_surface, rank_rect)
 
         # Buttons
-        self.restart_button.draw(screen)
-        self.menu_button.draw(screen)
+        self.restart_button.draw(surface)
+        self.menu_button.draw(surface)
@@ -0,0 +1,129 @@
+# ui/fonts.py
+"""
+Shared font registry.
+
+pygame.font.SysFont is slow:
+- every call creates a new Font object (the file is parsed again)
+- the FIRST call scans all system fonts (fontconfig on Linux)
+
+Scenes are rebuilt on every transition, so instead of calling SysFont
+they ask this module:
+
+    font = get_font(32)
+
+- Fonts are created once per process and then shared.
+- The default font (name=None) never needs the system font scan.
+- For named fonts, the result of the system font scan is saved to
+  FONT_CACHE_PATH and reused on the next start.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pygame
+import pygame.sysfont
+
+from core.registry import require
+
+# Persistent result of the system font scan
+FONT_CACHE_PATH = Path("data/fontcache.json")
+
+# (name, size, bold, italic) -> Font
+_fonts: dict[tuple, pygame.font.Font] = {}
+
+
+def get_font(size: int, name: str | None = None, bold: bool = False, italic: bool = False) -> pygame.font.Font:
+    """
+    Return a shared Font object.
+
+    name=None is pygame's default font (same as SysFont(None, size)).
+    """
+    key = (name, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = _create_font(size, name, bold, italic)
+    return font
+
+
+def clear_fonts() -> None:
+    """Forget the shared Font objects (they are invalid after pygame.quit)."""
+    _fonts.clear()
+
+
+def _create_font(size: int, name: str | None, bold: bool, italic: bool) -> pygame.font.Font:
+    require("font")
+
+    if name is None:
+        # Exactly what SysFont(None, ...) does, minus the system font scan
+        font = pygame.font.Font(None, size)
+        font.set_bold(bold)
+        font.set_italic(italic)
+        return font
+
+    load_system_fonts()
+    try:
+        return pygame.font.SysFont(name, size, bold, italic)
+    except OSError:
+        # A cached font file was removed: scan again and retry
+        load_system_fonts(refresh=True)
+        return pygame.font.SysFont(name, size, bold, italic)
+
+
+def load_system_fonts(refresh: bool = False) -> None:
+    """
+    Fill pygame's system font table, from FONT_CACHE_PATH if possible.
+
+    refresh=True ignores the cache and scans the system again.
+    Safe to call many times; it only does work once.
+    """
+    if pygame.sysfont.is_init and not refresh:
+        return
+
+    fonts = None if refresh else _read_cache()
+    if fonts is None:
+        fonts = _scan_system_fonts()
+        _write_cache(fonts)
+
+    pygame.sysfont.Sysfonts.clear()
+    pygame.sysfont.Sysalias.clear()
+    pygame.sysfont.Sysfonts.update(fonts)
+    pygame.sysfont.create_aliases()
+    pygame.sysfont.is_init = True
+
+
+def _scan_system_fonts() -> dict:
+    """Run pygame's (slow) platform font scan and return its table."""
+    pygame.sysfont.is_init = False
+    pygame.sysfont.Sysfonts.clear()
+    pygame.sysfont.initsysfonts()
+    return dict(pygame.sysfont.Sysfonts)
+
+
+def _read_cache() -> dict | None:
+    """Load the saved font table (None if missing / broken)."""
+    try:
+        with open(FONT_CACHE_PATH, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        return {
+            name: {(bool(bold), bool(italic)): path for bold, italic, path in styles}
+            for name, styles in data.items()
+        }
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _write_cache(fonts: dict) -> None:
+    """Save the font table. JSON has no tuple keys, so styles become lists."""
+    data = {
+        name: [[bold, italic, path] for (bold, italic), path in styles.items()]
+        for name, styles in fonts.items()
+    }
+    try:
+        FONT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(FONT_CACHE_PATH, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+    except OSError:
+        # Only a cache: the game works without it
+        pass
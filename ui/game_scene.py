@@ -9,6 +9,9 @@ This scene is responsible for:
 - Increasing difficulty (less time each level)
 - Switching to EndScene when time is up
 
+The rules themselves (levels, score, time limits, game over) are in
+logic/game_state.py; this scene shows the state and feeds it the keys.
+
 This file is the MOST IMPORTANT one for your defense,
 so everything here is written in the simplest possible way.
 """
@@ -16,19 +19,27 @@ so everything here is written in the simplest possible way.
 import pygame
 
 from interfaces.scene import BaseScene
-from logic.questions import MixedQuestion
-from logic.difficulty import next_time_limit
+from logic.answer_archive import answer_archive
+from logic.history import history_store
+from logic.seen_questions import default_index as seen_questions
+from logic.game_state import CORRECT, TIMEOUT, WRONG, Answer, GameState
+from logic.questions import OP_ADD, OP_MUL
 from core.constants import (
     WIDTH,
     HEIGHT,
     START_TIME_LIMIT,
+    TICK_INTERVAL_MS,
+    FLASH_INTERVAL_MS,
     COLOR_WHITE,
     COLOR_WARNING,
 )
 from core.events import TICK_EVENT, TIME_UP_EVENT, FLASH_EVENT
+from core.scheduler import Timer, post_event, scheduler
+from core.telemetry import RESPONSE_BUCKETS, telemetry
 from ui.sprites import Player, QuestionSprite
 from ui.widgets import InputBox
-from ui.end_scene import EndScene
+from ui.fonts import get_font
+from ui.text_cache import render_text
 
 
 
@@ -36,22 +47,12 @@ class GameScene(BaseScene):
     """Main game scene: timed math questions."""
 
     def __init__(self, scene_manager):
+        super().__init__()
         self.scene_manager = scene_manager
 
         # Fonts
-        self.question_font = pygame.font.SysFont(None, 48)
-        self.info_font = pygame.font.SysFont(None, 28)
-
-        # Game state
-        self.level: int = 1
-        self.score: int = 0
-
-        # Time handling
-        self.time_limit: float = START_TIME_LIMIT
-        self.time_left: float = self.time_limit
-
-        # Current question
-        self.question = MixedQuestion()
+        self.question_font = get_font(48)
+        self.info_font = get_font(28)
 
         # Input box for answer
         self.input_box = InputBox(
@@ -60,52 +61,117 @@ class GameScene(BaseScene):
         )
 
         # Sprites: player and question rendered as sprites
-        self.sprites = pygame.sprite.Group()
+        # (dirty-tracking layer, drawn by BaseScene.render)
+        self.sprite_layer = self.new_sprite_layer()
         # Player on the left side
         self.player_sprite = Player((80, HEIGHT // 2))
-        self.sprites.add(self.player_sprite)
+        self.sprite_layer.add(self.player_sprite)
 
         # Question rendered as a sprite (centered above input)
-        self.question_sprite = QuestionSprite(self.question.text, self.question_font, (WIDTH // 2, HEIGHT // 2 - 40))
-        self.sprites.add(self.question_sprite)
+        self.question_sprite = QuestionSprite("", self.question_font, (WIDTH // 2, HEIGHT // 2 - 40))
+        self.sprite_layer.add(self.question_sprite)
+
+        # Top strip with level/score and timer (redrawn on every tick)
+        self.hud_rect = pygame.Rect(0, 0, WIDTH, 50)
+
+        # Response time histograms: (op, result) -> Histogram
+        self.response_histograms = {
+            (op, result): telemetry.histogram(
+                "math_game_response_seconds",
+                "Time from showing a question to checking the answer",
+                RESPONSE_BUCKETS,
+                op=op_name,
+                result=result,
+            )
+            for op, op_name in ((OP_ADD, "add"), (OP_MUL, "mul"))
+            for result in (CORRECT, WRONG, TIMEOUT)
+        }
+
+        # Game rules (level, score, time limit, question)
+        self.state = GameState(seen_questions.next_question)
+
+        # Timer of the current question's deadline (set in on_enter)
+        self.deadline: Timer | None = None
+
+        # GameState already drew the first question
+        self.show_question()
+
+    def reset(self) -> None:
+        """Start a new game (the scene is reused for every restart)."""
+        self.state.reset()
+        self.deadline = None
+        self.show_question()
+
+        if self.player_sprite.flashing:
+            self.player_sprite.toggle_flash()
+
+    @property
+    def question(self):
+        return self.state.question
+
+    def on_enter(self) -> None:
+        super().on_enter()
+        self.state.start(scheduler.now())
+        self.deadline = self.at(self.state.deadline, post_event(TIME_UP_EVENT))
+
+        # HUD refresh and player blink
+        self.every(TICK_INTERVAL_MS / 1000.0, post_event(TICK_EVENT))
+        self.every(FLASH_INTERVAL_MS / 1000.0, post_event(FLASH_EVENT))
 
     # --------------------------------------------------
     # Event handling
     # --------------------------------------------------
-    def handle_event(self, event: pygame.event.Event) -> None:
+    def event_handlers(self) -> dict:
         """
         Handle:
         - keyboard input
         - custom timer events
         """
-
+        return {
+            pygame.KEYDOWN: self.on_key,
+            TICK_EVENT: self.on_tick,
+            FLASH_EVENT: self.on_flash,
+            TIME_UP_EVENT: self.on_time_up,
+        }
+
+    def on_key(self, event: pygame.event.Event) -> None:
         # Always allow ESC to return to menu
-        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-            from ui.menu_scene import MenuScene
-            self.scene_manager.set_scene(MenuScene(self.scene_manager))
+        if event.key == pygame.K_ESCAPE:
+            self.open_menu()
             return
 
-        # Handle text input
-        self.input_box.handle_event(event)
+        # Handle text input (answer is checked on every digit)
+        if self.input_box.handle_event(event):
+            self.mark_dirty(self.input_box.rect)
+            answer = self.state.check_prefix(self.input_box.value, len(self.input_box.text), scheduler.now())
+            # A typo is shown in the warning color until it is fixed
+            self.input_box.error = self.state.wrong_prefix
+            if answer is not None:
+                self.on_answer(answer)
 
         # When ENTER is pressed -> submit answer
-        if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-            self.check_answer()
+        if event.key == pygame.K_RETURN:
+            answer = self.state.submit(self.input_box.value, len(self.input_box.text), scheduler.now())
+            if answer is not None:
+                self.on_answer(answer)
 
-        # Custom event: timer tick
-        if event.type == TICK_EVENT:
-            self.time_left -= 0.1
+    def on_tick(self, event: pygame.event.Event) -> None:
+        # Only the display: time_left is computed from the deadline
+        self.mark_dirty(self.hud_rect)
 
-            if self.time_left <= 0:
-                pygame.event.post(pygame.event.Event(TIME_UP_EVENT))
+    def on_flash(self, event: pygame.event.Event) -> None:
+        # Toggle player blink (the sprite layer redraws only the player)
+        self.player_sprite.toggle_flash()
 
-        # Custom event: flash (toggle player blink)
-        if event.type == FLASH_EVENT:
-            self.player_sprite.toggle_flash()
+    def on_time_up(self, event: pygame.event.Event) -> None:
+        # None = stale event of a question that was answered meanwhile
+        answer = self.state.expire(scheduler.now(), self.input_box.value, len(self.input_box.text))
+        if answer is not None:
+            self.record_answer(answer)
+            self.game_over()
 
-        # Custom event: time is up
-        if event.type == TIME_UP_EVENT:
-            self.scene_manager.set_scene(EndScene(self.scene_manager, self.score))
+    def open_menu(self) -> None:
+        self.scene_manager.switch("menu")
 
     # --------------------------------------------------
     # Game logic
@@ -115,46 +181,80 @@ class GameScene(BaseScene):
         Game logic update.
 
         dt is not strictly needed here because
-        we use TICK_EVENT for timing,
+        timing uses scheduler deadlines,
         but it is kept for consistency.
         """
         # update sprites (if they have animations / state)
-        self.sprites.update(dt)
-
-    def check_answer(self) -> None:
-        """Check user answer and move to next level if correct."""
-        if self.question.is_correct(self.input_box.text):
-            self.score += 1
-            self.level += 1
-
-            # Make next level faster
-            self.time_limit = next_time_limit(self.time_limit)
-            self.time_left = self.time_limit
-
-            # New question
-            self.question = MixedQuestion()
-            # update question sprite text
-            self.question_sprite.set_text(self.question.text)
-            self.input_box.clear()
-        else:
+        self.sprite_layer.update(dt)
+
+    def on_answer(self, answer: Answer) -> None:
+        """An answer was checked: next question, or game over."""
+        self.record_answer(answer)
+
+        if self.state.over:
             # Wrong answer = game over
-            self.scene_manager.set_scene(EndScene(self.scene_manager, self.score))
+            self.game_over()
+            return
+
+        # Correct: new question with a new (shorter) deadline
+        self.deadline.cancel()
+        self.deadline = self.at(self.state.deadline, post_event(TIME_UP_EVENT))
+        self.show_question()
+
+        # Question, input and HUD all changed
+        self.mark_dirty()
+
+    def show_question(self) -> None:
+        """Show the current question with an empty input box."""
+        self.question_sprite.set_text(self.state.question.text)
+        self.input_box.clear()
+
+    @property
+    def time_left(self) -> float:
+        """Exact seconds left for the current question."""
+        return self.state.time_left(scheduler.now())
+
+    def record_answer(self, answer: Answer) -> None:
+        """Record the outcome of a question (answer archive + telemetry)."""
+        question = answer.question
+        answer_archive.append(
+            question.op,
+            question.a,
+            question.b,
+            answer.typed,
+            answer.correct,
+            answer.response,
+            answer.time_limit,
+        )
+        self.response_histograms[question.op, answer.result].observe(answer.response)
+
+    def game_over(self) -> None:
+        """Remember seen questions, record the session and show the end screen."""
+        state = self.state
+        seen_questions.save()
+        answer_archive.flush()
+        history_store.record(
+            state.score, state.level, START_TIME_LIMIT, state.time_limit, state.started_at
+        )
+        self.scene_manager.switch("end", score=state.score)
 
     # --------------------------------------------------
     # Drawing
     # --------------------------------------------------
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw game UI."""
+    def draw_static(self, surface: pygame.Surface) -> None:
+        """Input box frame never changes, only its text."""
+        self.input_box.draw_frame(surface)
 
-        # Sprites (player, question)
-        self.sprites.draw(screen)
+    def draw(self, screen: pygame.Surface) -> None:
+        """Draw game UI (sprites are drawn by the sprite layer)."""
 
-        # Input box
-        self.input_box.draw(screen)
+        # Input box text (frame is in the static layer)
+        self.input_box.draw_text(screen)
 
         # Level and score
-        level_text = self.info_font.render(
-            f"Level: {self.level}   Score: {self.score}",
+        level_text = render_text(
+            self.info_font,
+            f"Level: {self.state.level}   Score: {self.state.score}",
             True,
             COLOR_WHITE,
         )
@@ -162,7 +262,8 @@ class GameScene(BaseScene):
 
         # Timer (turns red when low)
         timer_color = COLOR_WARNING if self.time_left < 2 else COLOR_WHITE
-        timer_text = self.info_font.render(
+        timer_text = render_text(
+            self.info_font,
             f"Time left: {self.time_left:.1f}s",
             True,
             timer_color,
@@ -0,0 +1,70 @@
+# ui/loading_scene.py
+"""
+LoadingScene – first screen while assets load in the background.
+
+Responsibilities:
+- Show something IMMEDIATELY after the window opens
+- Show loading progress of the AssetLoader
+- Switch to MenuScene when loading is finished
+
+It never waits for the loader; it only reads its progress.
+"""
+
+import pygame
+
+from interfaces.scene import BaseScene
+from core.constants import WIDTH, HEIGHT, COLOR_WHITE, COLOR_BUTTON, COLOR_BUTTON_BORDER
+from ui.fonts import get_font
+from ui.text_cache import render_text
+
+
+class LoadingScene(BaseScene):
+    """Loading screen with a progress bar."""
+
+    def __init__(self, scene_manager, loader):
+        super().__init__()
+        self.scene_manager = scene_manager
+        self.loader = loader
+
+        # Fonts
+        self.title_font = get_font(64)
+        self.text_font = get_font(28)
+
+        # Progress bar
+        self.bar_rect = pygame.Rect(WIDTH // 2 - 150, HEIGHT // 2, 300, 24)
+        self.status_rect = pygame.Rect(0, self.bar_rect.bottom + 10, WIDTH, 30)
+        self.shown_progress: float = -1.0
+
+    def event_handlers(self) -> dict:
+        """Input is ignored while loading."""
+        return {}
+
+    def update(self, dt: float) -> None:
+        if self.loader.done.is_set():
+            self.scene_manager.switch("menu")
+            return
+
+        # Redraw the bar only when progress changed
+        if self.loader.progress != self.shown_progress:
+            self.shown_progress = self.loader.progress
+            self.mark_dirty(self.bar_rect)
+            self.mark_dirty(self.status_rect)
+
+    def draw_static(self, surface: pygame.Surface) -> None:
+        """Title and empty progress bar."""
+        title_surface = render_text(self.title_font, "Math Escape Game", True, COLOR_WHITE)
+        surface.blit(title_surface, title_surface.get_rect(center=(WIDTH // 2, 120)))
+
+        pygame.draw.rect(surface, COLOR_BUTTON, self.bar_rect, border_radius=6)
+        pygame.draw.rect(surface, COLOR_BUTTON_BORDER, self.bar_rect, width=2, border_radius=6)
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """Filled part of the bar and current step."""
+        progress = max(self.shown_progress, 0.0)
+        if progress > 0:
+            fill = self.bar_rect.inflate(-6, -6)
+            fill.width = int(fill.width * progress)
+            pygame.draw.rect(screen, COLOR_WHITE, fill, border_radius=4)
+
+        status_surface = render_text(self.text_font, f"Loading {self.loader.status}...", True, COLOR_WHITE)
+        screen.blit(status_surface, status_surface.get_rect(center=self.status_rect.center))
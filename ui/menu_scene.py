@@ -14,18 +14,21 @@ import pygame
 
 from interfaces.scene import BaseScene
 from ui.widgets import Button
+from ui.fonts import get_font
 from core.constants import WIDTH, HEIGHT, COLOR_WHITE
+from ui.text_cache import render_text
 
 
 class MenuScene(BaseScene):
     """Main menu scene."""
 
     def __init__(self, scene_manager):
+        super().__init__()
         self.scene_manager = scene_manager
 
         # Fonts
-        self.title_font = pygame.font.SysFont(None, 64)
-        self.button_font = pygame.font.SysFont(None, 36)
+        self.title_font = get_font(64)
+        self.button_font = get_font(36)
 
         # Buttons
         self.start_button = Button(
@@ -40,34 +43,51 @@ class MenuScene(BaseScene):
             self.button_font,
         )
 
-    def handle_event(self, event: pygame.event.Event) -> None:
-        if self.start_button.is_clicked(event) or (event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN):
-            from ui.game_scene import GameScene
-            self.scene_manager.set_scene(GameScene(self.scene_manager))
+    def event_handlers(self) -> dict:
+        return {
+            pygame.KEYDOWN: self.on_key,
+            pygame.MOUSEBUTTONDOWN: self.on_click,
+        }
 
-        if self.quit_button.is_clicked(event) or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
-            pygame.event.post(pygame.event.Event(pygame.QUIT))
+    def on_key(self, event: pygame.event.Event) -> None:
+        if event.key == pygame.K_RETURN:
+            self.start_game()
+        elif event.key == pygame.K_ESCAPE:
+            self.quit_game()
 
-        # Always allow ESC to return to menu
-        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-            from ui.menu_scene import MenuScene
-            self.scene_manager.set_scene(MenuScene(self.scene_manager))
-            return
+    def on_click(self, event: pygame.event.Event) -> None:
+        if self.start_button.is_clicked(event):
+            self.start_game()
+        elif self.quit_button.is_clicked(event):
+            self.quit_game()
 
+    def start_game(self) -> None:
+        self.scene_manager.switch("game")
+
+    def quit_game(self) -> None:
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
 
     def update(self, dt: float) -> None:
         """Menu has no logic to update."""
         pass
 
+    def is_idle(self) -> bool:
+        """Static screen: redraw only after input."""
+        return True
+
     def draw(self, screen: pygame.Surface) -> None:
-        """Draw menu UI."""
+        """Nothing dynamic: the whole menu is in the static layer."""
+        pass
+
+    def draw_static(self, surface: pygame.Surface) -> None:
+        """Draw menu UI (once, into the static layer)."""
         # Title
-        title_surface = self.title_font.render(
-            "Math Escape Game", True, COLOR_WHITE
+        title_surface = render_text(
+            self.title_font, "Math Escape Game", True, COLOR_WHITE
         )
         title_rect = title_surface.get_rect(center=(WIDTH // 2, 120))
-        screen.blit(title_surface, title_rect)
+        surface.blit(title_surface, title_rect)
 
         # Buttons
-        self.start_button.draw(screen)
-        self.quit_button.draw(screen)
+        self.start_button.draw(surface)
+        self.quit_button.draw(surface)
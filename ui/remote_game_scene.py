@@ -0,0 +1,261 @@
+# ui/remote_game_scene.py
+"""
+RemoteGameScene – the game played on a game server (net/server.py).
+
+Looks like GameScene, but has NO rules: the server runs the GameState.
+This scene only
+- sends what is typed (after every key, and ENTER)
+- shows the question, level, score and time the server sends
+- counts the time down between two messages (the server decides
+  when it is up)
+
+Connecting happens on a helper thread ("Connecting..." is shown
+meanwhile), so an unreachable server never blocks the frame loop.
+
+A finished game is recorded in the local session history (end screen
+rank / percentile) like a local one. Its answers are NOT added to the
+answer archive (logic/answer_archive.py, the tuner's fit data): the
+client does not see the operands, and its response times would include
+the network delay.
+
+Started by `python main.py --connect host:port`, which registers this
+scene as "game": menu and end screen stay the same.
+"""
+
+import threading
+import time
+
+import pygame
+
+from interfaces.scene import BaseScene
+from core.constants import (
+    WIDTH,
+    HEIGHT,
+    START_TIME_LIMIT,
+    TICK_INTERVAL_MS,
+    FLASH_INTERVAL_MS,
+    COLOR_WHITE,
+    COLOR_WARNING,
+)
+from core.events import NET_EVENT, TICK_EVENT, FLASH_EVENT
+from core.scheduler import post_event
+from logic.history import history_store
+from net import protocol
+from net.client import Connection
+from ui.sprites import Player, QuestionSprite
+from ui.widgets import InputBox
+from ui.fonts import get_font
+from ui.text_cache import render_text
+
+# Client-side message (not part of the protocol): connecting failed
+UNREACHABLE = "unreachable"
+
+
+class RemoteGameScene(BaseScene):
+    """Game scene of a network client."""
+
+    def __init__(self, scene_manager, address: tuple[str, int] = (protocol.DEFAULT_HOST, protocol.DEFAULT_PORT)):
+        super().__init__()
+        self.scene_manager = scene_manager
+        self.address = address
+        self.connection: Connection | None = None
+
+        # Messages of an earlier visit (old connection) are ignored.
+        # _lock: the connecting thread hands over the connection
+        self.visit: int = 0
+        self._lock = threading.Lock()
+
+        # Fonts
+        self.question_font = get_font(48)
+        self.info_font = get_font(28)
+        self.status_font = get_font(20)
+
+        # Input box for answer
+        self.input_box = InputBox(
+            pygame.Rect(WIDTH // 2 - 80, HEIGHT // 2 + 40, 160, 40),
+            self.info_font,
+        )
+
+        # Sprites: the same as in GameScene
+        self.sprite_layer = self.new_sprite_layer()
+        self.player_sprite = Player((80, HEIGHT // 2))
+        self.sprite_layer.add(self.player_sprite)
+        self.question_sprite = QuestionSprite("", self.question_font, (WIDTH // 2, HEIGHT // 2 - 40))
+        self.sprite_layer.add(self.question_sprite)
+
+        # Top strip with level/score and timer
+        self.hud_rect = pygame.Rect(0, 0, WIDTH, 50)
+
+        self.reset()
+
+    def reset(self) -> None:
+        """Nothing known until the server sends the first question."""
+        self.level: int = 1
+        self.score: int = 0
+        self.time_limit: float = START_TIME_LIMIT
+
+        # Local estimate of the server's deadline (perf_counter; None = no question)
+        self.deadline: float | None = None
+
+        # Connection problem shown under the input box ("" = none)
+        self.status: str = ""
+
+        # Wall clock of the game's first question (session history)
+        self.started_at: float | None = None
+
+        self.question_sprite.set_text("Connecting...")
+        self.input_box.clear()
+
+        if self.player_sprite.flashing:
+            self.player_sprite.toggle_flash()
+
+    def on_enter(self) -> None:
+        super().on_enter()
+        self.every(TICK_INTERVAL_MS / 1000.0, post_event(TICK_EVENT))
+        self.every(FLASH_INTERVAL_MS / 1000.0, post_event(FLASH_EVENT))
+
+        with self._lock:
+            self.visit += 1
+        threading.Thread(target=self._connect, args=(self.visit,), name="net-connect", daemon=True).start()
+
+    def on_exit(self) -> None:
+        with self._lock:
+            self.visit += 1  # a connection still being made is closed at once
+            connection, self.connection = self.connection, None
+        if connection is not None:
+            connection.close()
+
+    def _connect(self, visit: int) -> None:
+        """Connecting thread: connect, then start a game (if the scene is still shown)."""
+        post = self._poster(visit)
+        try:
+            connection = Connection(self.address, post)
+        except OSError as error:
+            post({"type": UNREACHABLE, "message": str(error)})
+            return
+
+        with self._lock:
+            current = visit == self.visit
+            if current:
+                self.connection = connection
+        if not current:
+            connection.close()
+            return
+        connection.send({"type": protocol.START})
+
+    @staticmethod
+    def _poster(visit: int):
+        """Message callback (reader thread): hand the message to the game loop."""
+
+        def post(message: dict) -> None:
+            pygame.event.post(pygame.event.Event(NET_EVENT, message=message, visit=visit))
+
+        return post
+
+    # --------------------------------------------------
+    # Event handling
+    # --------------------------------------------------
+    def event_handlers(self) -> dict:
+        return {
+            pygame.KEYDOWN: self.on_key,
+            NET_EVENT: self.on_message,
+            TICK_EVENT: self.on_tick,
+            FLASH_EVENT: self.on_flash,
+        }
+
+    def on_key(self, event: pygame.event.Event) -> None:
+        # Always allow ESC to return to menu
+        if event.key == pygame.K_ESCAPE:
+            self.scene_manager.switch("menu")
+            return
+
+        if self.deadline is None:
+            return  # no question yet
+
+        # The server checks the answer on every digit
+        if self.input_box.handle_event(event):
+            self.mark_dirty(self.input_box.rect)
+            self.connection.send({"type": protocol.INPUT, "text": self.input_box.text})
+
+        if event.key == pygame.K_RETURN:
+            self.connection.send({"type": protocol.SUBMIT, "text": self.input_box.text})
+
+    def on_message(self, event: pygame.event.Event) -> None:
+        if event.visit != self.visit:
+            return
+        message = event.message
+        kind = message["type"]
+
+        if kind == protocol.QUESTION:
+            self.level = message["level"]
+            self.score = message["score"]
+            self.time_limit = message["time_limit"]
+            self.deadline = time.perf_counter() + message["time_left"]
+            if self.started_at is None:
+                self.started_at = time.time()
+            self.question_sprite.set_text(message["text"])
+            self.input_box.clear()
+            self.mark_dirty()
+        elif kind == protocol.OVER:
+            self.deadline = None
+            started_at = self.started_at if self.started_at is not None else time.time()
+            history_store.record(message["score"], message["level"], START_TIME_LIMIT, self.time_limit, started_at)
+            self.scene_manager.switch("end", score=message["score"])
+        elif kind == UNREACHABLE:
+            self.question_sprite.set_text("No server (ESC)")
+            self.show_status(f"{self.address[0]}:{self.address[1]} not reachable: {message['message']}")
+        elif kind == protocol.ERROR and message.get("lost"):
+            # Other errors are keys that crossed the game over on the way
+            self.deadline = None
+            self.question_sprite.set_text("Disconnected (ESC)")
+            self.show_status(message["message"])
+
+    def show_status(self, text: str) -> None:
+        self.status = text
+        self.mark_dirty()
+
+    def on_tick(self, event: pygame.event.Event) -> None:
+        self.mark_dirty(self.hud_rect)
+
+    def on_flash(self, event: pygame.event.Event) -> None:
+        self.player_sprite.toggle_flash()
+
+    # --------------------------------------------------
+    # Update / drawing
+    # --------------------------------------------------
+    @property
+    def time_left(self) -> float:
+        """Seconds left for the current question (estimate; the server decides)."""
+        if self.deadline is None:
+            return self.time_limit
+        return max(self.deadline - time.perf_counter(), 0.0)
+
+    def update(self, dt: float) -> None:
+        self.sprite_layer.update(dt)
+
+    def draw_static(self, surface: pygame.Surface) -> None:
+        self.input_box.draw_frame(surface)
+
+    def draw(self, screen: pygame.Surface) -> None:
+        self.input_box.draw_text(screen)
+
+        level_text = render_text(
+            self.info_font,
+            f"Level: {self.level}   Score: {self.score}",
+            True,
+            COLOR_WHITE,
+        )
+        screen.blit(level_text, (20, 20))
+
+        timer_color = COLOR_WARNING if self.time_left < 2 else COLOR_WHITE
+        timer_text = render_text(
+            self.info_font,
+            f"Time left: {self.time_left:.1f}s",
+            True,
+            timer_color,
+        )
+        screen.blit(timer_text, timer_text.get_rect(topright=(WIDTH - 20, 20)))
+
+        if self.status:
+            status_text = render_text(self.status_font, self.status, True, COLOR_WARNING)
+            screen.blit(status_text, status_text.get_rect(midtop=(WIDTH // 2, self.input_box.rect.bottom + 20)))
@@ -5,14 +5,21 @@ Simple sprite classes for the game.
 - Player: visual representation of the player (blinks on FLASH_EVENT)
 - QuestionSprite: renders the current question as a sprite (keeps image/rect)
 
-Both inherit from pygame.sprite.Sprite so they work with Groups.
+Both are DirtySprites for a LayeredDirty group (BaseScene.sprite_layer):
+they never draw into their image. Every frame is pre-rendered in the
+display pixel format, and a change only swaps `image` and sets
+`dirty = 1`, so only changed sprites are redrawn.
 """
 
 import pygame
 from core.constants import COLOR_PLAYER, COLOR_WHITE
+from ui.text_cache import render_text
 
 
-class Player(pygame.sprite.Sprite):
+class Player(pygame.sprite.DirtySprite):
+    # (size, color) -> pre-rendered frame, shared by all players
+    _frames: dict[tuple, pygame.Surface] = {}
+
     def __init__(self, pos: tuple[int, int]):
         super().__init__()
         self.size = (48, 48)
@@ -20,38 +27,50 @@ class Player(pygame.sprite.Sprite):
         self.flash_color = (255, 255, 255)
         self.flashing = False
 
-        self.image = pygame.Surface(self.size, pygame.SRCALPHA)
+        # Both blink states, rendered once
+        self.frames = (self._frame(self.base_color), self._frame(self.flash_color))
+        self.image = self.frames[0]
         self.rect = self.image.get_rect(center=pos)
-        self._render()
 
-    def _render(self) -> None:
-        color = self.flash_color if self.flashing else self.base_color
-        self.image.fill(color)
+    def _frame(self, color) -> pygame.Surface:
+        key = (self.size, tuple(color))
+        frame = Player._frames.get(key)
+        if frame is None:
+            # Opaque square in display format: the fastest blit there is
+            # (no display surface with the texture renderer: default format)
+            frame = pygame.Surface(self.size)
+            if pygame.display.get_surface() is not None:
+                frame = frame.convert()
+            frame.fill(color)
+            Player._frames[key] = frame
+        return frame
 
     def toggle_flash(self) -> None:
         self.flashing = not self.flashing
-        self._render()
+        self.image = self.frames[self.flashing]
+        self.dirty = 1
 
     def update(self, *args) -> None:
         # Nothing dynamic for now; state changes via toggle_flash
         pass
 
 
-class QuestionSprite(pygame.sprite.Sprite):
+class QuestionSprite(pygame.sprite.DirtySprite):
     def __init__(self, text: str, font: pygame.font.Font, pos: tuple[int, int]):
         super().__init__()
         self.font = font
         self.text = text
         self.color = COLOR_WHITE
 
-        # initial render
-        self.image = self.font.render(self.text, True, self.color)
+        # Frames come from the shared text cache (already in display format)
+        self.image = render_text(self.font, self.text, True, self.color)
         self.rect = self.image.get_rect(center=pos)
 
     def set_text(self, text: str) -> None:
         self.text = text
-        self.image = self.font.render(self.text, True, self.color)
+        self.image = render_text(self.font, self.text, True, self.color)
         self.rect = self.image.get_rect(center=self.rect.center)
+        self.dirty = 1
 
     def update(self, *args) -> None:
         # Question changes are applied explicitly via set_text
@@ -0,0 +1,75 @@
+# ui/text_cache.py
+"""
+LRU cache of rendered text surfaces.
+
+font.render() rasterises the text every time it is called, and most
+texts on screen ("START GAME", "Level: 3   Score: 2", ...) stay the
+same for many frames. render_text() returns the same Surface again as
+long as font, text, antialias and color are the same.
+
+Cached surfaces are converted to the display pixel format (when a
+window exists), so blitting them needs no per-pixel conversion.
+
+The returned surfaces are SHARED: blit them, never draw on them.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import pygame
+
+
+class TextCache:
+    """Bounded LRU cache: (font, text, antialias, color) -> Surface."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+        # Counters
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def render(self, font: pygame.font.Font, text: str, antialias: bool, color) -> pygame.Surface:
+        """Same as font.render(text, antialias, color), but cached."""
+        key = (font, text, antialias, tuple(color))
+        surface = self._surfaces.get(key)
+
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        self._surfaces[key] = surface
+
+        if len(self._surfaces) > self.maxsize:
+            self._surfaces.popitem(last=False)  # least recently used
+            self.evictions += 1
+        return surface
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._surfaces),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+# Shared by all widgets and scenes
+text_cache = TextCache()
+
+
+def render_text(font: pygame.font.Font, text: str, antialias: bool, color) -> pygame.Surface:
+    """Render text through the shared cache."""
+    return text_cache.render(font, text, antialias, color)
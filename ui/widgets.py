@@ -11,7 +11,8 @@ No animations, no sounds, no tricks.
 """
 
 import pygame
-from core.constants import COLOR_BUTTON, COLOR_BUTTON_BORDER, COLOR_WHITE
+from core.constants import COLOR_BUTTON, COLOR_BUTTON_BORDER, COLOR_WARNING, COLOR_WHITE
+from ui.text_cache import render_text
 
 
 class Button:
@@ -45,7 +46,7 @@ class Button:
             screen, COLOR_BUTTON_BORDER, self.rect, width=2, border_radius=8
         )
 
-        text_surface = self.font.render(self.text, True, COLOR_WHITE)
+        text_surface = render_text(self.font, self.text, True, COLOR_WHITE)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
 
@@ -58,32 +59,54 @@ class InputBox:
     - Accepts digits only
     - Backspace deletes
     - Enter submits (handled by the scene)
+
+    Besides the text, the box keeps the typed number as a running
+    integer (value), so answers can be checked without parsing.
+    `error` (set by the scene) draws the text in the warning color.
     """
 
     def __init__(self, rect: pygame.Rect, font: pygame.font.Font):
         self.rect = rect
         self.font = font
         self.text: str = ""
+        self.value: int = 0
+        self.error: bool = False
 
-    def handle_event(self, event: pygame.event.Event) -> None:
-        """Handle keyboard input."""
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """Handle keyboard input. Returns True if the text changed."""
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_BACKSPACE:
-                self.text = self.text[:-1]
+                if self.text:
+                    self.text = self.text[:-1]
+                    self.value //= 10
+                    return True
             elif event.unicode.isdigit() and len(self.text) < 13:
                 self.text += event.unicode
+                self.value = self.value * 10 + int(event.unicode)
+                return True
+        return False
 
     def clear(self) -> None:
         """Clear the input box."""
         self.text = ""
+        self.value = 0
+        self.error = False
 
     def draw(self, screen: pygame.Surface) -> None:
         """Draw the input box and current text."""
+        self.draw_frame(screen)
+        self.draw_text(screen)
+
+    def draw_frame(self, screen: pygame.Surface) -> None:
+        """Draw only the box (static part)."""
         pygame.draw.rect(screen, COLOR_BUTTON, self.rect, border_radius=6)
         pygame.draw.rect(
             screen, COLOR_BUTTON_BORDER, self.rect, width=2, border_radius=6
         )
 
-        text_surface = self.font.render(self.text, True, COLOR_WHITE)
+    def draw_text(self, screen: pygame.Surface) -> None:
+        """Draw only the current text (dynamic part)."""
+        color = COLOR_WARNING if self.error else COLOR_WHITE
+        text_surface = render_text(self.font, self.text, True, color)
         text_rect = text_surface.get_rect(midleft=(self.rect.x + 10, self.rect.centery))
         screen.blit(text_surface, text_rect)